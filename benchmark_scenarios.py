@@ -0,0 +1,83 @@
+"""
+Benchmark the search engine on a fixed, seeded corpus of constrained scenarios.
+Each scenario is searched from the player's side; the report gives completed
+depth, nodes and time per scenario kind. With --value-net the learned evaluator
+searches the same positions and the share of identical moves is reported.
+
+    python benchmark_scenarios.py --per-spec 20 --budget-ms 100
+    python benchmark_scenarios.py --save-corpus corpus.jsonl
+    python benchmark_scenarios.py --corpus corpus.jsonl --value-net
+"""
+
+import argparse
+from collections import defaultdict
+
+from lib.scenarios import BENCHMARK_SPECS, build_corpus, get_spec, load_corpus, save_corpus
+from lib.search import SearchEngine, move_signature
+
+
+def run_search(engine, scenarios, budget_ms):
+    """(move signature, stats) per scenario"""
+    results = []
+    for scenario in scenarios:
+        own_hand, opp_hand, own_hp, opp_hp, last_combo = scenario.position()
+        engine.clear()
+        move, stats = engine.search(own_hand, opp_hand, own_hp, opp_hp, last_combo, budget_ms=budget_ms)
+        results.append((move_signature(move), stats))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search benchmarks on generated scenarios")
+    parser.add_argument("--per-spec", type=int, default=20, help="Scenarios per kind")
+    parser.add_argument("--specs", nargs="*", choices=[spec.name for spec in BENCHMARK_SPECS],
+                        help="Only these scenario kinds")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--corpus", help="Load scenarios from a .jsonl corpus instead of generating them")
+    parser.add_argument("--save-corpus", help="Write the scenarios to this .jsonl path")
+    parser.add_argument("--budget-ms", type=float, default=100)
+    parser.add_argument("--value-net", action="store_true", help="Also search with the trained value network")
+    args = parser.parse_args()
+
+    if args.corpus:
+        scenarios = list(load_corpus(args.corpus))
+    else:
+        specs = [get_spec(name) for name in args.specs] if args.specs else None
+        scenarios = build_corpus(specs, args.per_spec, args.seed)
+    if args.save_corpus:
+        save_corpus(args.save_corpus, scenarios)
+        print(f"Saved {len(scenarios)} scenarios to {args.save_corpus}")
+
+    heuristic = run_search(SearchEngine(), scenarios, args.budget_ms)
+    learned = None
+    if args.value_net:
+        from lib.value_net import load_value_evaluator
+        evaluator = load_value_evaluator()
+        if evaluator is None:
+            print("Warning: No trained value network, skipping the comparison")
+        else:
+            learned = run_search(SearchEngine(evaluator=evaluator), scenarios, args.budget_ms)
+
+    groups = defaultdict(list)
+    for i, scenario in enumerate(scenarios):
+        groups[scenario.name].append(i)
+
+    # Out of time before depth 1 finished: no move scored ("exhausted") or only some ("partial")
+    header = ["scenario", "count", "depth", "nodes", "ms", "exhausted", "partial"] + (["same move"] if learned else [])
+    print("\t".join(header))
+    for name, indexes in groups.items():
+        stats = [heuristic[i][1] for i in indexes]
+        row = [name, str(len(indexes)),
+               f"{sum(s.completed_depth for s in stats) / len(stats):.1f}",
+               f"{sum(s.nodes for s in stats) / len(stats):.0f}",
+               f"{sum(s.wall_time_ms for s in stats) / len(stats):.1f}",
+               str(sum(1 for s in stats if s.fallback_reason == "budget_exhausted")),
+               str(sum(1 for s in stats if s.fallback_reason == "budget_partial"))]
+        if learned:
+            same = sum(1 for i in indexes if heuristic[i][0] == learned[i][0])
+            row.append(f"{same / len(indexes):.0%}")
+        print("\t".join(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,16 @@
 #!/usr/bin/env python3
 """
-Create map assets (player icon, node graphics) for the roguelike map system
+Create map assets (player icon, node graphics) for the roguelike map system.
+Only assets whose drawing inputs changed are redrawn, in parallel; --atlas
+also packs them into one atlas.
+
+    python create_map_assets.py --atlas
 """
+import argparse
 import pygame
 import os
+from lib.asset_build import AssetJob, build_assets, content_hash, pack_atlas
+from lib.constants import PACKAGE_ROOT
 
 # Initialize pygame for image creation
 pygame.init()
@@ -24,6 +31,11 @@ COLORS = {
 
 NODE_SIZE = 30
 PLAYER_SIZE = 20
+GENERATOR_VERSION = 1  # Bump when the drawing below changes, to redraw every asset
+
+NODE_TYPES = ['combat', 'elite', 'exchange', 'mystery', 'boss']
+IMAGES_DIR = os.path.join(PACKAGE_ROOT, "images", "map")
+ATLAS_PATH = os.path.join(PACKAGE_ROOT, "images", "map.atlas.png")
 
 def create_player_icon():
     """Create a simple pixelated player icon"""
@@ -119,32 +131,42 @@ def create_path_texture():
     
     return surface
 
+def create_map_asset(asset, node_type=None):
+    """Draw one map asset: "player", "path" or "node" of a node type"""
+    if asset == "player":
+        return create_player_icon()
+    if asset == "path":
+        return create_path_texture()
+    return create_node_icon(node_type)
+
+def map_jobs():
+    """One job per map asset, keyed by its drawing inputs"""
+    specs = [("player.png", ("player",))] + \
+            [(f"node_{node_type}.png", ("node", node_type)) for node_type in NODE_TYPES] + \
+            [("path.png", ("path",))]
+    return [AssetJob(filename, content_hash(GENERATOR_VERSION, NODE_SIZE, PLAYER_SIZE, COLORS, *args), args)
+            for filename, args in specs]
+
 def main():
-    """Create all map assets"""
-    # Create images directory
-    os.makedirs("images/map", exist_ok=True)
+    """Create missing or outdated map assets"""
+    parser = argparse.ArgumentParser(description="Generate map assets")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Redraw every asset")
+    parser.add_argument("--atlas", action="store_true", help="Also pack the assets into one texture atlas")
+    args = parser.parse_args()
     
     print("Creating map assets...")
-    
-    # Create player icon
-    player_icon = create_player_icon()
-    pygame.image.save(player_icon, "images/map/player.png")
-    print("Created: images/map/player.png")
-    
-    # Create node icons
-    node_types = ['combat', 'elite', 'exchange', 'mystery', 'boss']
-    for node_type in node_types:
-        node_icon = create_node_icon(node_type)
-        pygame.image.save(node_icon, f"images/map/node_{node_type}.png")
-        print(f"Created: images/map/node_{node_type}.png")
-    
-    # Create path texture
-    path_texture = create_path_texture()
-    pygame.image.save(path_texture, "images/map/path.png")
-    print("Created: images/map/path.png")
-    
-    print(f"Created {len(node_types) + 2} map assets in images/map/")
+    jobs = map_jobs()
+    built, current = build_assets(IMAGES_DIR, jobs, create_map_asset, args.workers, args.force)
+    for filename in built:
+        print(f"Created: {os.path.join(IMAGES_DIR, filename)}")
+    print(f"Created {len(built)} map assets in {IMAGES_DIR}/, {current} up to date")
+    
+    # An existing atlas is kept in step with the images
+    if args.atlas or (built and os.path.exists(ATLAS_PATH)):
+        manifest = pack_atlas(IMAGES_DIR, [job.filename for job in jobs], ATLAS_PATH)
+        print(f"Packed {len(jobs)} assets into {ATLAS_PATH} ({manifest})")
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
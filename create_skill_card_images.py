@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 """
-Create placeholder skill card images in pixelated style
+Create placeholder skill card images in pixelated style.
+Only cards whose name, rarity, description or this generator changed are
+redrawn, in parallel; --atlas also packs all card images into one atlas.
+
+    python create_skill_card_images.py --workers 4 --atlas
 """
+import argparse
 import pygame
 import os
-from lib.skill_cards import SKILL_CARDS
+import random
+import zlib
+from lib.asset_build import AssetJob, build_assets, content_hash, pack_atlas
+from lib.constants import PACKAGE_ROOT
+from lib.skill_cards import SKILL_CARDS, get_skill_card_image_path
 
 # Initialize pygame for image creation
 pygame.init()
@@ -13,6 +22,10 @@ pygame.init()
 CARD_WIDTH = 80
 CARD_HEIGHT = 100
 PIXEL_SIZE = 2  # Each "pixel" is 2x2 actual pixels for pixelated look
+GENERATOR_VERSION = 2  # Bump when the drawing below changes, to redraw every card
+
+IMAGES_DIR = os.path.join(PACKAGE_ROOT, "images", "skill_cards")
+ATLAS_PATH = os.path.join(PACKAGE_ROOT, "images", "skill_cards.atlas.png")
 
 # Colors (pixelated game palette)
 COLORS = {
@@ -25,7 +38,7 @@ COLORS = {
     'accent': (241, 196, 15),     # Gold accent
 }
 
-def create_skill_card_image(name, rarity, filename):
+def create_skill_card_image(name, rarity, filename=None):
     """Create a pixelated skill card image"""
     # Create surface
     surface = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
@@ -123,45 +136,53 @@ def create_skill_card_image(name, rarity, filename):
     surface.blit(rarity_surface, rarity_rect)
     
     # Add some pixelated texture/noise for authenticity
-    import random
-    random.seed(hash(name))  # Consistent noise per card
+    rng = random.Random(zlib.crc32(name.encode()))  # Same noise per card in every run and process
     for _ in range(5):
-        x = random.randint(10, CARD_WIDTH - 10)
-        y = random.randint(55, CARD_HEIGHT - 20)
+        x = rng.randint(10, CARD_WIDTH - 10)
+        y = rng.randint(55, CARD_HEIGHT - 20)
         noise_color = (
-            COLORS['bg'][0] + random.randint(-10, 10),
-            COLORS['bg'][1] + random.randint(-10, 10),
-            COLORS['bg'][2] + random.randint(-10, 10)
+            COLORS['bg'][0] + rng.randint(-10, 10),
+            COLORS['bg'][1] + rng.randint(-10, 10),
+            COLORS['bg'][2] + rng.randint(-10, 10)
         )
         pygame.draw.rect(surface, noise_color, (x, y, 2, 2))
     
     return surface
 
-def main():
-    """Create all skill card images"""
-    # Create images directory
-    images_dir = "images/skill_cards"
-    os.makedirs(images_dir, exist_ok=True)
-    
-    print("Creating skill card images...")
-    
-    # Create images for all skill cards
+def card_jobs():
+    """One job per skill card, keyed by everything its image is drawn from"""
+    jobs = []
     for name, card_class in SKILL_CARDS.items():
         card_instance = card_class()
         rarity = card_instance.rarity
         
-        # Create filename (replace spaces with underscores, lowercase)
-        filename = name.lower().replace(" ", "_").replace("'", "") + ".png"
-        filepath = os.path.join(images_dir, filename)
-        
-        # Create and save image
-        card_surface = create_skill_card_image(name, rarity, filename)
-        pygame.image.save(card_surface, filepath)
-        
-        print(f"Created: {filepath}")
+        # Same file name the game looks up
+        filename = os.path.basename(get_skill_card_image_path(name))
+        key = content_hash(GENERATOR_VERSION, CARD_WIDTH, CARD_HEIGHT, COLORS,
+                           name, rarity.name, card_instance.description)
+        jobs.append(AssetJob(filename, key, (name, rarity)))
+    return jobs
+
+def main():
+    """Create missing or outdated skill card images"""
+    parser = argparse.ArgumentParser(description="Generate skill card images")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="Redraw every card")
+    parser.add_argument("--atlas", action="store_true", help="Also pack the images into one texture atlas")
+    args = parser.parse_args()
+    
+    print("Creating skill card images...")
+    jobs = card_jobs()
+    built, current = build_assets(IMAGES_DIR, jobs, create_skill_card_image, args.workers, args.force)
+    for filename in built:
+        print(f"Created: {os.path.join(IMAGES_DIR, filename)}")
+    print(f"Created {len(built)} skill card images in {IMAGES_DIR}/, {current} up to date")
     
-    print(f"Created {len(SKILL_CARDS)} skill card images in {images_dir}/")
+    # An existing atlas is kept in step with the images
+    if args.atlas or (built and os.path.exists(ATLAS_PATH)):
+        manifest = pack_atlas(IMAGES_DIR, [job.filename for job in jobs], ATLAS_PATH)
+        print(f"Packed {len(jobs)} images into {ATLAS_PATH} ({manifest})")
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,38 @@
+"""
+Hand statistics over many random deals, computed from NumPy deal arrays.
+
+    python deal_stats.py --deals 1000000 --seed 0
+"""
+
+import argparse
+import time
+
+from lib.deal_arrays import summarize_deal_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Statistics of dealt hands")
+    parser.add_argument("--deals", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=100_000, help="Deals generated at a time")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = summarize_deal_stats(args.deals, args.seed, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    print(f"{stats['hands']} hands from {args.deals} deals in {elapsed:.2f}s")
+    if not stats["hands"]:
+        return
+    print(f"Hands with a bomb:       {stats['bomb_frequency']:.2%}")
+    print(f"Hands with both jokers:  {stats['joker_bomb_frequency']:.2%}")
+    print(f"Hands with a straight:   {stats['straight_frequency']:.2%}")
+    print(f"Bombs per hand:          {stats['bombs_per_hand']:.3f}")
+    print(f"Triples per hand:        {stats['triples_per_hand']:.3f}")
+    print(f"Pairs per hand:          {stats['pairs_per_hand']:.3f}")
+    print(f"Longest straight run:    {stats['longest_straight']:.2f}")
+    print(f"2s per hand:             {stats['twos_per_hand']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Columnar store for simulation results.
+Fight results (lib.fight_sim) are appended to a ShardWriter, which buffers them
+in NumPy columns and writes fixed-size shards: one .npy file per column plus a
+meta.json holding the enemy and loadout names the shard's codes refer to.
+Queries memory-map one shard at a time and fold it into running aggregates, so
+a group-by over millions of fights never holds more than a shard in memory.
+"""
+
+import json
+import os
+from typing import Dict, Any, List, Iterator, Tuple, Optional, Sequence
+
+import numpy as np
+
+SHARD_SIZE = 100_000  # Fights per shard
+
+# Column name -> dtype. enemy and loadout are codes into the shard's name tables.
+COLUMNS = {
+    "enemy": np.uint16,
+    "loadout": np.uint32,
+    "seed": np.uint64,
+    "result": np.int8,  # 1 win, 0 loss, -1 unfinished
+    "player_start_hp": np.int16,
+    "player_hp": np.int16,
+    "enemy_hp": np.int16,
+    "player_cards": np.int16,
+    "enemy_cards": np.int16,
+    "turns": np.int32,
+    "seconds": np.float32,
+}
+CATEGORICAL = ("enemy", "loadout")
+RESULT_CODES = {"win": 1, "loss": 0, "unfinished": -1}
+
+
+class ShardWriter:
+    """Appends result dictionaries to a directory of column shards"""
+
+    def __init__(self, directory: str, shard_size: int = SHARD_SIZE):
+        self.directory = directory
+        self.shard_size = shard_size
+        os.makedirs(directory, exist_ok=True)
+        self._next_shard = len(list_shards(directory))
+        self._reset()
+
+    def _reset(self):
+        self._columns = {name: np.zeros(self.shard_size, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self._names = {name: {} for name in CATEGORICAL}
+        self._count = 0
+
+    def _code(self, column: str, name: str) -> int:
+        table = self._names[column]
+        code = table.get(name)
+        if code is None:
+            code = table[name] = len(table)
+        return code
+
+    def append(self, result: Dict[str, Any]):
+        row = self._count
+        columns = self._columns
+        columns["enemy"][row] = self._code("enemy", result["enemy"])
+        columns["loadout"][row] = self._code("loadout", result.get("loadout", ""))
+        columns["seed"][row] = result["seed"]
+        columns["result"][row] = RESULT_CODES[result["result"]]
+        columns["player_start_hp"][row] = result.get("player_start_hp", 0)
+        for name in ("player_hp", "enemy_hp", "player_cards", "enemy_cards", "turns", "seconds"):
+            columns[name][row] = result.get(name, 0)
+        self._count += 1
+        if self._count == self.shard_size:
+            self.flush()
+
+    def extend(self, results):
+        for result in results:
+            self.append(result)
+
+    def flush(self):
+        """Write the buffered rows as a new shard"""
+        if not self._count:
+            return
+        path = os.path.join(self.directory, f"shard_{self._next_shard:05d}")
+        os.makedirs(path, exist_ok=True)
+        for name, values in self._columns.items():
+            np.save(os.path.join(path, f"{name}.npy"), values[:self._count])
+        meta = {column: sorted(table, key=table.get) for column, table in self._names.items()}
+        meta["rows"] = self._count
+        with open(os.path.join(path, "meta.json"), "w") as f:
+            json.dump(meta, f)
+        self._next_shard += 1
+        self._reset()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def list_shards(directory: str) -> List[str]:
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                  if name.startswith("shard_") and os.path.exists(os.path.join(directory, name, "meta.json")))
+
+
+def iter_shards(directory: str, columns: Sequence[str] = None) -> Iterator[Tuple[Dict[str, np.ndarray], Dict[str, Any]]]:
+    """(memory-mapped columns, meta) for each shard"""
+    for path in list_shards(directory):
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+        names = columns or list(COLUMNS)
+        yield {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in names}, meta
+
+
+def _hp_lost(data):
+    return data["player_start_hp"].astype(np.int64) - data["player_hp"]
+
+
+def group_by(directory: str, keys: Sequence[str] = ("enemy",),
+             where: Optional[Dict[str, Sequence[str]]] = None) -> List[Dict[str, Any]]:
+    """Fights, win rate, mean HP lost and mean turns per group, aggregated shard by shard.
+    keys are categorical columns; where maps a categorical column to the names to keep."""
+    for key in list(keys) + list(where or {}):
+        if key not in CATEGORICAL:
+            raise ValueError(f"Can only group and filter on {CATEGORICAL}, not {key!r}")
+    needed = set(keys) | set(where or {}) | {"result", "player_start_hp", "player_hp", "turns"}
+    totals: Dict[tuple, np.ndarray] = {}  # group -> [fights, wins, hp lost, turns]
+    for data, meta in iter_shards(directory, sorted(needed)):
+        mask = np.ones(meta["rows"], dtype=bool)
+        for column, allowed in (where or {}).items():
+            codes = [i for i, name in enumerate(meta[column]) if name in set(allowed)]
+            mask &= np.isin(data[column], codes)
+        if not mask.any():
+            continue
+        # One combined code per row, then bincount each measure
+        group = np.zeros(meta["rows"], dtype=np.int64)
+        for key in keys:
+            group = group * len(meta[key]) + data[key]
+        group = group[mask]
+        size = int(group.max()) + 1
+        fights = np.bincount(group, minlength=size)
+        wins = np.bincount(group, weights=(data["result"][mask] == 1), minlength=size)
+        hp_lost = np.bincount(group, weights=_hp_lost(data)[mask], minlength=size)
+        turns = np.bincount(group, weights=data["turns"][mask], minlength=size)
+        for code in np.nonzero(fights)[0]:
+            names, rest = [], int(code)
+            for key in reversed(keys):
+                rest, index = divmod(rest, len(meta[key]))
+                names.append(meta[key][index])
+            label = tuple(reversed(names))
+            entry = totals.setdefault(label, np.zeros(4))
+            entry += (fights[code], wins[code], hp_lost[code], turns[code])
+
+    rows = []
+    for label, (fights, wins, hp_lost, turns) in sorted(totals.items()):
+        row = dict(zip(keys, label))
+        row.update(fights=int(fights), win_rate=float(wins / fights), avg_hp_lost=float(hp_lost / fights),
+                   avg_turns=float(turns / fights))
+        rows.append(row)
+    return rows
@@ -0,0 +1,125 @@
+"""
+Incremental, parallel generation of image assets for the create_* scripts.
+Every output has a content hash of the inputs it is drawn from (including the
+generator's version), kept in a build manifest next to the images. A run only
+renders outputs that are missing or whose hash changed, over a process pool.
+pack_atlas() packs a directory's images into one texture atlas plus a JSON
+manifest of their rectangles, which AssetManager.preload_atlas() loads in one
+read.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+import pygame
+
+from lib.constants import PACKAGE_ROOT
+
+BUILD_MANIFEST = ".build.json"  # Output file name -> content hash, per asset directory
+ATLAS_PADDING = 1
+ATLAS_MAX_WIDTH = 1024
+
+
+class AssetJob(NamedTuple):
+    """One generated image: file name in the asset directory, content hash and renderer arguments"""
+    filename: str
+    key: str
+    args: tuple
+
+
+def content_hash(*parts) -> str:
+    """Stable hash of JSON-serializable inputs"""
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _load_build_manifest(directory: str) -> Dict[str, str]:
+    path = os.path.join(directory, BUILD_MANIFEST)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Ignoring unreadable build manifest {path}: {e}")
+        return {}
+
+
+def stale_jobs(directory: str, jobs: List[AssetJob], force: bool = False) -> List[AssetJob]:
+    """Jobs whose output is missing or was built from other inputs"""
+    built = _load_build_manifest(directory)
+    return [job for job in jobs
+            if force or built.get(job.filename) != job.key or not os.path.exists(os.path.join(directory, job.filename))]
+
+
+def _init_worker():
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+
+
+def _render(render: Callable, job: AssetJob, directory: str) -> str:
+    pygame.image.save(render(*job.args), os.path.join(directory, job.filename))
+    return job.filename
+
+
+def build_assets(directory: str, jobs: List[AssetJob], render: Callable, workers: int = None,
+                 force: bool = False) -> Tuple[List[str], int]:
+    """Render the stale jobs with render(*job.args) -> Surface, in parallel when workers > 1.
+    render must be a module-level function. Returns (rebuilt file names, up-to-date count)."""
+    os.makedirs(directory, exist_ok=True)
+    todo = stale_jobs(directory, jobs, force)
+    workers = min(workers or os.cpu_count() or 1, len(todo))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            built = list(pool.map(_render, [render] * len(todo), todo, [directory] * len(todo)))
+    else:
+        built = [_render(render, job, directory) for job in todo]
+
+    # Keep only entries of current jobs, so removed cards drop out of the manifest
+    manifest = _load_build_manifest(directory)
+    manifest = {job.filename: manifest[job.filename] for job in jobs if job.filename in manifest}
+    manifest.update({job.filename: job.key for job in todo})
+    with open(os.path.join(directory, BUILD_MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return built, len(jobs) - len(todo)
+
+
+def pack_atlas(directory: str, filenames: List[str], atlas_path: str) -> str:
+    """Pack images into atlas_path (.png) with shelf packing, tallest first, and write
+    atlas_path with a .json suffix mapping each image's path (relative to the package root)
+    to its [x, y, width, height], and listing the images without alpha. The atlas only
+    has an alpha channel if one of its images does. Returns the manifest path."""
+    images = {name: pygame.image.load(os.path.join(directory, name)) for name in filenames}
+    order = sorted(filenames, key=lambda name: (-images[name].get_height(), name))
+    width = min(ATLAS_MAX_WIDTH, sum(images[name].get_width() + ATLAS_PADDING for name in order)) or 1
+    rects = {}
+    x = y = shelf_height = 0
+    for name in order:
+        w, h = images[name].get_size()
+        if x + w > width:
+            x, y = 0, y + shelf_height + ATLAS_PADDING
+            shelf_height = 0
+        rects[name] = (x, y, w, h)
+        x += w + ATLAS_PADDING
+        shelf_height = max(shelf_height, h)
+
+    opaque = [name for name in filenames if not images[name].get_flags() & pygame.SRCALPHA]
+    # Opaque images keep blitting without per-pixel alpha once loaded back
+    flags = 0 if len(opaque) == len(filenames) else pygame.SRCALPHA
+    atlas = pygame.Surface((width, y + shelf_height or 1), flags)
+    atlas.fill((0, 0, 0, 0))
+    for name, (x, y, _, _) in rects.items():
+        # MAX onto a cleared atlas copies pixels exactly, alpha included
+        atlas.blit(images[name], (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+    pygame.image.save(atlas, atlas_path)
+
+    relative_dir = os.path.relpath(directory, PACKAGE_ROOT).replace(os.sep, "/")
+    manifest_path = os.path.splitext(atlas_path)[0] + ".json"
+    with open(manifest_path, "w") as f:
+        json.dump({"image": os.path.basename(atlas_path),
+                   "rects": {f"{relative_dir}/{name}": list(rect) for name, rect in sorted(rects.items())},
+                   "opaque": [f"{relative_dir}/{name}" for name in sorted(opaque)]},
+                  f, indent=1)
+    return manifest_path
@@ -0,0 +1,151 @@
+"""
+Image assets, loaded once from paths relative to the package root.
+Images are decoded on first use, ahead of time by preload() (optionally on a
+background thread) or all at once from a texture atlas by preload_atlas(), and
+converted to the display format the first time they are handed out once a
+display mode exists: convert_alpha() for images with transparency, convert()
+otherwise. Load times are kept per path so a
+screen can report what its assets cost.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+import pygame
+
+from lib.constants import PACKAGE_ROOT
+
+
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """convert() or convert_alpha() for fast blits, once a display mode exists"""
+    if not pygame.display.get_init() or pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+class AssetManager:
+    """Loads and caches images by path relative to the package root"""
+
+    def __init__(self, root: str = PACKAGE_ROOT):
+        self.root = root
+        self._decoded: Dict[str, Optional[pygame.Surface]] = {}  # As loaded, None when missing or broken
+        self._images: Dict[str, pygame.Surface] = {}  # In the display format
+        self._lock = threading.Lock()
+        self.load_times: Dict[str, float] = {}  # Milliseconds spent loading each path
+
+    def path(self, relative_path: str) -> str:
+        return os.path.join(self.root, relative_path)
+
+    def image_paths(self, directory: str) -> List[str]:
+        """Relative paths of the .png images in a directory"""
+        full = self.path(directory)
+        if not os.path.isdir(full):
+            return []
+        return [f"{directory}/{name}" for name in sorted(os.listdir(full)) if name.endswith(".png")]
+
+    def _decode(self, relative_path: str) -> Optional[pygame.Surface]:
+        with self._lock:
+            if relative_path in self._decoded:
+                return self._decoded[relative_path]
+        start = time.perf_counter()
+        image = None
+        full = self.path(relative_path)
+        if os.path.exists(full):
+            try:
+                image = pygame.image.load(full)
+            except Exception as e:
+                print(f"Warning: Could not load {relative_path}: {e}")
+        with self._lock:
+            self._decoded.setdefault(relative_path, image)
+            self.load_times.setdefault(relative_path, (time.perf_counter() - start) * 1000)
+            return self._decoded[relative_path]
+
+    def image(self, relative_path: str) -> Optional[pygame.Surface]:
+        """The image at a path, or None if it is missing or cannot be loaded"""
+        image = self._images.get(relative_path)
+        if image is not None:
+            return image
+        image = self._decode(relative_path)
+        if image is None:
+            return None
+        # Convert on the calling (drawing) thread, and only once a display exists
+        converted = to_display_format(image)
+        if converted is not image:
+            self._images[relative_path] = converted
+        return converted
+
+    def preload(self, paths: Iterable[str], background: bool = False, label: str = None) -> Optional[threading.Thread]:
+        """Decode images ahead of their first use, printing a load report when given a label.
+        With background=True the work runs on a daemon thread, which is returned."""
+        paths = list(paths)
+
+        def load():
+            start = time.perf_counter()
+            for path in paths:
+                self._decode(path)
+            if label:
+                print(self.report(paths, label, (time.perf_counter() - start) * 1000))
+
+        if not background:
+            load()
+            return None
+        thread = threading.Thread(target=load, daemon=True)
+        thread.start()
+        return thread
+
+    def preload_atlas(self, manifest_path: str, label: str = None) -> bool:
+        """Register every image of a texture atlas (see lib.asset_build.pack_atlas) from one image read.
+        False if there is no usable atlas, in which case images load one by one as usual."""
+        full = self.path(manifest_path)
+        if not os.path.exists(full):
+            return False
+        start = time.perf_counter()
+        try:
+            with open(full) as f:
+                manifest = json.load(f)
+            atlas = pygame.image.load(os.path.join(os.path.dirname(full), manifest["image"]))
+            rects = manifest["rects"]
+            opaque = set(manifest.get("opaque", ()))
+        except Exception as e:
+            print(f"Warning: Could not load atlas {manifest_path}: {e}")
+            return False
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            for path, rect in rects.items():
+                if path not in self._decoded:
+                    image = atlas.subsurface(rect)
+                    if path in opaque and image.get_flags() & pygame.SRCALPHA:
+                        # Copied out of an alpha atlas, so it converts without alpha like its own file would
+                        image = pygame.Surface(image.get_size())
+                        image.blit(atlas, (0, 0), rect)
+                    self._decoded[path] = image
+                    self.load_times[path] = elapsed / len(rects)
+        if label:
+            print(f"Loaded {len(rects)} {label} assets from {manifest['image']} in {elapsed:.1f} ms")
+        return True
+
+    def report(self, paths: List[str], label: str, elapsed_ms: float) -> str:
+        missing = sum(1 for path in paths if self._decoded.get(path) is None)
+        slowest = max(paths, key=lambda path: self.load_times.get(path, 0), default=None)
+        text = f"Loaded {len(paths) - missing} {label} assets in {elapsed_ms:.1f} ms"
+        if missing:
+            text += f", {missing} missing"
+        if slowest:
+            text += f" (slowest {slowest}: {self.load_times.get(slowest, 0):.1f} ms)"
+        return text
+
+    def clear(self):
+        """Forget converted images, e.g. after the display mode changes"""
+        self._images.clear()
+
+
+_asset_manager = AssetManager()
+
+
+def get_asset_manager() -> AssetManager:
+    return _asset_manager
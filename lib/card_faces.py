@@ -0,0 +1,70 @@
+"""
+Pre-rendered playing card faces.
+Each (font, size) gets one CardFaces holding the card back and a surface per
+card face, rendered the first time that face is drawn. Hands, previews and the
+table draw by blitting these surfaces, in a single Surface.blits call per row.
+"""
+
+from typing import Dict, Tuple
+
+import pygame
+
+from lib.asset_manager import to_display_format
+from lib.constants import CARD_WIDTH, CARD_HEIGHT, CARD_COLOR, CARD_BACK_COLOR, TEXT_COLOR, RED_COLOR, BLACK_COLOR
+from lib.core_types import Suit
+
+RED_SUITS = (Suit.HEARTS, Suit.DIAMONDS)
+
+
+class CardFaces:
+    """Card face and back surfaces of one size, with one font"""
+
+    def __init__(self, font, size: Tuple[int, int] = (CARD_WIDTH, CARD_HEIGHT)):
+        self.font = font
+        self.size = size
+        self._faces: Dict[Tuple[str, Suit], pygame.Surface] = {}
+        self.back = pygame.Surface(size)
+        self.back.fill(CARD_BACK_COLOR)
+        self.back = to_display_format(self.back)
+
+    def face(self, card) -> pygame.Surface:
+        # Skill cards can change a card's rank or suit, so look up by the current face
+        key = (card.rank, card.suit)
+        surface = self._faces.get(key)
+        if surface is None:
+            surface = self._faces[key] = self._render(card.rank, card.suit)
+        return surface
+
+    def _render(self, rank, suit) -> pygame.Surface:
+        width, height = self.size
+        surface = pygame.Surface(self.size)
+        surface.fill(CARD_COLOR)
+        pygame.draw.rect(surface, TEXT_COLOR, (0, 0, width, height), 2)
+        color = RED_COLOR if suit in RED_SUITS else BLACK_COLOR
+        surface.blit(self.font.render(rank, True, color), (5, 5))
+        surface.blit(self.font.render(suit.value, True, color), (5, 25))
+        return to_display_format(surface)
+
+    def draw_row(self, screen, cards, positions, show_face: bool = True):
+        """Blit cards at their (x, y) positions, later cards on top"""
+        if show_face:
+            screen.blits([(self.face(card), position) for card, position in zip(cards, positions)], False)
+        else:
+            screen.blits([(self.back, position) for position in positions], False)
+
+
+_card_faces: Dict[Tuple[pygame.font.Font, Tuple[int, int]], CardFaces] = {}
+
+
+def get_card_faces(font, size: Tuple[int, int] = (CARD_WIDTH, CARD_HEIGHT)) -> CardFaces:
+    """Shared CardFaces for a font and card size"""
+    key = (font, tuple(size))
+    faces = _card_faces.get(key)
+    if faces is None:
+        faces = _card_faces[key] = CardFaces(font, tuple(size))
+    return faces
+
+
+def clear_card_faces():
+    """Forget rendered faces, e.g. after the display mode changes"""
+    _card_faces.clear()
@@ -1,9 +1,14 @@
 # Constants for UI and game logic
+import os
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # Assets and models live under it
+
 WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 768
 CARD_WIDTH = 60
 CARD_HEIGHT = 90
 FPS = 60
+IDLE_WAIT_MS = 100  # Longest an idle screen sleeps waiting for input
 
 # Colors
 BG_COLOR = (34, 52, 60)
@@ -16,6 +21,12 @@ BUTTON_HOVER = (39, 174, 96)
 RED_COLOR = (231, 76, 60)
 BLACK_COLOR = (26, 32, 44)
 
+# Skill card image overlays: (color, alpha)
+SKILL_CARD_DISABLED_TINT = ((100, 100, 100), 128)
+SKILL_CARD_HOVER_TINT = ((255, 255, 255), 50)
+REWARD_CARD_DISABLED_TINT = ((100, 100, 100), 150)
+REWARD_CARD_HOVER_TINT = ((255, 255, 255), 60)
+
 # UI Layout Constants
 BUTTON_WIDTH = 200
 BUTTON_HEIGHT = 40
@@ -4,7 +4,6 @@ This module contains fundamental types used throughout the codebase.
 """
 
 from dataclasses import dataclass
-import pygame
 from enum import Enum
 
 
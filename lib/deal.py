@@ -0,0 +1,57 @@
+"""
+The deck and the deal, for single fights and in bulk.
+Every fight shuffles the 54-card deck, discards 8 and deals 23 cards to each
+side. new_deck()/deal_cards() build Card objects for one fight. Deals in bulk,
+as NumPy arrays of card indexes, are in lib.deal_arrays.
+"""
+
+import random
+from typing import List, NamedTuple
+
+from lib.core_types import Card, Suit
+
+RANKS = ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]
+SUITS = [Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]
+
+DECK_SIZE = 54
+DISCARD_SIZE = 8
+HAND_SIZE = 23
+
+# Slices of a dealt deck
+DISCARD = slice(0, DISCARD_SIZE)
+PLAYER_HAND = slice(DISCARD_SIZE, DISCARD_SIZE + HAND_SIZE)
+AI_HAND = slice(DISCARD_SIZE + HAND_SIZE, DECK_SIZE)
+
+NUM_RANKS = 15  # 3 .. 2, Black Joker, Red Joker
+STRAIGHT_RANKS = 12  # Straights run from 3 up to A
+MIN_STRAIGHT = 5
+
+# Rank index (0 = "3" .. 12 = "2", 13/14 = jokers) of each card index in new_deck() order
+CARD_RANK = tuple(i % 13 for i in range(52)) + (13, 14)
+
+
+class Deal(NamedTuple):
+    discard: List[Card]
+    player: List[Card]
+    ai: List[Card]
+
+
+def new_deck() -> List[Card]:
+    """The 54 cards a fight is dealt from, in a fixed order (suit by suit, then the jokers)"""
+    deck = [Card(rank, suit) for suit in SUITS for rank in RANKS]
+    deck.append(Card("Black Joker", Suit.BLACK_JOKER))
+    deck.append(Card("Red Joker", Suit.RED_JOKER))
+    return deck
+
+
+def deal_cards(rng: random.Random = None) -> Deal:
+    """Shuffle a new deck and deal it: 8 discarded, 23 to the player, 23 to the AI"""
+    deck = new_deck()
+    (rng or random).shuffle(deck)
+    return Deal(deck[DISCARD], deck[PLAYER_HAND], deck[AI_HAND])
+
+
+def cards_from_indexes(indexes) -> List[Card]:
+    """Card objects for a row of card indexes (for the few deals that get played)"""
+    deck = new_deck()
+    return [deck[i] for i in indexes]
@@ -0,0 +1,89 @@
+"""
+Deals in bulk as NumPy arrays, for statistics over millions of hands.
+mass_deals() produces many deals at once as a (n, 54) array of card indexes in
+lib.deal order, and deal_stats() computes hand statistics straight from those
+arrays. Kept apart from lib.deal so the game itself does not need NumPy.
+"""
+
+from typing import Dict, Iterator
+
+import numpy as np
+
+from lib import deal
+from lib.deal import DECK_SIZE, PLAYER_HAND, AI_HAND, NUM_RANKS, STRAIGHT_RANKS, MIN_STRAIGHT
+
+CARD_RANK = np.array(deal.CARD_RANK, dtype=np.uint8)  # lib.deal.CARD_RANK, for indexing with arrays
+
+
+def mass_deals(count: int, seed: int = None) -> np.ndarray:
+    """(count, 54) uint8 array of shuffled card indexes; columns follow DISCARD/PLAYER_HAND/AI_HAND"""
+    rng = np.random.default_rng(seed)
+    decks = np.broadcast_to(np.arange(DECK_SIZE, dtype=np.uint8), (count, DECK_SIZE))
+    return rng.permuted(decks, axis=1)
+
+
+def iter_mass_deals(count: int, seed: int = None, chunk_size: int = 100_000) -> Iterator[np.ndarray]:
+    """mass_deals in chunks, for more deals than fit in memory at once"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, count, chunk_size):
+        yield mass_deals(min(chunk_size, count - start), seed=rng.integers(1 << 63))
+
+
+def hand_rank_counts(hands: np.ndarray) -> np.ndarray:
+    """(n, 15) rank histograms of an (n, k) array of card indexes"""
+    ranks = CARD_RANK[hands].astype(np.int64)
+    n = ranks.shape[0]
+    offsets = np.arange(n, dtype=np.int64)[:, None] * NUM_RANKS
+    return np.bincount((ranks + offsets).ravel(), minlength=n * NUM_RANKS).reshape(n, NUM_RANKS)
+
+
+def longest_run(counts: np.ndarray) -> np.ndarray:
+    """Longest run of consecutive ranks from 3 to A present in each histogram"""
+    run = np.zeros(counts.shape[0], dtype=np.int64)
+    best = np.zeros_like(run)
+    for rank in range(STRAIGHT_RANKS):
+        run = np.where(counts[:, rank] > 0, run + 1, 0)
+        np.maximum(best, run, out=best)
+    return best
+
+
+def deal_stats(deals: np.ndarray) -> Dict[str, np.ndarray]:
+    """Per-hand statistics for both seats of each deal, as (n, 2) arrays (player, AI)"""
+    stats = {}
+    per_seat = [hand_rank_counts(deals[:, seat]) for seat in (PLAYER_HAND, AI_HAND)]
+    regular = [counts[:, :13] for counts in per_seat]
+    stats["bombs"] = np.stack([(r == 4).sum(axis=1) for r in regular], axis=1)
+    stats["joker_bomb"] = np.stack([(c[:, 13] > 0) & (c[:, 14] > 0) for c in per_seat], axis=1)
+    stats["triples"] = np.stack([(r == 3).sum(axis=1) for r in regular], axis=1)
+    stats["pairs"] = np.stack([(r == 2).sum(axis=1) for r in regular], axis=1)
+    stats["longest_straight"] = np.stack([longest_run(c) for c in per_seat], axis=1)
+    stats["twos"] = np.stack([c[:, 12] for c in per_seat], axis=1)
+    return stats
+
+
+def summarize_deal_stats(count: int, seed: int = None, chunk_size: int = 100_000) -> Dict[str, float]:
+    """Hand statistic frequencies over count deals, computed chunk by chunk"""
+    hands = 0
+    totals = {"bomb": 0, "joker_bomb": 0, "straight": 0, "bombs": 0, "triples": 0, "pairs": 0,
+              "longest_straight": 0, "twos": 0}
+    for deals in iter_mass_deals(count, seed, chunk_size):
+        stats = deal_stats(deals)
+        hands += stats["bombs"].size
+        totals["bomb"] += int((stats["bombs"] > 0).sum())
+        totals["joker_bomb"] += int(stats["joker_bomb"].sum())
+        totals["straight"] += int((stats["longest_straight"] >= MIN_STRAIGHT).sum())
+        for name in ("bombs", "triples", "pairs", "longest_straight", "twos"):
+            totals[name] += int(stats[name].sum())
+    if not hands:
+        return {"hands": 0}
+    return {
+        "hands": hands,
+        "bomb_frequency": totals["bomb"] / hands,
+        "joker_bomb_frequency": totals["joker_bomb"] / hands,
+        "straight_frequency": totals["straight"] / hands,
+        "bombs_per_hand": totals["bombs"] / hands,
+        "triples_per_hand": totals["triples"] / hands,
+        "pairs_per_hand": totals["pairs"] / hands,
+        "longest_straight": totals["longest_straight"] / hands,
+        "twos_per_hand": totals["twos"] / hands,
+    }
@@ -9,6 +9,7 @@ from lib.skill_cards import SkillCard, get_skill_card
 from lib.items import Item, get_item
 from lib.combo import ComboType
 from lib.core_types import Card
+from lib.replay_log import SKILL as REPLAY_SKILL
 
 
 class EnemyType(Enum):
@@ -135,7 +136,8 @@ class Enemy(SmartAIPlayer):
                  play_style: PlayStyle = PlayStyle.BALANCED,
                  skill_cards: List[str] = None,
                  items: List[str] = None,
-                 abilities: List[EnemyAbility] = None):
+                 abilities: List[EnemyAbility] = None,
+                 policy: Any = None):
         super().__init__(name)
         self.enemy_type = enemy_type
         self.max_hp = max_hp
@@ -160,6 +162,11 @@ class Enemy(SmartAIPlayer):
         
         self.abilities = abilities or []
         self.current_game_state = None
+
+        # Regular enemies use the distilled fast policy when it has been trained
+        if policy is None and enemy_type == EnemyType.REGULAR:
+            policy = _load_fast_policy()
+        self.policy = policy
     
     def on_fight_start(self, game_state: Any):
         """Called when fight begins"""
@@ -201,6 +208,9 @@ class Enemy(SmartAIPlayer):
         
         if len(valid_plays) == 1:
             return valid_plays[0]
+
+        if self.policy:
+            return self._choose_policy_play(valid_plays, last_combo, game_state)
         
         # Apply play style to AI decision making
         if self.play_style == PlayStyle.DEFENSIVE:
@@ -245,6 +255,14 @@ class Enemy(SmartAIPlayer):
         
         return max(valid_plays, key=lambda p: complexity_scores.get(p.type, 0))
     
+    def _choose_policy_play(self, valid_plays, last_combo, game_state):
+        """Constant-cost play from the distilled policy"""
+        if hasattr(game_state, 'player'):
+            opp_hand, opp_hp = game_state.player.hand, game_state.player.hp
+        else:
+            opp_hand, opp_hp = [], 5
+        return self.policy.choose(valid_plays, self.hand, opp_hand, self.hp, opp_hp, last_combo)
+
     def _choose_balanced_play(self, valid_plays, last_combo, game_state):
         """Balanced approach using original AI logic"""
         return super().choose_play(last_combo, game_state)
@@ -259,6 +277,9 @@ class Enemy(SmartAIPlayer):
             if skill_card.can_use(game_state):
                 # Simple heuristic: use skill cards when they would be beneficial
                 if self._should_use_skill_card(skill_card, last_combo, game_state):
+                    replay_log = getattr(game_state, 'replay_log', None)
+                    if replay_log:
+                        replay_log.use(REPLAY_SKILL, 1, skill_card.name)
                     skill_card.use(game_state)
                     self.skill_cards.remove(skill_card)
                     return None  # Skill card use is the action this turn
@@ -278,7 +299,16 @@ class Enemy(SmartAIPlayer):
                 return True
         
         # Use utility cards randomly with low probability
-        return random.random() < 0.1
+        return self.rng.random() < 0.1
+
+
+def _load_fast_policy():
+    """Trained fast policy, or None when it or NumPy is unavailable"""
+    try:
+        from lib.policy_net import get_fast_policy
+    except ImportError:
+        return None
+    return get_fast_policy()
 
 
 # Predefined Enemy Templates
@@ -338,9 +368,9 @@ def create_flame_elemental() -> Enemy:
     )
 
 
-def create_combo_bane_boss() -> Enemy:
+def create_combo_bane_boss(rng: random.Random = random) -> Enemy:
     """Boss that bans certain combo types"""
-    banned_combos = random.sample([ComboType.STRAIGHT, ComboType.PLANE, ComboType.TRIPLE], 2)
+    banned_combos = rng.sample([ComboType.STRAIGHT, ComboType.PLANE, ComboType.TRIPLE], 2)
     
     return Enemy(
         name="Combo Bane",
@@ -405,9 +435,18 @@ BOSS_ENEMIES = {
     "Shadow Lord": create_shadow_lord,
 }
 
+# Factories whose enemies have randomized abilities, drawn from the rng they are given
+RANDOMIZED_FACTORIES = {create_combo_bane_boss}
+
+
+def _create(factory, rng: random.Random) -> Enemy:
+    return factory(rng) if factory in RANDOMIZED_FACTORIES else factory()
+
 
-def get_enemy(enemy_type: EnemyType, name: str = None) -> Enemy:
-    """Get a random enemy of the specified type, or a specific named enemy"""
+def get_enemy(enemy_type: EnemyType, name: str = None, rng: random.Random = None) -> Enemy:
+    """Get a random enemy of the specified type, or a specific named enemy.
+    rng (a fight's enemy stream) picks the enemy and any randomized abilities."""
+    rng = rng or random
     if enemy_type == EnemyType.REGULAR:
         enemies = REGULAR_ENEMIES
     elif enemy_type == EnemyType.ELITE:
@@ -418,10 +457,10 @@ def get_enemy(enemy_type: EnemyType, name: str = None) -> Enemy:
         return create_goblin_scout()  # Fallback
     
     if name and name in enemies:
-        return enemies[name]()
+        return _create(enemies[name], rng)
     else:
         # Return random enemy of that type
-        return random.choice(list(enemies.values()))()
+        return _create(rng.choice(list(enemies.values())), rng)
 
 
 def get_random_enemy() -> Enemy:
@@ -1,18 +1,27 @@
 import pygame
-import random
 from lib.constants import *
-from lib.core_types import Card, Suit
+from lib.text_cache import render_text, get_font
 from lib.ui_utils import UIUtils
-from lib.combo import identify_combo
-from lib.player import FightPlayer, SmartAIPlayer
-from lib.enemies import Enemy, EnemyType, get_enemy
-from lib.skill_cards import get_skill_card, SkillCard, load_skill_card_image
-from lib.items import get_item, Item
-from lib.equipment import get_equipment, Equipment
+from lib.enemies import EnemyType
+from lib.skill_cards import get_skill_card_surface
+from lib.card_faces import get_card_faces
+from lib.hit_test import HitGrid, rect_grid
+from lib.frame_profiler import FrameProfiler, OVERLAY_RECT
+from lib.fight_engine import FightEngine, FightAction, PLAY, PASS, SKILL, ITEM, EQUIPMENT
+from lib.hint import HintEngine, HintUnavailable
 from typing import List, Optional, Dict, Any
 
+UNDO_LIMIT = 50  # Player actions that can be taken back
+TOOLTIP_OVERHANG = 90  # Hover descriptions reach this far left of the panel
+
+
+class EnhancedFightGame(FightEngine):
+    """Pygame renderer and input controller on top of FightEngine"""
+
+    # Phases timed by the frame profiler (F3)
+    PROFILED_METHODS = ("handle_event", "ai_turn", "check_game_over", "region_keys", "draw", "draw_hand",
+                        "draw_game_info", "draw_skill_cards", "draw_items", "draw_equipment")
 
-class EnhancedFightGame:
     def __init__(self, screen, 
                  player_skill_cards: List[str] = None,
                  player_items: List[str] = None,
@@ -24,154 +33,64 @@ class EnhancedFightGame:
                  region_modifiers: Dict[str, Any] = None,
                  run_manager = None,
                  preview_player = None,
-                 preview_deck = None):
+                 preview_deck = None,
+                 rng = None):
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 24)
-        self.big_font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 18)
-
-        # Initialize players
-        self.player = FightPlayer("Player")
-        self.ai = get_enemy(enemy_type, enemy_name)
-        self.current_player = None
-        self.last_combo = None
-        self.last_player = None
-        self.selected_cards = []
+        self.font = get_font(None, 24)
+        self.big_font = get_font(None, 36)
+        self.small_font = get_font(None, 18)
+        self.card_faces = get_card_faces(self.font)
 
-        # Game state
-        self.game_over = False
-        self.winner = None
+        self.selected_cards = []
         self.player_card_rects = []
-        self.discard_pile = []
-
-        # Roguelike systems
-        self.player_skill_cards = []
-        self.player_items = []
-        self.player_equipment = []
-        self.region_modifiers = region_modifiers or {}
-        self.run_manager = run_manager
-        self.preview_player = preview_player
-        self.preview_deck = preview_deck
-        
-        # Initialize starting HP
-        self.player.hp = player_starting_hp
-        # Enemy HP is set by its own max_hp, but can be overridden
-        if ai_starting_hp != 5:  # If non-default HP specified, use it
-            self.ai.hp = ai_starting_hp
-            self.ai.max_hp = ai_starting_hp
-
-        # Load skill cards, items, and equipment
-        if player_skill_cards:
-            for card_name in player_skill_cards:
-                skill_card = get_skill_card(card_name)
-                if skill_card:
-                    self.player_skill_cards.append(skill_card)
-        
-        if player_items:
-            for item_name in player_items:
-                item = get_item(item_name)
-                if item:
-                    self.player_items.append(item)
-        
-        if player_equipment:
-            for equipment_name in player_equipment:
-                equipment = get_equipment(equipment_name)
-                if equipment:
-                    self.player_equipment.append(equipment)
-                    # Apply equipment effects
-                    equipment.on_equip(self)
+        self.card_layout = None
+        self.card_hits = HitGrid()  # Player's cards, rebuilt when the hand layout changes
+        self.hint_engine = HintEngine()
 
         # UI elements
         button_y = WINDOW_HEIGHT - 80
         self.play_button = pygame.Rect(WINDOW_WIDTH // 2 - 180, button_y, SMALL_BUTTON_WIDTH, BUTTON_HEIGHT)
         self.pass_button = pygame.Rect(WINDOW_WIDTH // 2 - 60, button_y, SMALL_BUTTON_WIDTH, BUTTON_HEIGHT)
         self.suggest_button = pygame.Rect(WINDOW_WIDTH // 2 + 60, button_y, SMALL_BUTTON_WIDTH, BUTTON_HEIGHT)
+        self.undo_button = pygame.Rect(WINDOW_WIDTH // 2 + 180, button_y, SMALL_BUTTON_WIDTH, BUTTON_HEIGHT)
+        self.undo_stack = []  # Snapshots taken before each player action
         
         # Skill card buttons (will be created dynamically)
         self.skill_card_buttons = []
         self.item_buttons = []
         self.equipment_buttons = []
-        
-        # Game state tracking
-        self.extra_turns = 0
-        self.extra_turn_player = None
-        self.last_combo_damage_bonus = 0
-        self.first_damage_taken = False
-
-        self.init_game()
-
-    def init_game(self):
-        # Use pre-dealt cards if available
-        if self.preview_player and self.preview_deck:
-            # Use pre-dealt hand from preview
-            self.player.hand = self.preview_player.hand
-            # Deal AI hand from remaining deck
-            self.ai.hand = self.preview_deck[23:]
-            # Set discard pile (first 8 cards were already discarded during preview)
-            self.discard_pile = []
-        else:
-            # Create deck normally
-            deck = []
-            # Regular cards
-            for suit in [Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]:
-                for rank in ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]:
-                    deck.append(Card(rank, suit))
-            
-            # Add Jokers
-            deck.append(Card("Black Joker", Suit.BLACK_JOKER))
-            deck.append(Card("Red Joker", Suit.RED_JOKER))
-
-            # Shuffle and deal
-            random.shuffle(deck)
-
-            # Discard first 8 cards
-            self.discard_pile = deck[:8]
-            deck = deck[8:]
-
-            # Deal remaining 46 cards (23 each)
-            self.player.hand = deck[:23]
-            self.ai.hand = deck[23:]
-
-        self.player.sort_hand()
-        self.ai.sort_hand()
-
-        # Player with 3♦ starts
-        self.current_player = self.player
-        for card in self.player.hand:
-            if card.rank == "3" and card.suit == Suit.DIAMONDS:
-                self.current_player = self.player
-                break
-        else:
-            for card in self.ai.hand:
-                if card.rank == "3" and card.suit == Suit.DIAMONDS:
-                    self.current_player = self.ai
-                    break
-
-        # Apply equipment effects at fight start
-        for equipment in self.player_equipment:
-            equipment.on_fight_start(self)
-            
-        # Initialize enemy abilities
-        if hasattr(self.ai, 'on_fight_start'):
-            self.ai.on_fight_start(self)
+        self.button_layout = None
+        self.button_hits = HitGrid()  # (kind, index) of skill, item and equipment buttons
+
+        # Screen regions redrawn on their own when what they show changes
+        hand_top = WINDOW_HEIGHT - 250 - CARD_BUMP_OFFSET
+        panel_left = WINDOW_WIDTH - SKILL_CARD_PANEL_WIDTH - TOOLTIP_OVERHANG
+        self.regions = {
+            "ai": pygame.Rect(0, 0, WINDOW_WIDTH, 100 + CARD_HEIGHT),
+            "table": pygame.Rect(0, 100 + CARD_HEIGHT, WINDOW_WIDTH, hand_top - 100 - CARD_HEIGHT),
+            "player": pygame.Rect(0, hand_top, WINDOW_WIDTH, WINDOW_HEIGHT - hand_top),
+            "panel": pygame.Rect(panel_left, 0, WINDOW_WIDTH - panel_left, WINDOW_HEIGHT),
+        }
+        self.region_state = None  # region_keys() at the last redraw, None forces a full one
+        self.profiler = FrameProfiler("fight", self, self.PROFILED_METHODS)
+
+        super().__init__(player_skill_cards=player_skill_cards,
+                         player_items=player_items,
+                         player_equipment=player_equipment,
+                         player_starting_hp=player_starting_hp,
+                         ai_starting_hp=ai_starting_hp,
+                         enemy_type=enemy_type,
+                         enemy_name=enemy_name,
+                         region_modifiers=region_modifiers,
+                         run_manager=run_manager,
+                         preview_player=preview_player,
+                         preview_deck=preview_deck,
+                         rng=rng)
 
     def draw_card(self, card, x, y, show_face=True):
-        # Draw card background
-        if show_face:
-            pygame.draw.rect(self.screen, CARD_COLOR, (x, y, CARD_WIDTH, CARD_HEIGHT))
-            pygame.draw.rect(self.screen, TEXT_COLOR, (x, y, CARD_WIDTH, CARD_HEIGHT), 2)
-
-            # Draw rank
-            color = RED_COLOR if card.suit in [Suit.HEARTS, Suit.DIAMONDS] else BLACK_COLOR
-            rank_text = self.font.render(card.rank, True, color)
-            self.screen.blit(rank_text, (x + 5, y + 5))
-
-            # Draw suit
-            suit_text = self.font.render(card.suit.value, True, color)
-            self.screen.blit(suit_text, (x + 5, y + 25))
-        else:
-            pygame.draw.rect(self.screen, CARD_BACK_COLOR, (x, y, CARD_WIDTH, CARD_HEIGHT))
+        # Pre-rendered face or back
+        self.screen.blit(self.card_faces.face(card) if show_face else self.card_faces.back, (x, y))
 
     def draw_hand(self, player, y_pos, show_cards=True):
         self.player_card_rects = []
@@ -206,6 +125,7 @@ class EnhancedFightGame:
         total_width = num_cards * CARD_WIDTH + (num_cards - 1) * card_spacing
         start_x = margin + (available_width - total_width) // 2
         
+        positions = []
         for i, card in enumerate(player.hand):
             x = start_x + i * (CARD_WIDTH + card_spacing)
             y = y_pos
@@ -214,9 +134,16 @@ class EnhancedFightGame:
             if hasattr(card, 'selected') and card.selected:
                 y -= CARD_BUMP_OFFSET
 
-            self.draw_card(card, x, y, show_cards)
+            positions.append((x, y))
             if show_cards:
                 self.player_card_rects.append((card, pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)))
+        self.card_faces.draw_row(self.screen, player.hand, positions, show_cards)
+
+        if show_cards:
+            layout = [(id(card), rect.topleft) for card, rect in self.player_card_rects]
+            if layout != self.card_layout:
+                self.card_layout = layout
+                self.card_hits = rect_grid(self.player_card_rects)
 
     def draw_button(self, rect, text, hover=False, disabled=False):
         """Draw button using centralized UI utilities"""
@@ -228,7 +155,7 @@ class EnhancedFightGame:
             return
             
         # Draw skill cards section
-        skill_title = self.small_font.render("Skill Cards:", True, TEXT_COLOR)
+        skill_title = render_text(self.small_font, "Skill Cards:", TEXT_COLOR)
         self.screen.blit(skill_title, (WINDOW_WIDTH - SKILL_CARD_PANEL_WIDTH, 100))
         
         self.skill_card_buttons = []
@@ -256,28 +183,11 @@ class EnhancedFightGame:
             can_use = skill_card.can_use(self)
             hover = card_rect.collidepoint(mouse_pos)
             
-            # Try to load and display card image
-            card_image = load_skill_card_image(skill_card.name)
+            # Pre-scaled image, greyed out when unusable and lightened on hover
+            tint = SKILL_CARD_DISABLED_TINT if not can_use else SKILL_CARD_HOVER_TINT if hover else None
+            card_image = get_skill_card_surface(skill_card.name, (card_width, card_height), tint)
             if card_image:
-                # Scale image to fit card size if needed
-                if card_image.get_width() != card_width or card_image.get_height() != card_height:
-                    card_image = pygame.transform.scale(card_image, (card_width, card_height))
-                
-                # Apply effects based on state
-                if not can_use:
-                    # Gray out unusable cards
-                    overlay = pygame.Surface((card_width, card_height))
-                    overlay.fill((100, 100, 100))
-                    overlay.set_alpha(128)
-                    card_image = card_image.copy()
-                    card_image.blit(overlay, (0, 0))
-                elif hover:
-                    # Slight highlight on hover
-                    overlay = pygame.Surface((card_width, card_height))
-                    overlay.fill((255, 255, 255))
-                    overlay.set_alpha(50)
-                    card_image = card_image.copy()
-                    card_image.blit(overlay, (0, 0))
+                if can_use and hover:
                     skill_card.draw_hover_description(self.screen, self.small_font, card_rect, WINDOW_WIDTH, BLACK_COLOR, TEXT_COLOR)
                 
                 self.screen.blit(card_image, card_rect)
@@ -297,10 +207,11 @@ class EnhancedFightGame:
             return
             
         # Draw items section
-        item_title = self.small_font.render("Items:", True, TEXT_COLOR)
+        item_title = render_text(self.small_font, "Items:", TEXT_COLOR)
         self.screen.blit(item_title, (WINDOW_WIDTH - 200, 250))
         
         self.item_buttons = []
+        hovered = None
         for i, item in enumerate(self.player_items):
             y_pos = 280 + i * 30
             button_rect = pygame.Rect(WINDOW_WIDTH - 200, y_pos, 180, 25)
@@ -315,6 +226,13 @@ class EnhancedFightGame:
                 display_text += f" ({item.uses})"
             
             self.draw_button(button_rect, display_text, hover, not can_use)
+            if hover:
+                hovered = (item, button_rect)
+
+        # Description of the hovered item, over the buttons
+        if hovered:
+            item, button_rect = hovered
+            UIUtils.draw_hover_description(self.screen, self.small_font, item.description, button_rect, WINDOW_WIDTH)
 
     def draw_equipment(self):
         """Draw equipped equipment info"""
@@ -322,10 +240,11 @@ class EnhancedFightGame:
             return
             
         # Draw equipment section
-        equip_title = self.small_font.render("Equipment:", True, TEXT_COLOR)
+        equip_title = render_text(self.small_font, "Equipment:", TEXT_COLOR)
         self.screen.blit(equip_title, (WINDOW_WIDTH - 200, 400))
         
         self.equipment_buttons = []
+        hovered = None
         for i, equipment in enumerate(self.player_equipment):
             y_pos = 430 + i * 30
             button_rect = pygame.Rect(WINDOW_WIDTH - 200, y_pos, 180, 25)
@@ -340,6 +259,14 @@ class EnhancedFightGame:
                 display_text += " (Use)"
             
             self.draw_button(button_rect, display_text, hover, not can_use)
+            if hover:
+                hovered = (equipment, button_rect)
+
+        # Description of the hovered equipment, over the buttons
+        if hovered:
+            equipment, button_rect = hovered
+            UIUtils.draw_hover_description(self.screen, self.small_font, equipment.description, button_rect,
+                                           WINDOW_WIDTH)
 
     def draw_game_info(self):
         # Draw HP and LP
@@ -348,17 +275,17 @@ class EnhancedFightGame:
             hp_text += f" | LP: {self.run_manager.run_state.life_points}"
             # Also show fight progress
             fight_text = f"Fight: {self.run_manager.run_state.current_fight + 1}/{self.run_manager.run_state.total_fights}"
-            fight_surface = self.font.render(fight_text, True, CARD_COLOR)
+            fight_surface = render_text(self.font, fight_text, CARD_COLOR)
             self.screen.blit(fight_surface, (20, WINDOW_HEIGHT - 130))
             
-        player_hp_text = self.font.render(hp_text, True, CARD_COLOR)
+        player_hp_text = render_text(self.font, hp_text, CARD_COLOR)
         
         # Show enemy name and type
         enemy_name = getattr(self.ai, 'name', 'AI')
         enemy_type_str = ""
         if hasattr(self.ai, 'enemy_type'):
             enemy_type_str = f" ({self.ai.enemy_type.value.title()})"
-        ai_hp_text = self.font.render(f"{enemy_name}{enemy_type_str} HP: {self.ai.hp}", True, CARD_COLOR)
+        ai_hp_text = render_text(self.font, f"{enemy_name}{enemy_type_str} HP: {self.ai.hp}", CARD_COLOR)
         
         self.screen.blit(player_hp_text, (20, WINDOW_HEIGHT - 100))
         self.screen.blit(ai_hp_text, (20, 20))
@@ -366,19 +293,19 @@ class EnhancedFightGame:
         # Show enemy abilities if any
         if hasattr(self.ai, 'abilities') and self.ai.abilities:
             abilities_text = "Enemy Abilities: " + ", ".join(ability.name for ability in self.ai.abilities[:3])  # Show first 3
-            abilities_surface = self.small_font.render(abilities_text, True, CARD_COLOR)
+            abilities_surface = render_text(self.small_font, abilities_text, CARD_COLOR)
             self.screen.blit(abilities_surface, (20, 50))
         
         # Show banned combo types if any
         if hasattr(self, 'banned_combo_types') and self.banned_combo_types:
             banned_text = "Banned Combos: " + ", ".join(combo_type.name for combo_type in self.banned_combo_types)
-            banned_surface = self.small_font.render(banned_text, True, (255, 100, 100))  # Red text
+            banned_surface = render_text(self.small_font, banned_text, (255, 100, 100))  # Red text
             self.screen.blit(banned_surface, (20, 75))
 
         # Draw last played combo as actual cards
         if self.last_combo:
             # Draw "Last:" label
-            last_label = self.font.render("Last:", True, CARD_COLOR)
+            last_label = render_text(self.font, "Last:", CARD_COLOR)
             self.screen.blit(last_label, (WINDOW_WIDTH // 2 - 150, WINDOW_HEIGHT // 2 - 20))
             
             # Draw the actual cards
@@ -387,27 +314,39 @@ class EnhancedFightGame:
             total_width = num_cards * CARD_WIDTH + (num_cards - 1) * card_spacing
             start_x = WINDOW_WIDTH // 2 - total_width // 2
             
-            for i, card in enumerate(self.last_combo.cards):
-                x = start_x + i * (CARD_WIDTH + card_spacing)
-                y = WINDOW_HEIGHT // 2 + 10
-                self.draw_card(card, x, y, show_face=True)
+            positions = [(start_x + i * (CARD_WIDTH + card_spacing), WINDOW_HEIGHT // 2 + 10) for i in range(num_cards)]
+            self.card_faces.draw_row(self.screen, self.last_combo.cards, positions)
 
         # Draw current player
-        current_text = self.font.render(f"Current: {self.current_player.name}", True, CARD_COLOR)
+        current_text = render_text(self.font, f"Current: {self.current_player.name}", CARD_COLOR)
         self.screen.blit(current_text, (WINDOW_WIDTH // 2 - 50, 20))
 
         # Draw discard pile count
-        discard_text = self.small_font.render(f"Discard: {len(self.discard_pile)}", True, TEXT_COLOR)
+        discard_text = render_text(self.small_font, f"Discard: {len(self.discard_pile)}", TEXT_COLOR)
         self.screen.blit(discard_text, (20, WINDOW_HEIGHT - 30))
 
+    def index_buttons(self):
+        """Rebuild the button hit grid when skill, item or equipment buttons moved"""
+        entries = [((kind, i), rect)
+                   for kind, buttons in ((SKILL, self.skill_card_buttons), (ITEM, self.item_buttons),
+                                         (EQUIPMENT, self.equipment_buttons))
+                   for i, (_, rect) in enumerate(buttons)]
+        if entries != self.button_layout:
+            self.button_layout = entries
+            self.button_hits = rect_grid(entries)
+
+    def button_at(self, mouse_pos):
+        """(kind, skill card/item/equipment) of the button under the mouse, or None"""
+        hit = self.button_hits.hit(mouse_pos)
+        if hit is None:
+            return None
+        kind, i = hit
+        buttons = {SKILL: self.skill_card_buttons, ITEM: self.item_buttons, EQUIPMENT: self.equipment_buttons}[kind]
+        return kind, buttons[i][0]
+
     def handle_card_click(self, mouse_pos):
-        # Find the topmost card that collides with the mouse position
-        # Check cards in reverse order (last drawn = topmost)
-        top_card = None
-        for card, rect in reversed(self.player_card_rects):
-            if rect.collidepoint(mouse_pos):
-                top_card = card
-                break
+        # The grid returns the topmost card (last drawn) at the mouse position
+        top_card = self.card_hits.hit(mouse_pos)
 
         if top_card:
             top_card.selected = not top_card.selected
@@ -415,182 +354,6 @@ class EnhancedFightGame:
     def get_selected_cards(self):
         return [card for card in self.player.hand if card.selected]
 
-    def resort_hand(self, player):
-        """Resort the player's hand after modifications"""
-        player.sort_hand()
-
-    def play_cards(self, player, cards):
-        if not cards:
-            return False
-
-        combo = identify_combo(cards)
-        if not combo:
-            return False
-
-        # Check if combo is banned (for boss abilities)
-        if player == self.player and hasattr(self, 'banned_combo_types'):
-            if combo.type in self.banned_combo_types:
-                return False
-
-        if self.last_combo and not combo.can_beat(self.last_combo):
-            return False
-
-        # Store that a combo was played (for potential damage bonus tracking)
-        if self.last_combo and combo.can_beat(self.last_combo):
-            # Reset damage bonus but don't apply damage here - damage only happens when passing
-            self.last_combo_damage_bonus = 0
-
-        # Remove cards from hand
-        for card in cards:
-            player.hand.remove(card)
-            card.selected = False
-
-        # Add to discard pile
-        self.discard_pile.extend(cards)
-
-        # Update game state
-        self.last_combo = combo
-        self.last_player = player
-
-        # Trigger item effects for straight played
-        if combo.type.name == "STRAIGHT":
-            for item in self.player_items:
-                item.on_trigger(self, "straight_played")
-
-        return True
-
-    def pass_turn(self):
-        if self.last_player != self.current_player:
-            # Base damage for passing
-            damage = 1
-            
-            # Apply damage bonus if there was one accumulated
-            damage += self.last_combo_damage_bonus
-            self.last_combo_damage_bonus = 0  # Reset bonus after applying
-            
-            # Apply equipment damage modification
-            damage = self.take_damage(damage)
-            
-            # Apply damage using take_damage method if available
-            if hasattr(self.current_player, 'take_damage'):
-                self.current_player.take_damage(damage)
-            else:
-                self.current_player.hp -= damage
-
-        # Switch turns
-        self.current_player = self.ai if self.current_player == self.player else self.player
-
-        # If the last player gets the turn back, clear the table
-        if self.last_player == self.current_player:
-            self.last_combo = None
-
-        # Handle extra turns
-        if self.extra_turns > 0:
-            self.extra_turns -= 1
-            self.current_player = self.extra_turn_player
-
-    def take_damage(self, damage: int) -> int:
-        """Take damage, applying equipment effects"""
-        modified_damage = damage
-        
-        # Check if this is first damage
-        if not self.first_damage_taken:
-            self.first_damage_taken = True
-            # Trigger passive items for first damage
-            for item in self.player_items:
-                if item.on_trigger(self, "first_damage"):
-                    return 0  # Damage blocked
-        
-        # Apply equipment effects
-        for equipment in self.player_equipment:
-            modified_damage = equipment.on_damage_taken(self, modified_damage)
-        
-        return modified_damage
-
-    def deal_damage(self, damage: int) -> int:
-        """Deal damage, applying equipment effects"""
-        modified_damage = damage
-        for equipment in self.player_equipment:
-            modified_damage = equipment.on_damage_dealt(self, modified_damage)
-        return modified_damage
-
-    def use_skill_card(self, skill_card: SkillCard) -> bool:
-        """Use a skill card"""
-        if not skill_card.can_use(self):
-            return False
-        
-        success = skill_card.use(self)
-        if success:
-            # Resort hand after skill card use
-            self.resort_hand(self.player)
-            if skill_card.one_time_use:
-                # Find and remove by name instead of instance
-                for i, card in enumerate(self.player_skill_cards):
-                    if card.name == skill_card.name:
-                        self.player_skill_cards.pop(i)
-                        break
-        return success
-
-    def use_item(self, item: Item) -> bool:
-        """Use an active item"""
-        if item.item_type != "Active" or not item.can_use(self):
-            return False
-        
-        success = item.use(self)
-        if success:
-            # Resort hand after item use
-            self.resort_hand(self.player)
-            if item.uses is not None and item.uses <= 0:
-                self.player_items.remove(item)
-        return success
-
-    def use_equipment(self, equipment: Equipment) -> bool:
-        """Use equipment that has a use method (like Gambler's Dice)"""
-        if not hasattr(equipment, 'can_use') or not hasattr(equipment, 'use'):
-            return False
-        
-        if not equipment.can_use(self):
-            return False
-        
-        success = equipment.use(self)
-        if success:
-            # Resort hand after equipment use
-            self.resort_hand(self.player)
-        return success
-
-    def check_game_over(self):
-        if len(self.player.hand) == 0:
-            self.game_over = True
-            self.winner = self.player
-        elif len(self.ai.hand) == 0:
-            self.game_over = True
-            self.winner = self.ai
-        elif self.player.hp <= 0:
-            self.game_over = True
-            self.winner = self.ai
-        elif self.ai.hp <= 0:
-            self.game_over = True
-            self.winner = self.player
-
-    def ai_turn(self):
-        if self.current_player != self.ai or self.game_over:
-            return
-
-        # Trigger enemy's turn start effects
-        if hasattr(self.ai, 'on_turn_start'):
-            self.ai.on_turn_start(self)
-
-        # AI chooses play
-        combo = self.ai.choose_play(
-            self.last_combo,
-            self,  # Pass the game object instead of a dictionary
-        )
-        if combo:
-            self.play_cards(self.ai, combo.cards)
-            self.current_player = self.player
-        else:
-            self.pass_turn()
-
     def draw(self):
         self.screen.fill(BG_COLOR)
 
@@ -605,6 +368,7 @@ class EnhancedFightGame:
         self.draw_skill_cards()
         self.draw_items()
         self.draw_equipment()
+        self.index_buttons()
 
         # Draw buttons (only for player turn)
         if self.current_player == self.player and not self.game_over:
@@ -612,9 +376,11 @@ class EnhancedFightGame:
             self.draw_button(self.play_button, "Play", self.play_button.collidepoint(mouse_pos))
             self.draw_button(self.pass_button, "Pass", self.pass_button.collidepoint(mouse_pos))
             self.draw_button(self.suggest_button, "Suggest", self.suggest_button.collidepoint(mouse_pos))
+            self.draw_button(self.undo_button, "Undo", self.undo_button.collidepoint(mouse_pos),
+                             disabled=not self.undo_stack)
         # Draw game over
         if self.game_over:
-            winner_text = self.big_font.render(f"{self.winner.name} Wins!", True, CARD_COLOR)
+            winner_text = render_text(self.big_font, f"{self.winner.name} Wins!", CARD_COLOR)
             text_rect = winner_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
             self.screen.blit(winner_text, text_rect)
             # Show 'Back to Map' button if player lost
@@ -625,11 +391,113 @@ class EnhancedFightGame:
                 self.back_to_map_button = button_rect
 
         # Card count
-        player_count = self.font.render(f"Cards: {len(self.player.hand)}", True, CARD_COLOR)
-        ai_count = self.font.render(f"Cards: {len(self.ai.hand)}", True, CARD_COLOR)
+        player_count = render_text(self.font, f"Cards: {len(self.player.hand)}", CARD_COLOR)
+        ai_count = render_text(self.font, f"Cards: {len(self.ai.hand)}", CARD_COLOR)
         self.screen.blit(player_count, (20, WINDOW_HEIGHT - 50))
         self.screen.blit(ai_count, (20, 50))
 
+    def region_keys(self) -> Dict[str, tuple]:
+        """What each region shows, hover included; a region is redrawn when its key changes"""
+        mouse_pos = pygame.mouse.get_pos()
+        your_turn = self.current_player == self.player and not self.game_over
+        last_cards = tuple((card.rank, card.suit) for card in self.last_combo.cards) if self.last_combo else ()
+        run_state = self.run_manager.run_state if self.run_manager else None
+        action_buttons = (self.play_button, self.pass_button, self.suggest_button, self.undo_button)
+        back_button = getattr(self, 'back_to_map_button', None)
+        return {
+            "ai": (self.ai.hp, len(self.ai.hand), self.current_player.name,
+                   tuple(ability.name for ability in getattr(self.ai, 'abilities', None) or ()),
+                   tuple(getattr(self, 'banned_combo_types', None) or ())),
+            "table": (last_cards, self.game_over, self.winner.name if self.winner else None,
+                      bool(back_button and back_button.collidepoint(mouse_pos))),
+            "player": (tuple((card.rank, card.suit, getattr(card, 'selected', False)) for card in self.player.hand),
+                       self.player.hp, run_state and (run_state.life_points, run_state.current_fight),
+                       len(self.discard_pile), your_turn, bool(self.undo_stack),
+                       your_turn and next((i for i, rect in enumerate(action_buttons)
+                                           if rect.collidepoint(mouse_pos)), None)),
+            "panel": (tuple((card.name, card.can_use(self)) for card in self.player_skill_cards or ()),
+                      tuple((item.name, item.uses, item.item_type == "Active" and item.can_use(self))
+                            for item in self.player_items or ()),
+                      tuple((equipment.name, hasattr(equipment, 'can_use') and equipment.can_use(self))
+                            for equipment in self.player_equipment or ()),
+                      self.button_hits.hit(mouse_pos)),
+        }
+
+    def present(self):
+        """Redraw the regions whose keys changed and update only those parts of the display"""
+        keys = self.region_keys()
+        if self.region_state is None:
+            self.draw()
+            if self.profiler.enabled:
+                self.profiler.draw_overlay(self.screen)
+            pygame.display.flip()
+        else:
+            dirty = [self.regions[name] for name, key in keys.items() if key != self.region_state[name]]
+            if self.profiler.enabled:
+                dirty.append(OVERLAY_RECT)  # Redrawn every frame
+            for rect in dirty:
+                # draw() is cheap with a clip: blits outside the region are skipped
+                self.screen.set_clip(rect)
+                self.draw()
+            self.screen.set_clip(None)
+            if self.profiler.enabled:
+                self.profiler.draw_overlay(self.screen)
+            if dirty:
+                pygame.display.update(dirty)
+        self.region_state = keys
+
+    def wait_events(self) -> list:
+        """Pending events; while waiting on the player, sleep until one arrives"""
+        events = pygame.event.get()
+        waiting = self.game_over or self.current_player == self.player
+        if events or not waiting or self.region_state is None:
+            return events
+        return [pygame.event.wait(IDLE_WAIT_MS)] + pygame.event.get()
+
+    def handle_event(self, event) -> bool:
+        """Handle one input event; False once the fight screen should close"""
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.region_state = None
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            # Skill and item effects can change anything on screen
+            self.region_state = None
+            if event.button == 1:  # Left click
+                mouse_pos = pygame.mouse.get_pos()
+
+                # If game over and player lost, handle Back to Map button
+                if self.game_over and self.winner != self.player and hasattr(self, 'back_to_map_button'):
+                    if self.back_to_map_button.collidepoint(mouse_pos):
+                        return False
+
+                # Check card clicks
+                self.handle_card_click(mouse_pos)
+
+                # Check skill card, item and equipment clicks
+                button = self.button_at(mouse_pos)
+                if button:
+                    kind, target = button
+                    self.player_action(FightAction(kind, target=target))
+
+                # Check button clicks
+                if self.current_player == self.player and not self.game_over:
+                    if self.play_button.collidepoint(mouse_pos):
+                        self.player_action(FightAction(PLAY, self.get_selected_cards()))
+                    elif self.pass_button.collidepoint(mouse_pos):
+                        self.player_action(FightAction(PASS))
+                    elif self.suggest_button.collidepoint(mouse_pos):
+                        self.suggest_best_play()
+                    elif self.undo_button.collidepoint(mouse_pos):
+                        self.undo()
+        elif event.type == pygame.KEYDOWN:
+            self.region_state = None
+            if self.profiler.handle_key(event):
+                return True
+            if event.key == pygame.K_z and event.mod & pygame.KMOD_CTRL:
+                self.undo()
+        return True
+
     def run(self):
         running = True
 
@@ -638,52 +506,11 @@ class EnhancedFightGame:
             if self.game_over and self.winner == self.player:
                 running = False
                 continue
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            events = self.wait_events()
+            self.profiler.begin_frame()
+            for event in events:
+                if not self.handle_event(event):
                     running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:  # Left click
-                        mouse_pos = pygame.mouse.get_pos()
-
-                        # If game over and player lost, handle Back to Map button
-                        if self.game_over and self.winner != self.player and hasattr(self, 'back_to_map_button'):
-                            if self.back_to_map_button.collidepoint(mouse_pos):
-                                running = False
-                                continue
-
-                        # Check card clicks
-                        self.handle_card_click(mouse_pos)
-
-                        # Check skill card clicks
-                        for skill_card, button_rect in self.skill_card_buttons:
-                            if button_rect.collidepoint(mouse_pos):
-                                self.use_skill_card(skill_card)
-                                break
-
-                        # Check item clicks
-                        for item, button_rect in self.item_buttons:
-                            if button_rect.collidepoint(mouse_pos):
-                                self.use_item(item)
-                                break
-
-                        # Check equipment clicks
-                        if hasattr(self, 'equipment_buttons'):
-                            for equipment, button_rect in self.equipment_buttons:
-                                if button_rect.collidepoint(mouse_pos):
-                                    self.use_equipment(equipment)
-                                    break
-
-                        # Check button clicks
-                        if self.current_player == self.player and not self.game_over:
-                            if self.play_button.collidepoint(mouse_pos):
-                                selected = self.get_selected_cards()
-                                if self.play_cards(self.player, selected):
-                                    self.current_player = self.ai
-
-                            elif self.pass_button.collidepoint(mouse_pos):
-                                self.pass_turn()
-                            elif self.suggest_button.collidepoint(mouse_pos):
-                                self.suggest_best_play()
 
             # AI turn
             self.ai_turn()
@@ -691,13 +518,33 @@ class EnhancedFightGame:
             # Check game over
             self.check_game_over()
 
-            # Draw everything
-            self.draw()
-            pygame.display.flip()
+            # Start working on the hint as soon as the player's turn begins
+            if self.current_player == self.player and not self.game_over:
+                self.hint_engine.prefetch(self)
+
+            # Redraw what changed
+            self.present()
+            self.profiler.end_frame()
             self.clock.tick(FPS)
 
         return self.winner
     
+    def player_action(self, action: FightAction) -> bool:
+        """Step a player action, remembering the position before it for undo"""
+        state = self.snapshot()
+        success = self.step(action)
+        if success:
+            self.undo_stack.append(state)
+            del self.undo_stack[:-UNDO_LIMIT]
+        return success
+
+    def undo(self) -> bool:
+        """Take back the last player action, including the AI's reply to it"""
+        if not self.undo_stack or self.current_player != self.player or self.game_over:
+            return False
+        self.restore(self.undo_stack.pop())
+        return True
+
     def suggest_best_play(self):
         """Suggest the best play for the current player"""
         if self.current_player != self.player:
@@ -714,12 +561,16 @@ class EnhancedFightGame:
         if not valid_plays:
             return  # No valid plays, player must pass
         
-        # Choose the best play using smart logic
-        best_play = self.choose_best_play_for_suggestion(valid_plays)
+        # Ask the search engine (cached per position, None means pass)
+        try:
+            best_cards = self.hint_engine.suggest(self)
+        except HintUnavailable:
+            best_play = self.choose_best_play_for_suggestion(valid_plays)
+            best_cards = best_play.cards if best_play else None
         
-        if best_play:
+        if best_cards:
             # Select the cards in the best play
-            for card in best_play.cards:
+            for card in best_cards:
                 card.selected = True
     
     def choose_best_play_for_suggestion(self, valid_plays):
@@ -771,4 +622,4 @@ class EnhancedFightGame:
                 
                 # Return the highest scoring play
                 best_play = max(scored_plays, key=lambda x: x[0])[1]
-                return best_play
\ No newline at end of file
+                return best_play
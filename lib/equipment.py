@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional, Any
 from lib.core_types import EquipmentTier
+from lib.rng import rng_stream
 
 
 @dataclass
@@ -96,8 +97,8 @@ class QuickFingers(Equipment):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand')):
             return False
             
-        import random
-        stolen_card = random.choice(game_state.ai.hand)
+        rng = rng_stream(game_state, "effects")
+        stolen_card = rng.choice(game_state.ai.hand)
         
         # Add to player hand
         game_state.player.hand.append(stolen_card)
@@ -131,8 +132,8 @@ class LuckyCoin(Equipment):
     
     def on_damage_taken(self, game_state: Any, damage: int) -> int:
         if not self.first_damage_blocked:
-            import random
-            if random.random() < 0.25:  # 25% chance
+            rng = rng_stream(game_state, "effects")
+            if rng.random() < 0.25:  # 25% chance
                 self.first_damage_blocked = True
                 return 0  # Block the damage
         return damage
@@ -195,9 +196,9 @@ class GamblersDice(Equipment):
         game_state.player.hand.clear()
         
         # Draw same number of random cards
-        import random
+        rng = rng_stream(game_state, "effects")
         if len(game_state.discard_pile) > 0:
-            drawn_cards = random.sample(
+            drawn_cards = rng.sample(
                 game_state.discard_pile, 
                 min(hand_size, len(game_state.discard_pile))
             )
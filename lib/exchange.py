@@ -8,7 +8,8 @@ from lib.core_types import Rarity
 class ExchangeNode:
     """Handles exchange functionality: 2 cards/items for 1 rare card/item"""
     
-    def __init__(self):
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng or random.Random()
         self.name = "Exchange Node"
         self.description = "Trade 2 cards for 1 rare card, or 2 items for 1 rare item"
     
@@ -55,7 +56,7 @@ class ExchangeNode:
             player_skill_cards.remove(card_name)
         
         # Give a random rare card
-        rare_card = random.choice(rare_cards)
+        rare_card = self.rng.choice(rare_cards)
         return rare_card
     
     def exchange_items(self, player_items: List[str], 
@@ -79,7 +80,7 @@ class ExchangeNode:
             player_items.remove(item_name)
         
         # Give a random rare item
-        rare_item = random.choice(rare_items)
+        rare_item = self.rng.choice(rare_items)
         return rare_item
     
     def get_exchange_options(self, player_skill_cards: List[str], 
@@ -0,0 +1,78 @@
+"""
+Compact position encoding shared by self-play, training and learned evaluators.
+A position is stored as one uint8 row: both hands as rank histograms, both HPs
+and the combo on the table. Network features are computed from batches of rows.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+from lib.search import rank_counts
+
+NUM_RANKS = 15  # 3 .. Red Joker
+NUM_COMBO_TYPES = 13
+
+# Raw row layout
+OWN_COUNTS = slice(0, NUM_RANKS)
+OPP_COUNTS = slice(NUM_RANKS, 2 * NUM_RANKS)
+OWN_HP = 2 * NUM_RANKS
+OPP_HP = OWN_HP + 1
+TABLE_TYPE = OPP_HP + 1  # 0 when the table is empty
+TABLE_LEAD = TABLE_TYPE + 1
+TABLE_LENGTH = TABLE_LEAD + 1
+ROW_SIZE = TABLE_LENGTH + 1
+
+FEATURE_SIZE = 2 * NUM_RANKS + 2 + 2 + (NUM_COMBO_TYPES + 1) + 2
+
+# Normalisers
+MAX_HAND = 23.0
+MAX_HP = 10.0
+MAX_VALUE = 17.0
+MAX_COMBO_LENGTH = 20.0
+
+
+def table_fields(last_combo) -> Tuple[int, int, int]:
+    """(type, lead value, length) of the combo on the table, zeros when empty"""
+    if last_combo is None:
+        return (0, 0, 0)
+    return (last_combo.type.value, last_combo.lead_value, len(last_combo.cards))
+
+
+def encode_counts(own_counts, opp_counts, own_hp, opp_hp, table) -> List[int]:
+    """Raw row from precomputed rank histograms"""
+    return list(own_counts) + list(opp_counts) + [max(0, min(255, own_hp)), max(0, min(255, opp_hp))] + list(table)
+
+
+def encode_position(own_hand, opp_hand, own_hp, opp_hp, last_combo) -> List[int]:
+    """Raw row for a position seen by the side to move"""
+    return encode_counts(rank_counts(own_hand), rank_counts(opp_hand), own_hp, opp_hp, table_fields(last_combo))
+
+
+def encode_batch(positions) -> np.ndarray:
+    """Raw rows for (own_hand, opp_hand, own_hp, opp_hp, last_combo) positions"""
+    return np.array([encode_position(*position) for position in positions], dtype=np.uint8).reshape(-1, ROW_SIZE)
+
+
+def features_from_rows(rows: np.ndarray) -> np.ndarray:
+    """Float32 network input for a batch of raw rows"""
+    rows = np.asarray(rows, dtype=np.float32)
+    n = rows.shape[0]
+    out = np.empty((n, FEATURE_SIZE), dtype=np.float32)
+    own = rows[:, OWN_COUNTS]
+    opp = rows[:, OPP_COUNTS]
+    out[:, OWN_COUNTS] = own / 4.0
+    out[:, OPP_COUNTS] = opp / 4.0
+    col = 2 * NUM_RANKS
+    out[:, col] = own.sum(axis=1) / MAX_HAND
+    out[:, col + 1] = opp.sum(axis=1) / MAX_HAND
+    out[:, col + 2] = rows[:, OWN_HP] / MAX_HP
+    out[:, col + 3] = rows[:, OPP_HP] / MAX_HP
+    col += 4
+    one_hot = np.zeros((n, NUM_COMBO_TYPES + 1), dtype=np.float32)
+    one_hot[np.arange(n), rows[:, TABLE_TYPE].astype(np.int64)] = 1.0
+    out[:, col:col + NUM_COMBO_TYPES + 1] = one_hot
+    col += NUM_COMBO_TYPES + 1
+    out[:, col] = rows[:, TABLE_LEAD] / MAX_VALUE
+    out[:, col + 1] = rows[:, TABLE_LENGTH] / MAX_COMBO_LENGTH
+    return out
@@ -0,0 +1,491 @@
+"""
+Fight rules without rendering.
+FightEngine owns the deal, turn order, plays, passing damage and the skill card,
+item and equipment hooks. It is stepped by explicit actions, so AI-vs-AI fights
+run at CPU speed; EnhancedFightGame renders and drives it with pygame.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Any, Callable
+
+from lib.core_types import Card, Suit
+from lib.combo import identify_combo
+from lib.player import FightPlayer
+from lib.enemies import EnemyType, get_enemy
+from lib.skill_cards import get_skill_card, SkillCard
+from lib.items import get_item, Item
+from lib.equipment import get_equipment, Equipment
+from lib.search_stats import get_recorder
+from lib.rng import RngContext
+from lib.deal import deal_cards
+from lib.fight_state import FightState, CardRegistry, snapshot, restore
+from lib.replay_log import SKILL as REPLAY_SKILL, ITEM as REPLAY_ITEM, EQUIPMENT as REPLAY_EQUIPMENT
+
+# Action kinds
+PLAY = "play"
+PASS = "pass"
+SKILL = "skill"
+ITEM = "item"
+EQUIPMENT = "equipment"
+
+MAX_DECISIONS = 1000  # Safety cap for play_out
+
+
+@dataclass
+class FightAction:
+    """One player action: play cards, pass, or use a skill card, item or equipment"""
+    kind: str
+    cards: Optional[List[Card]] = None
+    target: Any = None
+
+
+class FightEngine:
+    def __init__(self,
+                 player_skill_cards: List[str] = None,
+                 player_items: List[str] = None,
+                 player_equipment: List[str] = None,
+                 player_starting_hp: int = 5,
+                 ai_starting_hp: int = 5,
+                 enemy_type: EnemyType = EnemyType.REGULAR,
+                 enemy_name: str = None,
+                 region_modifiers: Dict[str, Any] = None,
+                 run_manager = None,
+                 preview_player = None,
+                 preview_deck = None,
+                 player = None,
+                 ai = None,
+                 rng: RngContext = None,
+                 replay_log = None,
+                 ai_search_budget_ms: float = None,
+                 ai_search_nodes: int = None):
+        # Deal, enemy, effects and AI each draw from their own seeded stream
+        self.rng = rng or RngContext()
+
+        # Initialize players
+        self.player = player or FightPlayer("Player")
+        self.ai = ai or get_enemy(enemy_type, enemy_name, rng=self.rng.enemy)
+        for fighter in (self.player, self.ai):
+            if hasattr(fighter, 'rng'):
+                fighter.rng = self.rng.ai
+        if ai_search_budget_ms and hasattr(self.ai, 'search_budget_ms'):
+            self.ai.search_budget_ms = ai_search_budget_ms
+        if ai_search_nodes and hasattr(self.ai, 'search_nodes'):
+            self.ai.search_nodes = ai_search_nodes  # Takes over from the time budget
+        self.current_player = None
+        self.last_combo = None
+        self.last_player = None
+
+        # Game state
+        self.game_over = False
+        self.winner = None
+        self.discard_pile = []
+        self.played_cards = []  # Cards played to the table this fight
+        self.card_registry = CardRegistry()  # Card ids for snapshots
+        self.replay_log = replay_log  # lib.replay_log.ReplayWriter
+        self.decisions = 0  # Turns taken in play_out
+
+        # Roguelike systems
+        self.player_skill_cards = []
+        self.player_items = []
+        self.player_equipment = []
+        self.region_modifiers = region_modifiers or {}
+        self.run_manager = run_manager
+        self.preview_player = preview_player
+        self.preview_deck = preview_deck
+        
+        # Initialize starting HP
+        self.player.hp = player_starting_hp
+        # Enemy HP is set by its own max_hp, but can be overridden
+        if ai_starting_hp != 5:  # If non-default HP specified, use it
+            self.ai.hp = ai_starting_hp
+            self.ai.max_hp = ai_starting_hp
+
+        # Load skill cards, items, and equipment
+        if player_skill_cards:
+            for card_name in player_skill_cards:
+                skill_card = get_skill_card(card_name)
+                if skill_card:
+                    self.player_skill_cards.append(skill_card)
+        
+        if player_items:
+            for item_name in player_items:
+                item = get_item(item_name)
+                if item:
+                    self.player_items.append(item)
+        
+        if player_equipment:
+            for equipment_name in player_equipment:
+                equipment = get_equipment(equipment_name)
+                if equipment:
+                    self.player_equipment.append(equipment)
+                    # Apply equipment effects
+                    equipment.on_equip(self)
+
+        # Game state tracking
+        self.extra_turns = 0
+        self.extra_turn_player = None
+        self.last_combo_damage_bonus = 0
+        self.first_damage_taken = False
+
+        if self.replay_log:
+            self.replay_log.begin_fight(self.rng.seed, {
+                "skill_cards": list(player_skill_cards or []),
+                "items": list(player_items or []),
+                "equipment": list(player_equipment or []),
+                "player_hp": player_starting_hp,
+                "ai_hp": ai_starting_hp,
+                "enemy_type": enemy_type.value,
+                "enemy_name": enemy_name,
+                "enemy": self.ai.name,
+            })
+
+        self.init_game()
+
+    def side_of(self, player) -> int:
+        """0 for the player, 1 for the AI (replay log sides)"""
+        return 0 if player == self.player else 1
+
+    def init_game(self):
+        # Remember where this fight's search records start
+        self.search_stats_mark = get_recorder().mark()
+        self.played_cards = []
+
+        # Use pre-dealt cards if available
+        if self.preview_player and self.preview_deck:
+            # Use pre-dealt hand from preview
+            self.player.hand = self.preview_player.hand
+            # Deal AI hand from remaining deck
+            self.ai.hand = self.preview_deck[23:]
+            # Set discard pile (first 8 cards were already discarded during preview)
+            self.discard_pile = []
+        else:
+            # Shuffle and deal: 8 discarded, 23 each
+            deal = deal_cards(self.rng.deal)
+            self.discard_pile = deal.discard
+            self.player.hand = deal.player
+            self.ai.hand = deal.ai
+
+        self.player.sort_hand()
+        self.ai.sort_hand()
+        if self.replay_log:
+            self.replay_log.deal(self.player.hand, self.ai.hand, self.discard_pile)
+
+        # Player with 3♦ starts
+        self.current_player = self.player
+        for card in self.player.hand:
+            if card.rank == "3" and card.suit == Suit.DIAMONDS:
+                self.current_player = self.player
+                break
+        else:
+            for card in self.ai.hand:
+                if card.rank == "3" and card.suit == Suit.DIAMONDS:
+                    self.current_player = self.ai
+                    break
+
+        # Apply equipment effects at fight start
+        for equipment in self.player_equipment:
+            equipment.on_fight_start(self)
+            
+        # Initialize enemy abilities
+        if hasattr(self.ai, 'on_fight_start'):
+            self.ai.on_fight_start(self)
+
+    def resort_hand(self, player):
+        """Resort the player's hand after modifications"""
+        player.sort_hand()
+
+    def play_cards(self, player, cards):
+        if not cards:
+            return False
+
+        combo = identify_combo(cards)
+        if not combo:
+            return False
+
+        # Check if combo is banned (for boss abilities)
+        if player == self.player and hasattr(self, 'banned_combo_types'):
+            if combo.type in self.banned_combo_types:
+                return False
+
+        if self.last_combo and not combo.can_beat(self.last_combo):
+            return False
+
+        # Store that a combo was played (for potential damage bonus tracking)
+        if self.last_combo and combo.can_beat(self.last_combo):
+            # Reset damage bonus but don't apply damage here - damage only happens when passing
+            self.last_combo_damage_bonus = 0
+
+        # Remove cards from hand
+        for card in cards:
+            player.hand.remove(card)
+            card.selected = False
+
+        # Add to discard pile
+        self.discard_pile.extend(cards)
+        self.played_cards.extend(cards)
+
+        # Update game state
+        self.last_combo = combo
+        self.last_player = player
+        if self.replay_log:
+            self.replay_log.play(self.side_of(player), cards)
+
+        # Trigger item effects for straight played
+        if combo.type.name == "STRAIGHT":
+            for item in self.player_items:
+                item.on_trigger(self, "straight_played")
+
+        return True
+
+    def pass_turn(self):
+        if self.replay_log:
+            self.replay_log.pass_turn(self.side_of(self.current_player))
+        if self.last_player != self.current_player:
+            # Base damage for passing
+            damage = 1
+            
+            # Apply damage bonus if there was one accumulated
+            damage += self.last_combo_damage_bonus
+            self.last_combo_damage_bonus = 0  # Reset bonus after applying
+            
+            # Apply equipment damage modification
+            damage = self.take_damage(damage)
+            
+            # Apply damage using take_damage method if available
+            if hasattr(self.current_player, 'take_damage'):
+                self.current_player.take_damage(damage)
+            else:
+                self.current_player.hp -= damage
+            if self.replay_log:
+                self.replay_log.damage(self.side_of(self.current_player), damage, self.current_player.hp)
+
+        # Switch turns
+        self.current_player = self.ai if self.current_player == self.player else self.player
+
+        # If the last player gets the turn back, clear the table
+        if self.last_player == self.current_player:
+            self.last_combo = None
+
+        # Handle extra turns
+        if self.extra_turns > 0:
+            self.extra_turns -= 1
+            self.current_player = self.extra_turn_player
+
+    def take_damage(self, damage: int) -> int:
+        """Take damage, applying equipment effects"""
+        modified_damage = damage
+        
+        # Check if this is first damage
+        if not self.first_damage_taken:
+            self.first_damage_taken = True
+            # Trigger passive items for first damage
+            for item in self.player_items:
+                if item.on_trigger(self, "first_damage"):
+                    return 0  # Damage blocked
+        
+        # Apply equipment effects
+        for equipment in self.player_equipment:
+            modified_damage = equipment.on_damage_taken(self, modified_damage)
+        
+        return modified_damage
+
+    def deal_damage(self, damage: int) -> int:
+        """Deal damage, applying equipment effects"""
+        modified_damage = damage
+        for equipment in self.player_equipment:
+            modified_damage = equipment.on_damage_dealt(self, modified_damage)
+        return modified_damage
+
+    def use_skill_card(self, skill_card: SkillCard) -> bool:
+        """Use a skill card"""
+        if not skill_card.can_use(self):
+            return False
+        
+        if self.replay_log:
+            self.replay_log.use(REPLAY_SKILL, 0, skill_card.name)
+        success = skill_card.use(self)
+        if success:
+            # Resort hand after skill card use
+            self.resort_hand(self.player)
+            if skill_card.one_time_use:
+                # Find and remove by name instead of instance
+                for i, card in enumerate(self.player_skill_cards):
+                    if card.name == skill_card.name:
+                        self.player_skill_cards.pop(i)
+                        break
+        return success
+
+    def use_item(self, item: Item) -> bool:
+        """Use an active item"""
+        if item.item_type != "Active" or not item.can_use(self):
+            return False
+        
+        if self.replay_log:
+            self.replay_log.use(REPLAY_ITEM, 0, item.name)
+        success = item.use(self)
+        if success:
+            # Resort hand after item use
+            self.resort_hand(self.player)
+            if item.uses is not None and item.uses <= 0:
+                self.player_items.remove(item)
+        return success
+
+    def use_equipment(self, equipment: Equipment) -> bool:
+        """Use equipment that has a use method (like Gambler's Dice)"""
+        if not hasattr(equipment, 'can_use') or not hasattr(equipment, 'use'):
+            return False
+        
+        if not equipment.can_use(self):
+            return False
+        
+        if self.replay_log:
+            self.replay_log.use(REPLAY_EQUIPMENT, 0, equipment.name)
+        success = equipment.use(self)
+        if success:
+            # Resort hand after equipment use
+            self.resort_hand(self.player)
+        return success
+
+    def check_game_over(self):
+        was_over = self.game_over
+        self._check_game_over()
+        if self.game_over and not was_over and self.replay_log:
+            self.replay_log.end(self.side_of(self.winner))
+
+    def _check_game_over(self):
+        if len(self.player.hand) == 0:
+            self.game_over = True
+            self.winner = self.player
+        elif len(self.ai.hand) == 0:
+            self.game_over = True
+            self.winner = self.ai
+        elif self.player.hp <= 0:
+            self.game_over = True
+            self.winner = self.ai
+        elif self.ai.hp <= 0:
+            self.game_over = True
+            self.winner = self.player
+
+    def search_report(self) -> str:
+        """Histogram report of the AI search decisions made in this fight"""
+        return get_recorder().dump(since=self.search_stats_mark)
+
+    def snapshot(self) -> FightState:
+        """Immutable copy of the current position (see lib.fight_state)"""
+        return snapshot(self, self.card_registry)
+
+    def restore(self, state: FightState):
+        """Return to a position taken with snapshot()"""
+        restore(self, state, self.card_registry)
+
+    def ai_turn(self):
+        if self.current_player != self.ai or self.game_over:
+            return
+
+        # Trigger enemy's turn start effects
+        if hasattr(self.ai, 'on_turn_start'):
+            if self.replay_log:
+                self.replay_log.turn_start(1)
+            self.ai.on_turn_start(self)
+
+        # AI chooses play
+        combo = self.ai.choose_play(
+            self.last_combo,
+            self,  # Pass the game object instead of a dictionary
+        )
+        if combo:
+            self.play_cards(self.ai, combo.cards)
+            self.current_player = self.player
+        else:
+            self.pass_turn()
+
+
+    def other_player(self, player):
+        return self.ai if player == self.player else self.player
+
+    def valid_plays(self, player=None):
+        """Plays the given (default: current) player may make, respecting banned combos"""
+        player = player or self.current_player
+        plays = player.find_valid_plays(self.last_combo)
+        if player == self.player and getattr(self, 'banned_combo_types', None):
+            plays = [play for play in plays if play.type not in self.banned_combo_types]
+        return plays
+
+    def step(self, action: FightAction) -> bool:
+        """Apply one action. Plays and passes are made by the current player. Returns True if it was accepted."""
+        if self.game_over:
+            return False
+        if action.kind == PLAY:
+            success = self.play_cards(self.current_player, action.cards)
+            if success:
+                self.current_player = self.other_player(self.current_player)
+        elif action.kind == PASS:
+            self.pass_turn()
+            success = True
+        elif action.kind == SKILL:
+            success = self.use_skill_card(action.target)
+        elif action.kind == ITEM:
+            success = self.use_item(action.target)
+        elif action.kind == EQUIPMENT:
+            success = self.use_equipment(action.target)
+        else:
+            return False
+        self.check_game_over()
+        return success
+
+    def play_out(self, player_policy: Callable, ai_policy: Callable = None,
+                 max_decisions: int = MAX_DECISIONS):
+        """Run the fight to the end. Policies map the engine to a FightAction; the AI
+        side uses its own choose_play when ai_policy is None. Returns the winner."""
+        self.decisions = 0
+        while not self.game_over and self.decisions < max_decisions:
+            if self.current_player == self.player or ai_policy is not None:
+                policy = player_policy if self.current_player == self.player else ai_policy
+                if not self.step(policy(self)):
+                    self.step(FightAction(PASS))  # Illegal actions forfeit the turn
+            else:
+                self.ai_turn()
+                self.check_game_over()
+            self.decisions += 1
+        return self.winner
+
+
+def combo_policy(choose: Callable) -> Callable:
+    """Adapt a (player, opponent, last_combo) -> combo or None policy to engine actions"""
+    def policy(engine):
+        player = engine.current_player
+        combo = choose(player, engine.other_player(player), engine.last_combo)
+        if combo is None:
+            return FightAction(PASS)
+        if player == engine.player and combo.type in getattr(engine, 'banned_combo_types', ()):
+            return smallest_play_policy(engine)  # The policy does not know about bans
+        return FightAction(PLAY, combo.cards)
+    return policy
+
+
+def smallest_play_policy(engine) -> FightAction:
+    """Cheap baseline: the smallest legal play, passing only when there is none"""
+    plays = engine.valid_plays()
+    if not plays:
+        return FightAction(PASS)
+    return FightAction(PLAY, min(plays, key=lambda p: (len(p.cards), p.lead_value)).cards)
+
+
+def benchmark_fights(num_fights: int = 100, player_policy: Callable = smallest_play_policy,
+                     ai_policy: Callable = None, seed: Optional[int] = None, **engine_kwargs) -> Dict[str, float]:
+    """Play headless fights back to back and report fights per second"""
+    rng = RngContext(seed)
+    wins = 0
+    start = time.perf_counter()
+    for i in range(num_fights):
+        engine = FightEngine(rng=rng.spawn(i), **engine_kwargs)
+        if engine.play_out(player_policy, ai_policy) == engine.player:
+            wins += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "fights": num_fights,
+        "seconds": elapsed,
+        "fights_per_sec": num_fights / elapsed if elapsed else 0.0,
+        "player_win_rate": wins / num_fights if num_fights else 0.0,
+    }
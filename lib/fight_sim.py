@@ -0,0 +1,181 @@
+"""
+Batch fight simulation without the GUI.
+Runs many FightEngine fights between a player policy with a loadout and an
+enemy from the registries, spread over a process pool, and streams one result
+dictionary per fight.
+"""
+
+import io
+import os
+import time
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Iterator
+
+from lib.enemies import EnemyType, REGULAR_ENEMIES, ELITE_ENEMIES, BOSS_ENEMIES
+from lib.fight_engine import FightEngine, FightAction, SKILL, ITEM, combo_policy, smallest_play_policy
+from lib.player import AI_SEARCH_NODES
+from lib.rng import RngContext
+
+CHUNK_SIZE = 10  # Fights per worker task, so process overhead stays small
+SEARCH_NODES = 700  # Node budget of the search policy, about 20 ms of search
+
+
+@dataclass
+class FightConfig:
+    """Everything a worker needs to set up one simulated fight"""
+    policy: str = "smallest"
+    enemy_name: Optional[str] = None
+    enemy_type: str = "regular"
+    skill_cards: List[str] = field(default_factory=list)
+    items: List[str] = field(default_factory=list)
+    equipment: List[str] = field(default_factory=list)
+    player_hp: int = 5
+    use_loadout: bool = True
+    # Search budgets. Node budgets make results reproducible across runs, worker counts and
+    # machines; with a node budget of 0 the wall-clock budget applies instead.
+    search_nodes: int = SEARCH_NODES  # Search player policy
+    enemy_search_nodes: int = AI_SEARCH_NODES  # Searching enemies, in this fight only
+    search_budget_ms: float = 20
+    enemy_search_budget_ms: Optional[float] = None  # None keeps the enemy's AI_SEARCH_BUDGET_MS
+    log_dir: Optional[str] = None  # Write binary replay logs (lib.replay_log) here, one file per chunk
+
+
+def loadout_key(config: FightConfig) -> str:
+    """Skill cards, items and equipment as one sortable string (groups results in lib.analytics)"""
+    return ";".join(",".join(sorted(names)) for names in (config.skill_cards, config.items, config.equipment))
+
+
+def find_enemy_type(name: str) -> Optional[EnemyType]:
+    """Registry an enemy name belongs to"""
+    for enemy_type, registry in [(EnemyType.REGULAR, REGULAR_ENEMIES), (EnemyType.ELITE, ELITE_ENEMIES),
+                                 (EnemyType.BOSS, BOSS_ENEMIES)]:
+        if name in registry:
+            return enemy_type
+    return None
+
+
+class LoadoutPolicy:
+    """Uses every usable skill card and active item once per turn before the base policy plays"""
+
+    def __init__(self, base):
+        self.base = base
+        self._turn = None
+        self._used = set()
+
+    def __call__(self, engine):
+        # Cards played and HP identify the turn well enough to avoid reusing a card in a loop
+        turn = (len(engine.played_cards), engine.player.hp, engine.ai.hp, len(engine.player.hand))
+        if turn != self._turn:
+            self._turn = turn
+            self._used = set()
+        for skill_card in engine.player_skill_cards:
+            if id(skill_card) not in self._used and skill_card.can_use(engine):
+                self._used.add(id(skill_card))
+                return FightAction(SKILL, target=skill_card)
+        for item in engine.player_items:
+            if item.item_type == "Active" and id(item) not in self._used and item.can_use(engine):
+                self._used.add(id(item))
+                return FightAction(ITEM, target=item)
+        return self.base(engine)
+
+
+def make_player_policy(config: FightConfig):
+    """Build the engine policy named by config.policy"""
+    if config.policy == "smallest":
+        policy = smallest_play_policy
+    elif config.policy == "search":
+        from lib.policies import SearchPolicy
+        policy = combo_policy(SearchPolicy(budget_ms=config.search_budget_ms, node_budget=config.search_nodes))
+    else:
+        from lib.policies import EnemyPolicy
+        policy = combo_policy(EnemyPolicy(config.policy, search_budget_ms=config.search_budget_ms,
+                                          search_nodes=config.search_nodes))
+    if config.use_loadout and (config.skill_cards or config.items):
+        policy = LoadoutPolicy(policy)
+    return policy
+
+
+def player_policy_names() -> List[str]:
+    return ["smallest", "search"] + list(REGULAR_ENEMIES) + list(ELITE_ENEMIES) + list(BOSS_ENEMIES)
+
+
+def simulate_fight(config: FightConfig, seed: int, index: int = 0, replay_log=None) -> Dict[str, Any]:
+    """Play one fight and describe its outcome.
+    With node budgets (the default) the same seed replays the same fight."""
+    if config.enemy_name:
+        enemy_type = find_enemy_type(config.enemy_name) or EnemyType.REGULAR
+    else:
+        enemy_type = EnemyType(config.enemy_type)
+    start = time.perf_counter()
+    # Effects print to stdout, which would interleave with streamed results
+    with redirect_stdout(io.StringIO()):
+        engine = FightEngine(player_skill_cards=config.skill_cards,
+                             player_items=config.items,
+                             player_equipment=config.equipment,
+                             player_starting_hp=config.player_hp,
+                             enemy_type=enemy_type,
+                             enemy_name=config.enemy_name,
+                             rng=RngContext(seed),
+                             replay_log=replay_log,
+                             ai_search_budget_ms=config.enemy_search_budget_ms,
+                             ai_search_nodes=config.enemy_search_nodes)
+        winner = engine.play_out(make_player_policy(config))
+    return {
+        "index": index,
+        "seed": seed,
+        "enemy": engine.ai.name,
+        "loadout": loadout_key(config),
+        "result": "win" if winner == engine.player else "loss" if winner is not None else "unfinished",
+        "player_start_hp": config.player_hp,
+        "player_hp": engine.player.hp,
+        "enemy_hp": engine.ai.hp,
+        "player_cards": len(engine.player.hand),
+        "enemy_cards": len(engine.ai.hand),
+        "turns": engine.decisions,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _run_chunk(config: FightConfig, jobs) -> List[Dict[str, Any]]:
+    if not config.log_dir:
+        return [simulate_fight(config, seed, index) for index, seed in jobs]
+    from lib.replay_log import ReplayWriter
+    os.makedirs(config.log_dir, exist_ok=True)
+    path = os.path.join(config.log_dir, f"fights_{jobs[0][0]:07d}.pdklog")
+    with ReplayWriter(path) as writer:
+        return [simulate_fight(config, seed, index, writer) for index, seed in jobs]
+
+
+def simulate_fights(config: FightConfig, num_fights: int, workers: int = None,
+                    seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield per-fight results as they finish (in completion order)"""
+    root = RngContext(seed)
+    jobs = [(i, root.spawn(i).seed) for i in range(num_fights)]
+    chunks = [jobs[i:i + CHUNK_SIZE] for i in range(0, len(jobs), CHUNK_SIZE)]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _run_chunk(config, chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, config, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Win rate, average remaining HP and a per-enemy breakdown"""
+    summary = {"fights": len(results), "enemies": {}}
+    if not results:
+        return summary
+    wins = [r for r in results if r["result"] == "win"]
+    summary["win_rate"] = len(wins) / len(results)
+    summary["avg_player_hp"] = sum(r["player_hp"] for r in results) / len(results)
+    summary["avg_enemy_hp"] = sum(r["enemy_hp"] for r in results) / len(results)
+    for result in results:
+        entry = summary["enemies"].setdefault(result["enemy"], {"fights": 0, "wins": 0})
+        entry["fights"] += 1
+        entry["wins"] += result["result"] == "win"
+    return summary
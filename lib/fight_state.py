@@ -0,0 +1,200 @@
+"""
+Immutable fight-state snapshots for search and undo.
+A FightState records a FightEngine position as plain tuples: card ids for the
+hands, discard pile and table, card faces, HPs, bonuses, extra turns and the
+mutable flags of skill cards, items, equipment and enemy abilities. Snapshot
+and restore are linear in the state size and never copy Card or effect objects;
+the same objects are put back into the engine's lists.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple, Any, Optional
+
+# Attributes that skill cards, items and enemy abilities set on the engine
+ENGINE_FLAGS = ("double_active", "pair_master_active", "triple_master_active", "bomb_master_active")
+
+# Per-object counters and flags of items, equipment and enemy abilities
+COMPONENT_FLAGS = ("uses", "straights_remaining", "used_this_fight", "first_damage_blocked", "phase_2_triggered")
+
+_MISSING = object()
+
+
+class CardRegistry:
+    """Stable small-integer ids for the Card objects of one fight"""
+
+    def __init__(self):
+        self.cards = []
+        self._ids = {}
+
+    def card_id(self, card) -> int:
+        key = id(card)
+        index = self._ids.get(key)
+        if index is None:
+            index = len(self.cards)
+            self._ids[key] = index
+            self.cards.append(card)
+        return index
+
+    def ids(self, cards) -> Tuple[int, ...]:
+        return tuple(self.card_id(card) for card in cards)
+
+    def cards_for(self, ids):
+        cards = self.cards
+        return [cards[i] for i in ids]
+
+
+@dataclass(frozen=True)
+class FightState:
+    """One engine position. Sides are 0 (player), 1 (AI) or None."""
+    player_hand: Tuple[int, ...]
+    ai_hand: Tuple[int, ...]
+    discard_pile: Tuple[int, ...]
+    played_cards: Tuple[int, ...]
+    faces: Tuple[Tuple[str, Any], ...]  # (rank, suit) of every registered card; skills can rewrite suits
+    last_combo: Any  # Combo objects are never mutated once identified
+    current_side: Optional[int]
+    last_side: Optional[int]
+    extra_turn_side: Optional[int]
+    extra_turns: int
+    last_combo_damage_bonus: int
+    first_damage_taken: bool
+    player_hp: int
+    ai_hp: int
+    ai_max_hp: int
+    ai_damage_multiplier: float
+    game_over: bool
+    winner_side: Optional[int]
+    banned_combo_types: Optional[Tuple[Any, ...]]
+    engine_flags: Tuple[Any, ...]  # Values of ENGINE_FLAGS, _MISSING when unset
+    player_skill_cards: Tuple[Any, ...]
+    player_items: Tuple[Any, ...]
+    ai_skill_cards: Tuple[Any, ...]
+    ai_items: Tuple[Any, ...]
+    ai_abilities: Tuple[Any, ...]
+    component_flags: Tuple[Tuple[Any, ...], ...]  # (object, values of COMPONENT_FLAGS) per stateful component
+
+
+def _side(engine, player) -> Optional[int]:
+    if player is None:
+        return None
+    return 0 if player is engine.player else 1
+
+
+def _player(engine, side):
+    if side is None:
+        return None
+    return engine.player if side == 0 else engine.ai
+
+
+def _components(engine):
+    yield from engine.player_items
+    yield from engine.player_equipment
+    yield from getattr(engine.ai, 'items', ())
+    yield from getattr(engine.ai, 'abilities', ())
+    for ability in getattr(engine.ai, 'abilities', ()):
+        yield from getattr(ability, 'phase_2_abilities', ())
+
+
+def snapshot(engine, registry: CardRegistry) -> FightState:
+    """Capture the engine position"""
+    player_hand = registry.ids(engine.player.hand)
+    ai_hand = registry.ids(engine.ai.hand)
+    discard_pile = registry.ids(engine.discard_pile)
+    played_cards = registry.ids(engine.played_cards)
+    faces = tuple((card.rank, card.suit) for card in registry.cards)
+
+    component_flags = []
+    for component in _components(engine):
+        values = tuple(getattr(component, name, _MISSING) for name in COMPONENT_FLAGS)
+        if any(value is not _MISSING for value in values):
+            component_flags.append((component, values))
+
+    banned = getattr(engine, 'banned_combo_types', None)
+    ai = engine.ai
+    return FightState(
+        player_hand=player_hand,
+        ai_hand=ai_hand,
+        discard_pile=discard_pile,
+        played_cards=played_cards,
+        faces=faces,
+        last_combo=engine.last_combo,
+        current_side=_side(engine, engine.current_player),
+        last_side=_side(engine, engine.last_player),
+        extra_turn_side=_side(engine, engine.extra_turn_player),
+        extra_turns=engine.extra_turns,
+        last_combo_damage_bonus=engine.last_combo_damage_bonus,
+        first_damage_taken=engine.first_damage_taken,
+        player_hp=engine.player.hp,
+        ai_hp=ai.hp,
+        ai_max_hp=getattr(ai, 'max_hp', ai.hp),
+        ai_damage_multiplier=getattr(ai, 'damage_multiplier', 1.0),
+        game_over=engine.game_over,
+        winner_side=_side(engine, engine.winner),
+        banned_combo_types=None if banned is None else tuple(banned),
+        engine_flags=tuple(getattr(engine, name, _MISSING) for name in ENGINE_FLAGS),
+        player_skill_cards=tuple(engine.player_skill_cards),
+        player_items=tuple(engine.player_items),
+        ai_skill_cards=tuple(getattr(ai, 'skill_cards', ())),
+        ai_items=tuple(getattr(ai, 'items', ())),
+        ai_abilities=tuple(getattr(ai, 'abilities', ())),
+        component_flags=tuple(component_flags),
+    )
+
+
+def restore(engine, state: FightState, registry: CardRegistry):
+    """Put the engine back into a captured position"""
+    for card, (rank, suit) in zip(registry.cards, state.faces):
+        if card.rank != rank:
+            card.rank = rank
+            card.value = card.VALUE_MAP[rank]
+        card.suit = suit
+        card.selected = False
+
+    # Assign in place: the player's hand may be shared with the pre-fight preview
+    engine.player.hand[:] = registry.cards_for(state.player_hand)
+    engine.ai.hand[:] = registry.cards_for(state.ai_hand)
+    engine.discard_pile[:] = registry.cards_for(state.discard_pile)
+    engine.played_cards[:] = registry.cards_for(state.played_cards)
+
+    engine.last_combo = state.last_combo
+    engine.current_player = _player(engine, state.current_side)
+    engine.last_player = _player(engine, state.last_side)
+    engine.extra_turn_player = _player(engine, state.extra_turn_side)
+    engine.extra_turns = state.extra_turns
+    engine.last_combo_damage_bonus = state.last_combo_damage_bonus
+    engine.first_damage_taken = state.first_damage_taken
+    engine.game_over = state.game_over
+    engine.winner = _player(engine, state.winner_side)
+
+    engine.player.hp = state.player_hp
+    ai = engine.ai
+    ai.hp = state.ai_hp
+    if hasattr(ai, 'max_hp'):
+        ai.max_hp = state.ai_max_hp
+    if hasattr(ai, 'damage_multiplier'):
+        ai.damage_multiplier = state.ai_damage_multiplier
+
+    if state.banned_combo_types is None:
+        if hasattr(engine, 'banned_combo_types'):
+            del engine.banned_combo_types
+    else:
+        engine.banned_combo_types = list(state.banned_combo_types)
+    for name, value in zip(ENGINE_FLAGS, state.engine_flags):
+        if value is _MISSING:
+            if hasattr(engine, name):
+                delattr(engine, name)
+        else:
+            setattr(engine, name, value)
+
+    engine.player_skill_cards[:] = state.player_skill_cards
+    engine.player_items[:] = state.player_items
+    if hasattr(ai, 'skill_cards'):
+        ai.skill_cards[:] = state.ai_skill_cards
+    if hasattr(ai, 'items'):
+        ai.items[:] = state.ai_items
+    if hasattr(ai, 'abilities'):
+        ai.abilities[:] = state.ai_abilities
+    for component, values in state.component_flags:
+        for name, value in zip(COMPONENT_FLAGS, values):
+            if value is not _MISSING:
+                setattr(component, name, value)
@@ -0,0 +1,203 @@
+"""
+Opt-in frame timing for the game loops.
+A FrameProfiler wraps the named methods of one screen (event handling, AI turn,
+draw_* ...) while it is enabled, and records how long each call took in every
+frame. The overlay shows rolling p50/p95/p99 per phase and a graph of recent
+frame times; the recorded frames export to CSV and to a Chrome trace file
+(chrome://tracing or ui.perfetto.dev).
+
+F3 toggles profiling and the overlay, F4 exports. Set PDK_PROFILE=1 to profile
+from the first frame. While disabled nothing is wrapped, so a frame only pays
+for the begin_frame/end_frame calls.
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, List, Tuple
+
+import pygame
+
+FRAME_HISTORY = 600  # Frames kept for percentiles, the graph and exports
+GRAPH_FRAMES = 150
+GRAPH_MAX_MS = 33.3  # Top of the frame graph, two 60 FPS frames
+OVERLAY_PHASES = 8  # Slowest phases listed in the overlay
+OVERLAY_REFRESH = 15  # Frames between percentile table updates
+OVERLAY_RECT = pygame.Rect(10, 10, 330, 36 + OVERLAY_PHASES * 16 + 60)
+TOGGLE_KEY = pygame.K_F3
+EXPORT_KEY = pygame.K_F4
+PROFILE_ENV = "PDK_PROFILE"
+
+# Whether new screens start profiled: set by PDK_PROFILE, then follows F3
+_profiling = bool(os.environ.get(PROFILE_ENV))
+
+
+class FrameProfiler:
+    """Per-phase timings of the frames of one screen"""
+
+    def __init__(self, name: str, target, methods: Tuple[str, ...]):
+        self.name = name
+        self.target = target
+        self.methods = methods
+        self.enabled = False
+        self.frames = deque(maxlen=FRAME_HISTORY)  # (start seconds, frame ms, [(phase, start seconds, ms)])
+        self._spans = None
+        self._frame_start = 0.0
+        self._recorded = 0  # Frames recorded so far, including ones dropped from the history
+        self._font = None
+        self._table = None  # Overlay background with the percentile table, and when it was made
+        self._table_at = 0
+        if _profiling:
+            self.enable()
+
+    def enable(self):
+        if self.enabled:
+            return
+        for method in self.methods:
+            # Instance attributes shadow the class methods, so internal self.draw_x() calls are timed too
+            setattr(self.target, method, self._timed(method, getattr(self.target, method)))
+        self.enabled = True
+
+    def disable(self):
+        if not self.enabled:
+            return
+        for method in self.methods:
+            self.target.__dict__.pop(method, None)
+        self.enabled = False
+        self._spans = None
+
+    def toggle(self):
+        global _profiling
+        self.disable() if self.enabled else self.enable()
+        _profiling = self.enabled
+
+    def _timed(self, phase: str, method):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                if self._spans is not None:
+                    self._spans.append((phase, start, (time.perf_counter() - start) * 1000))
+        return timed
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+            self._spans = []
+
+    def end_frame(self):
+        if self._spans is None:
+            return
+        self.frames.append((self._frame_start, (time.perf_counter() - self._frame_start) * 1000, self._spans))
+        self._spans = None
+        self._recorded += 1
+
+    def handle_key(self, event) -> bool:
+        """React to the toggle and export keys; True if the event was one of them"""
+        if event.type != pygame.KEYDOWN or event.key not in (TOGGLE_KEY, EXPORT_KEY):
+            return False
+        if event.key == TOGGLE_KEY:
+            self.toggle()
+        elif self.frames:
+            for path in self.export():
+                print(f"Wrote {path}")
+        return True
+
+    def phase_times(self) -> Dict[str, List[float]]:
+        """Milliseconds per frame of each phase (summed over its calls), in the frames it ran"""
+        times = {"frame": [frame_ms for _, frame_ms, _ in self.frames]}
+        for _, _, spans in self.frames:
+            totals = {}
+            for phase, _, ms in spans:
+                totals[phase] = totals.get(phase, 0.0) + ms
+            for phase, ms in totals.items():
+                times.setdefault(phase, []).append(ms)
+        return times
+
+    def percentiles(self) -> Dict[str, Tuple[float, float, float]]:
+        """(p50, p95, p99) milliseconds of each phase, read off the sorted times"""
+        stats = {}
+        for phase, values in self.phase_times().items():
+            if values:
+                values.sort()
+                last = len(values) - 1
+                stats[phase] = tuple(values[min(last, round(pct / 100 * last))] for pct in (50, 95, 99))
+        return stats
+
+    def _render_table(self) -> pygame.Surface:
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)
+        font = self._font
+        table = pygame.Surface(OVERLAY_RECT.size)
+        table.fill((10, 10, 10))
+        pygame.draw.rect(table, (200, 200, 200), table.get_rect(), 1)
+
+        # Rendered directly: the numbers change all the time and would churn the shared text cache
+        stats = self.percentiles()
+        frame = stats.pop("frame", (0.0, 0.0, 0.0))
+        rows = [(f"{self.name} ({len(self.frames)} frames)", ("p50", "p95", "p99")),
+                ("frame", [f"{ms:.2f}" for ms in frame])]
+        for phase, times in sorted(stats.items(), key=lambda item: -item[1][1])[:OVERLAY_PHASES]:
+            rows.append((phase, [f"{ms:.2f}" for ms in times]))
+        for i, (label, values) in enumerate(rows):
+            y = 6 + i * 16
+            table.blit(font.render(label, True, (230, 230, 230)), (8, y))
+            for j, value in enumerate(values):
+                text = font.render(value, True, (230, 230, 230))
+                table.blit(text, text.get_rect(topright=(200 + j * 60, y)))
+        return table
+
+    def draw_overlay(self, surface):
+        """Percentile table and frame graph in OVERLAY_RECT"""
+        start = time.perf_counter()
+        if self._table is None or self._recorded - self._table_at >= OVERLAY_REFRESH:
+            self._table = self._render_table()
+            self._table_at = self._recorded
+        rect = OVERLAY_RECT
+        surface.blit(self._table, rect)
+
+        # Recent frame times, with the 60 FPS budget marked
+        graph = pygame.Rect(rect.x + 8, rect.bottom - 58, rect.width - 16, 50)
+        budget_y = graph.bottom - int(graph.height * (1000 / 60) / GRAPH_MAX_MS)
+        pygame.draw.line(surface, (120, 120, 40), (graph.x, budget_y), (graph.right, budget_y))
+        recent = [frame_ms for _, frame_ms, _ in list(self.frames)[-GRAPH_FRAMES:]]
+        bar_width = graph.width / GRAPH_FRAMES
+        for i, frame_ms in enumerate(recent):
+            height = max(1, int(graph.height * min(frame_ms, GRAPH_MAX_MS) / GRAPH_MAX_MS))
+            color = (80, 200, 120) if frame_ms <= 1000 / 60 else (230, 80, 80)
+            pygame.draw.rect(surface, color, (graph.x + int(i * bar_width), graph.bottom - height,
+                                              max(1, int(bar_width)), height))
+        if self._spans is not None:
+            self._spans.append(("overlay", start, (time.perf_counter() - start) * 1000))
+
+    def export(self, directory: str = ".") -> Tuple[str, str]:
+        """Write the recorded frames as CSV (one row per frame) and as a Chrome trace; returns both paths"""
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        csv_path = os.path.join(directory, f"frames_{self.name}_{stamp}.csv")
+        trace_path = os.path.join(directory, f"frames_{self.name}_{stamp}.trace.json")
+        phases = sorted({phase for _, _, spans in self.frames for phase, _, _ in spans})
+        origin = self.frames[0][0] if self.frames else 0.0
+
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["frame", "start_ms", "frame_ms"] + phases)
+            for i, (start, frame_ms, spans) in enumerate(self.frames):
+                totals = dict.fromkeys(phases, 0.0)
+                for phase, _, ms in spans:
+                    totals[phase] += ms
+                writer.writerow([i, f"{(start - origin) * 1000:.3f}", f"{frame_ms:.3f}"]
+                                + [f"{totals[phase]:.3f}" for phase in phases])
+
+        events = []
+        for start, frame_ms, spans in self.frames:
+            events.append({"name": "frame", "ph": "X", "pid": 1, "tid": 1,
+                           "ts": (start - origin) * 1e6, "dur": frame_ms * 1000})
+            for phase, span_start, ms in spans:
+                events.append({"name": phase, "ph": "X", "pid": 1, "tid": 1,
+                               "ts": (span_start - origin) * 1e6, "dur": ms * 1000})
+        with open(trace_path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return csv_path, trace_path
@@ -0,0 +1,129 @@
+"""
+Search-backed play suggestions for the Suggest button.
+Runs the Python search engine under a strict time budget, caches answers by
+position key and can start searching in the background as the player's turn begins.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, Any
+
+from lib.deal import new_deck
+from lib.rng import derive_seed
+from lib.search import SearchEngine, combo_key
+
+HINT_BUDGET_MS = 150
+HINT_CACHE_SIZE = 256
+
+_MISSING = object()  # Cache lookups: None is a cached pass
+
+
+class HintUnavailable(Exception):
+    """No answer within the budget; the caller falls back to a heuristic suggestion"""
+
+
+def card_id(card) -> Tuple[str, str]:
+    """Hashable (rank, suit) identity of a card"""
+    return (card.rank, card.suit.value if hasattr(card.suit, 'value') else str(card.suit))
+
+
+class HintEngine:
+    """Budgeted, cached and optionally speculative search for the player's best play"""
+
+    def __init__(self, budget_ms: float = HINT_BUDGET_MS, cache_size: int = HINT_CACHE_SIZE):
+        self.budget_ms = budget_ms
+        self.cache_size = cache_size
+        self.engine = SearchEngine()
+        self.cache: "OrderedDict[Any, Optional[frozenset]]" = OrderedDict()
+        self.last_stats = None
+        self._lock = threading.Lock()  # The search engine is not thread safe
+        self._cache_lock = threading.Lock()  # Held briefly, never during a search
+        self._thread = None
+        self._pending_key = None
+
+    def position_key(self, game) -> Tuple:
+        """Everything the player can see that affects the answer"""
+        return (
+            tuple(sorted(card_id(card) for card in game.player.hand)),
+            len(game.ai.hand),
+            combo_key(game.last_combo),
+            game.player.hp,
+            game.ai.hp,
+            tuple(sorted(card_id(card) for card in getattr(game, 'played_cards', []))),
+            tuple(sorted(t.value for t in getattr(game, 'banned_combo_types', []))),
+        )
+
+    def _snapshot(self, game, key):
+        """Copy the position so a background search never sees it change"""
+        # The opponent's hand is hidden: sample it from the cards the player has not seen
+        seen = set(key[0]) | set(key[5])
+        unseen = [card for card in new_deck() if card_id(card) not in seen]
+        rng = random.Random(derive_seed(key))  # Same sample, and hint, in every process
+        opp_hand = rng.sample(unseen, min(len(unseen), key[1]))
+        banned = (frozenset(getattr(game, 'banned_combo_types', [])), frozenset())
+        return (list(game.player.hand), opp_hand, game.player.hp, game.ai.hp, game.last_combo, banned)
+
+    def _cached(self, key):
+        """Cached answer for a position, marked as recently used, or _MISSING"""
+        with self._cache_lock:
+            if key not in self.cache:
+                return _MISSING
+            self.cache.move_to_end(key)
+            return self.cache[key]
+
+    def _search(self, key, snapshot, budget_ms):
+        """Search, cache and return the answer; the caller holds the lock"""
+        cards = self._cached(key)
+        if cards is not _MISSING:
+            return cards
+        own_hand, opp_hand, own_hp, opp_hp, last_combo, banned = snapshot
+        move, stats = self.engine.search(own_hand, opp_hand, own_hp, opp_hp, last_combo,
+                                         budget_ms=budget_ms, banned=banned)
+        self.last_stats = stats
+        cards = None if move is None else frozenset(card_id(card) for card in move.cards)
+        with self._cache_lock:
+            self.cache[key] = cards
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return cards
+
+    def _run(self, key, snapshot):
+        with self._lock:
+            self._search(key, snapshot, self.budget_ms)
+
+    def prefetch(self, game):
+        """Start a background search for the current position if it is not known yet"""
+        key = self.position_key(game)
+        if key == self._pending_key or self._cached(key) is not _MISSING:
+            return
+        self._pending_key = key
+        self._thread = threading.Thread(target=self._run, args=(key, self._snapshot(game, key)), daemon=True)
+        self._thread.start()
+
+    def suggest(self, game) -> Optional[list]:
+        """Cards of the suggested play from the player's hand, or None to pass.
+        Never takes longer than the budget: raises HintUnavailable when there is no answer in time."""
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        key = self.position_key(game)
+        cards = self._cached(key)
+        if cards is _MISSING and key == self._pending_key and self._thread is not None:
+            # A speculative search is already on it
+            self._thread.join(max(0.0, deadline - time.perf_counter()))
+            cards = self._cached(key)
+        if cards is _MISSING:
+            snapshot = self._snapshot(game, key)
+            # A speculative search of another position may still hold the engine
+            if not self._lock.acquire(timeout=max(0.0, deadline - time.perf_counter())):
+                raise HintUnavailable("search engine busy")
+            try:
+                remaining_ms = (deadline - time.perf_counter()) * 1000.0
+                if remaining_ms <= 0:
+                    raise HintUnavailable("budget spent waiting")
+                cards = self._search(key, snapshot, remaining_ms)
+            finally:
+                self._lock.release()
+        if cards is None:
+            return None
+        return [card for card in game.player.hand if card_id(card) in cards]
@@ -0,0 +1,61 @@
+"""
+Uniform-grid hit testing for clickable screen elements.
+Build a HitGrid when a layout changes; hit() then looks at a single cell
+instead of every element. Elements added later are on top, matching draw
+order, so overlapped cards resolve to the card that is visible at a point.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+CELL_SIZE = 64
+
+
+class HitGrid:
+    """Rectangles and circles bucketed by the grid cells they cover"""
+
+    def __init__(self, cell_size: int = CELL_SIZE):
+        self.cell_size = cell_size
+        self._shapes: List[Tuple[Any, pygame.Rect, Optional[Tuple[int, int, int]]]] = []
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def _insert(self, item, rect: pygame.Rect, circle=None):
+        index = len(self._shapes)
+        self._shapes.append((item, rect, circle))
+        size = self.cell_size
+        for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                self._cells.setdefault((cx, cy), []).append(index)
+
+    def add_rect(self, item, rect):
+        self._insert(item, pygame.Rect(rect))
+
+    def add_circle(self, item, center: Tuple[int, int], radius: int):
+        x, y = center
+        self._insert(item, pygame.Rect(x - radius, y - radius, 2 * radius + 1, 2 * radius + 1), (x, y, radius))
+
+    def hit(self, pos: Tuple[int, int]):
+        """Topmost item at pos, or None"""
+        x, y = pos
+        for index in reversed(self._cells.get((x // self.cell_size, y // self.cell_size), ())):
+            item, rect, circle = self._shapes[index]
+            if circle is None:
+                if rect.collidepoint(pos):
+                    return item
+            else:
+                cx, cy, radius = circle
+                if (x - cx) ** 2 + (y - cy) ** 2 <= radius * radius:
+                    return item
+        return None
+
+    def __len__(self):
+        return len(self._shapes)
+
+
+def rect_grid(entries) -> HitGrid:
+    """HitGrid of (item, rect) pairs, later pairs on top"""
+    grid = HitGrid()
+    for item, rect in entries:
+        grid.add_rect(item, rect)
+    return grid
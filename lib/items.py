@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional, Any
 from lib.core_types import Rarity
+from lib.rng import rng_stream
 
 
 @dataclass
@@ -44,8 +45,8 @@ class LuckyCharm(Item):
     
     def on_trigger(self, game_state: Any, trigger_type: str) -> bool:
         if trigger_type == "first_damage":
-            import random
-            return random.random() < 0.5  # 50% chance to block
+            rng = rng_stream(game_state, "effects")
+            return rng.random() < 0.5  # 50% chance to block
         return False
 
 
@@ -173,9 +174,9 @@ class MasterThief(Item):
     
     def on_trigger(self, game_state: Any, trigger_type: str) -> bool:
         if trigger_type == "fight_start":
-            import random
+            rng = rng_stream(game_state, "effects")
             if hasattr(game_state, 'ai') and len(game_state.ai.hand) >= 2:
-                stolen_cards = random.sample(game_state.ai.hand, 2)
+                stolen_cards = rng.sample(game_state.ai.hand, 2)
                 for card in stolen_cards:
                     game_state.player.hand.append(card)
                     game_state.ai.hand.remove(card)
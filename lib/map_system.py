@@ -3,7 +3,9 @@ from typing import List, Optional, Tuple
 from enum import Enum
 import random
 import pygame
-import os
+from lib.asset_manager import get_asset_manager
+from lib.hit_test import HitGrid
+from lib.text_cache import render_text, get_font
 
 class NodeType(Enum):
     COMBAT = "combat"
@@ -42,6 +44,7 @@ class RegionMap:
     width: int = 800
     height: int = 600
     layers: int = 8  # Number of vertical layers
+    version: int = field(default=0, compare=False)  # Bumped when the current node or node flags change
     
     def get_available_next_nodes(self) -> List[MapNode]:
         """Get nodes the player can move to from current position"""
@@ -60,6 +63,7 @@ class RegionMap:
             if self.current_node:
                 self.current_node.visited = True
             self.current_node = node
+            self.version += 1
             return True
         return False
     
@@ -68,13 +72,15 @@ class RegionMap:
         if self.current_node:
             self.current_node.completed = True
             self.current_node.visited = True
+            self.version += 1
 
 class MapGenerator:
     """Generates procedural maps for regions"""
     
     @staticmethod
-    def generate_region_map(region_name: str = "Tutorial") -> RegionMap:
-        """Generate a map for the given region"""
+    def generate_region_map(region_name: str = "Tutorial", rng: random.Random = None) -> RegionMap:
+        """Generate a map for the given region, drawing from rng (a run's map stream) when given"""
+        rng = rng or random.Random()
         map_obj = RegionMap()
         
         # Define map layout parameters (more like Slay the Spire)
@@ -115,7 +121,7 @@ class MapGenerator:
                 if len(available_types) == 1:
                     node_type = available_types[0]
                 else:
-                    node_type = random.choice(available_types)
+                    node_type = rng.choice(available_types)
                 
                 node = MapNode(
                     x=x_positions[i],
@@ -147,7 +153,7 @@ class MapGenerator:
             for current_node in current_layer:
                 # Each node connects to 1-3 nodes in the next layer (based on layer size)
                 max_connections = min(3, len(next_layer))
-                connections_to_make = random.randint(1, max_connections)
+                connections_to_make = rng.randint(1, max_connections)
                 
                 # Prefer connections to nearby nodes (spatially close)
                 next_layer_sorted = sorted(next_layer, 
@@ -179,29 +185,30 @@ class MapRenderer:
     def __init__(self):
         self.node_images = {}
         self.player_image = None
+        # Background, paths, nodes, title and legend of the last map drawn
+        self._static_layer = None
+        self._static_map = None
+        self._static_key = None
+        self._node_hits = None
+        self._node_hits_map = None
         self.load_assets()
     
     def load_assets(self):
         """Load map visual assets"""
-        try:
-            # Load node images
-            for node_type in NodeType:
-                if node_type != NodeType.START:  # Start node uses same as combat
-                    image_path = f"images/map/node_{node_type.value}.png"
-                    if os.path.exists(image_path):
-                        self.node_images[node_type] = pygame.image.load(image_path)
-            
-            # Use combat node for start node
-            if NodeType.COMBAT in self.node_images:
-                self.node_images[NodeType.START] = self.node_images[NodeType.COMBAT]
-            
-            # Load player image
-            player_path = "images/map/player.png"
-            if os.path.exists(player_path):
-                self.player_image = pygame.image.load(player_path)
-                
-        except Exception as e:
-            print(f"Warning: Could not load map assets: {e}")
+        assets = get_asset_manager()
+        # Load node images
+        for node_type in NodeType:
+            if node_type != NodeType.START:  # Start node uses same as combat
+                image = assets.image(f"images/map/node_{node_type.value}.png")
+                if image:
+                    self.node_images[node_type] = image
+        
+        # Use combat node for start node
+        if NodeType.COMBAT in self.node_images:
+            self.node_images[NodeType.START] = self.node_images[NodeType.COMBAT]
+        
+        # Load player image
+        self.player_image = assets.image("images/map/player.png")
     
     def draw_path(self, surface, start_pos: Tuple[int, int], end_pos: Tuple[int, int], color=(150, 150, 150)):
         """Draw a path between two nodes"""
@@ -252,8 +259,8 @@ class MapRenderer:
             pygame.draw.circle(surface, (100, 150, 255), (node.x, node.y - 25), 8)
             pygame.draw.circle(surface, (255, 255, 255), (node.x, node.y - 25), 8, 1)
     
-    def draw_map(self, surface, region_map: RegionMap):
-        """Draw the complete map"""
+    def draw_static_layer(self, surface, region_map: RegionMap):
+        """Draw everything that only changes when the player moves or completes a node"""
         # Clear background
         surface.fill((40, 44, 52))  # Dark background
         
@@ -271,18 +278,14 @@ class MapRenderer:
             is_available = (node in available_nodes)
             self.draw_node(surface, node, is_current, is_available)
         
-        # Draw player
-        if region_map.current_node:
-            self.draw_player(surface, region_map.current_node)
-        
         # Draw map title
-        font = pygame.font.Font(None, 36)
-        title_surface = font.render("Region Map", True, (255, 255, 255))
+        font = get_font(None, 36)
+        title_surface = render_text(font, "Region Map", (255, 255, 255))
         surface.blit(title_surface, (20, 20))
         
         # Draw legend
         legend_y = 60
-        legend_font = pygame.font.Font(None, 24)
+        legend_font = get_font(None, 24)
         legend_items = [
             ("Combat", (200, 100, 100)),
             ("Elite", (150, 50, 150)),
@@ -295,17 +298,35 @@ class MapRenderer:
             y_pos = legend_y + i * 25
             pygame.draw.circle(surface, color, (30, y_pos), 8)
             pygame.draw.circle(surface, (255, 255, 255), (30, y_pos), 8, 1)
-            text_surface = legend_font.render(name, True, (255, 255, 255))
+            text_surface = render_text(legend_font, name, (255, 255, 255))
             surface.blit(text_surface, (50, y_pos - 10))
+
+    def draw_map(self, surface, region_map: RegionMap, mouse_pos: Optional[Tuple[int, int]] = None):
+        """Draw the complete map: the cached static layer, then the hover ring and the player"""
+        key = (region_map.version, surface.get_size())
+        if self._static_layer is None or self._static_map is not region_map or self._static_key != key:
+            self._static_layer = pygame.Surface(surface.get_size())
+            self.draw_static_layer(self._static_layer, region_map)
+            self._static_map = region_map
+            self._static_key = key
+        surface.blit(self._static_layer, (0, 0))
+        
+        # Highlight the node under the mouse if the player can move there
+        if mouse_pos:
+            hovered = self.get_clicked_node(region_map, mouse_pos)
+            if hovered and hovered in region_map.get_available_next_nodes():
+                pygame.draw.circle(surface, (255, 255, 255), (hovered.x, hovered.y), 24, 2)
+        
+        # Draw player
+        if region_map.current_node:
+            self.draw_player(surface, region_map.current_node)
     
     def get_clicked_node(self, region_map: RegionMap, mouse_pos: Tuple[int, int]) -> Optional[MapNode]:
         """Get the node that was clicked, if any"""
-        mouse_x, mouse_y = mouse_pos
-        
-        for node in region_map.nodes:
-            # Check if click is within node radius
-            distance = ((node.x - mouse_x) ** 2 + (node.y - mouse_y) ** 2) ** 0.5
-            if distance <= 20:  # Node click radius
-                return node
-        
-        return None
\ No newline at end of file
+        # Nodes never move, so the hit grid is built once per map
+        if self._node_hits_map is not region_map:
+            self._node_hits = HitGrid()
+            for node in reversed(region_map.nodes):  # First node in the list wins, as before
+                self._node_hits.add_circle(node, (node.x, node.y), 20)  # Node click radius
+            self._node_hits_map = region_map
+        return self._node_hits.hit(mouse_pos)
@@ -0,0 +1,137 @@
+"""
+Opening book for the first lead of a fight.
+Every fight deals 23 cards to each side, so the first lead is searched with full
+hands. The book maps bucketed hand features to a precomputed lead (combo type,
+length and lead value). It is a sorted file of fixed 16-byte records read through
+mmap, so a lookup is a binary search with no parsing at load time.
+"""
+
+import mmap
+import os
+import struct
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from lib.constants import PACKAGE_ROOT
+from lib.search import rank_counts
+
+DEFAULT_BOOK_PATH = os.path.join(PACKAGE_ROOT, "models", "opening_book.bin")
+
+OPENING_HAND_SIZE = 23
+
+MAGIC = b"PDKBOOK2"  # Bumped whenever hand_key changes
+HEADER = struct.Struct("<8sQ")  # magic, record count
+RECORD = struct.Struct("<QBBBBI")  # key, combo type, length, lead value, votes, samples
+
+Lead = Tuple[int, int, int]  # (combo type value, number of cards, lead value)
+
+
+def _pack(fields):
+    """Pack (value, bits) pairs into one integer"""
+    key = 0
+    for value, bits in fields:
+        key = (key << bits) | min(value, (1 << bits) - 1)
+    return key
+
+
+def hand_key(hand) -> int:
+    """Bucketed features of a hand packed into an integer key.
+    Counts are capped where the lead hardly changes any more, so that a book built
+    from tens of thousands of deals covers nearly every opening hand."""
+    counts = rank_counts(hand)
+    regular = counts[:13]  # 3 .. 2
+    longest = run = 0
+    for count in regular[:12]:  # Straights stop at A
+        run = run + 1 if count else 0
+        longest = max(longest, run)
+    return _pack([
+        (sum(1 for c in regular if c == 4), 2),   # bombs, 3 = three or more
+        (min(counts[13] + counts[14], 1), 1),     # any joker
+        (counts[12], 2),                          # 2s, 3 = three or more
+        (min(counts[11], 2), 2),                  # aces, 2 = two or more
+        (sum(1 for c in regular if c == 3), 2),   # triples, 3 = three or more
+        (min(sum(1 for c in regular if c == 2), 5), 3),  # pairs, 5 = five or more
+        (0 if longest < 5 else 1 if longest < 8 else 2, 2),  # longest run: none, short, long
+    ])
+
+
+def lead_of(combo) -> Lead:
+    return (combo.type.value, len(combo.cards), combo.lead_value)
+
+
+def write_book(path: str, votes: Dict[int, Counter]):
+    """Write the most voted lead of every key as a sorted book file"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(votes)))
+        for key in sorted(votes):
+            (combo_type, length, lead_value), count = votes[key].most_common(1)[0]
+            f.write(RECORD.pack(key, combo_type, length, lead_value, min(count, 255), sum(votes[key].values())))
+
+
+class OpeningBook:
+    """Read-only memory-mapped opening book"""
+
+    def __init__(self, path: str = DEFAULT_BOOK_PATH):
+        self.path = path
+        self._file = open(path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.size = HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or len(self._data) < HEADER.size + self.size * RECORD.size:
+            self.close()
+            raise ValueError(f"Not an opening book: {path}")
+        self.hits = 0
+        self.misses = 0
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+    def lookup_key(self, key: int) -> Optional[Lead]:
+        low, high = 0, self.size
+        while low < high:
+            mid = (low + high) // 2
+            mid_key = RECORD.unpack_from(self._data, HEADER.size + mid * RECORD.size)[0]
+            if mid_key < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self.size:
+            record = RECORD.unpack_from(self._data, HEADER.size + low * RECORD.size)
+            if record[0] == key:
+                return record[1:4]
+        return None
+
+    def choose(self, hand, valid_plays):
+        """Book play for an opening hand, matched against valid_plays, or None"""
+        if len(hand) != OPENING_HAND_SIZE:
+            return None
+        lead = self.lookup_key(hand_key(hand))
+        if lead is None:
+            self.misses += 1
+            return None
+        combo_type, length, lead_value = lead
+        # The key is bucketed, so take the same shape with the nearest lead value
+        matches = [p for p in valid_plays if p.type.value == combo_type and len(p.cards) == length]
+        if not matches:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return min(matches, key=lambda p: (abs(p.lead_value - lead_value), p.lead_value))
+
+
+_book = None
+_book_loaded = False
+
+
+def get_opening_book(path: str = DEFAULT_BOOK_PATH) -> Optional[OpeningBook]:
+    """Shared book loaded from the default path, or None if it has not been built"""
+    global _book, _book_loaded
+    if not _book_loaded:
+        _book_loaded = True
+        if os.path.exists(path):
+            try:
+                _book = OpeningBook(path)
+            except (OSError, ValueError) as e:
+                print(f"Warning: Could not load opening book {path}: {e}")
+    return _book
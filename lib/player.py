@@ -6,17 +6,24 @@ __all__ = [
 
 from lib.core_types import Card
 from lib.combo import identify_combo, ComboType
+from lib.search_stats import SearchStats, get_recorder
+from lib.opening_book import get_opening_book, OPENING_HAND_SIZE
 from collections import defaultdict
 import itertools
 import random
 import json
 import os
+import time
 
 try:
     import mcts_rust
 except ImportError:
     mcts_rust = None
 
+# Time budget for the Python search used when the Rust engine is missing or fails
+AI_SEARCH_BUDGET_MS = 250
+AI_SEARCH_NODES = 10000  # Node budget of about the same strength, for reproducible simulations
+
 
 
 class FightPlayer:
@@ -177,19 +184,47 @@ class FightPlayer:
 class SmartAIPlayer(FightPlayer):
     def __init__(self, name):
         super().__init__(name, is_ai=True)
+        self.rng = random  # Replaced by the fight's AI stream (lib.rng)
+        self.last_search_stats = None
+        self.search_engine = None  # Python SearchEngine, created on first use
+        self.search_budget_ms = AI_SEARCH_BUDGET_MS  # Budget of the Python search, per player
+        self.search_nodes = None  # Node budget instead of the time budget (lib.search), e.g. in simulations
+
+    def _finish_search(self, stats, start_time):
+        """Record timing for a decision and hand it to the recorder"""
+        stats.wall_time_ms = (time.perf_counter() - start_time) * 1000.0
+        self.last_search_stats = stats
+        get_recorder().record(stats, self.name)
 
     def choose_play(self, last_combo, game_state, depth=5):
         def card_to_dict(card):
             return {'rank': card.rank, 'suit': card.suit.value if hasattr(card.suit, 'value') else card.suit}
 
+        start_time = time.perf_counter()
+        stats = SearchStats()
+
         valid_plays = self.find_valid_plays(last_combo)
+        stats.root_branching = len(valid_plays)
         if not valid_plays:
+            stats.fallback_reason = "no_valid_plays"
+            self._finish_search(stats, start_time)
             return None
         if len(valid_plays) == 1:
+            stats.fallback_reason = "single_option"
+            self._finish_search(stats, start_time)
             return valid_plays[0]
 
+        # The first lead of a fight is a book lookup when an opening book is built
+        if last_combo is None and len(self.hand) == OPENING_HAND_SIZE:
+            book = get_opening_book()
+            play = book.choose(self.hand, valid_plays) if book else None
+            if play:
+                stats.engine = "book"
+                self._finish_search(stats, start_time)
+                return play
+
         # Always use Rust minimax if available
-        if mcts_rust and hasattr(mcts_rust, 'minimax_search_py'):
+        if mcts_rust and (hasattr(mcts_rust, 'minimax_search_stats_py') or hasattr(mcts_rust, 'minimax_search_py')):
             ai_hand_json = json.dumps([card_to_dict(c) for c in self.hand])
             # Handle both dictionary game_state (old) and game object (new)
             if hasattr(game_state, 'player'):  # Game object
@@ -204,7 +239,7 @@ class SmartAIPlayer(FightPlayer):
             if not opp_hand:
                 all_ranks = list(Card.VALUE_MAP.keys())
                 all_suits = list(set(c.suit for c in self.hand))
-                opp_hand = [Card(random.choice(all_ranks), random.choice(all_suits)) for _ in range(len(self.hand))]
+                opp_hand = [Card(self.rng.choice(all_ranks), self.rng.choice(all_suits)) for _ in range(len(self.hand))]
             opp_hand_json = json.dumps([card_to_dict(c) for c in opp_hand])
             # Always convert Combo to dict of cards for JSON serialization
             if last_combo:
@@ -218,29 +253,75 @@ class SmartAIPlayer(FightPlayer):
                 })
             else:
                 last_combo_json = json.dumps(None)
+            stats.engine = "rust"
             try:
-                result = mcts_rust.minimax_search_py(
-                    ai_hand_json,
-                    last_combo_json,
-                    opp_hand_json,
-                    ai_hp,
-                    player_hp,
-                    depth
-                )
-                if hasattr(result, 'unwrap'):
-                    result = result.unwrap()
-                if result and result != 'null':
-                    # Parse Combo from JSON
-                    combo_dict = json.loads(result)
-                    # Reconstruct Combo as in ComboType
-                    combo_cards = [Card(c['rank'], c['suit']) for c in combo_dict['cards']]
-                    combo_type = combo_dict.get('combo_type', 'SINGLE')
-                    lead_value = combo_dict.get('lead_value', 0)
+                if hasattr(mcts_rust, 'minimax_search_stats_py'):
+                    # Newer extension: result carries the search statistics
+                    payload = json.loads(mcts_rust.minimax_search_stats_py(
+                        ai_hand_json,
+                        last_combo_json,
+                        opp_hand_json,
+                        ai_hp,
+                        player_hp,
+                        depth
+                    ))
+                    stats.update_from_dict(payload.get('stats') or {})
+                    combo_dict = payload.get('combo')
+                else:
+                    result = mcts_rust.minimax_search_py(
+                        ai_hand_json,
+                        last_combo_json,
+                        opp_hand_json,
+                        ai_hp,
+                        player_hp,
+                        depth
+                    )
+                    if hasattr(result, 'unwrap'):
+                        result = result.unwrap()
+                    combo_dict = json.loads(result) if result else None
+                if combo_dict:
                     # Try to match to a valid play
                     for play in valid_plays:
                         if set((c.rank, str(c.suit)) for c in play.cards) == set((c['rank'], str(c['suit'])) for c in combo_dict['cards']):
+                            self._finish_search(stats, start_time)
                             return play
-            except Exception:
-                pass
-        # Fallback: random play
-        return random.choice(valid_plays)
+                    stats.fallback_reason = "unmatched_result"
+                else:
+                    stats.fallback_reason = "no_result"
+            except Exception as e:
+                stats.fallback_reason = f"error: {type(e).__name__}: {e}"
+        else:
+            stats.fallback_reason = "engine_unavailable"
+        # Fallback: time-budgeted Python search, then random play
+        reason = stats.fallback_reason
+        try:
+            play, search_stats = self._python_search(last_combo, game_state)
+            for play_option in valid_plays:
+                if play is not None and set(map(id, play_option.cards)) == set(map(id, play.cards)):
+                    search_stats.fallback_reason = reason
+                    self._finish_search(search_stats, start_time)
+                    return play_option
+            reason = "python_search_no_play"
+        except Exception as e:
+            reason = f"python_error: {type(e).__name__}: {e}"
+        stats.engine = "random"
+        stats.fallback_reason = reason
+        self._finish_search(stats, start_time)
+        return self.rng.choice(valid_plays)
+
+    def _python_search(self, last_combo, game_state):
+        """Run the Python search engine against the visible opponent"""
+        from lib.search import SearchEngine
+        if self.search_engine is None:
+            self.search_engine = SearchEngine()
+        if hasattr(game_state, 'player'):
+            opp_hand = game_state.player.hand
+            player_hp = getattr(game_state.player, 'hp', 10)
+            banned = (frozenset(), frozenset(getattr(game_state, 'banned_combo_types', ())))  # Bans apply to the player
+        else:
+            opp_hand = game_state.get('opponent_hand', [])
+            player_hp = game_state.get('player_hp', 10)
+            banned = None
+        return self.search_engine.search(self.hand, opp_hand, getattr(self, 'hp', 10), player_hp,
+                                         last_combo, budget_ms=None if self.search_nodes else self.search_budget_ms,
+                                         banned=banned, node_budget=self.search_nodes)
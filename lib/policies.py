@@ -0,0 +1,65 @@
+"""
+Move policies for headless fights.
+A policy is a callable (player, opponent, last_combo) -> Combo, or None to pass.
+lib.fight_engine.combo_policy adapts one to FightEngine actions.
+"""
+
+from typing import List
+
+from lib.enemies import PlayStyle, REGULAR_ENEMIES, ELITE_ENEMIES, BOSS_ENEMIES
+
+
+class EnemyPolicy:
+    """Move selection of a named enemy's play style, without its skill cards"""
+
+    def __init__(self, enemy_name: str, search_budget_ms: float = 10, search_nodes: int = None):
+        registry = {**REGULAR_ENEMIES, **ELITE_ENEMIES, **BOSS_ENEMIES}
+        self.name = enemy_name
+        self.enemy = registry[enemy_name]()
+        # BALANCED enemies run the search, which is handled by SearchPolicy
+        self.search = (SearchPolicy(search_budget_ms, node_budget=search_nodes)
+                       if self.enemy.play_style == PlayStyle.BALANCED else None)
+
+    def __call__(self, player, opponent, last_combo):
+        if self.search:
+            return self.search(player, opponent, last_combo)
+        valid_plays = player.find_valid_plays(last_combo)
+        if not valid_plays:
+            return None
+        if len(valid_plays) == 1:
+            return valid_plays[0]
+        if self.enemy.policy:
+            return self.enemy.policy.choose(valid_plays, player.hand, opponent.hand, player.hp, opponent.hp, last_combo)
+        if self.enemy.play_style == PlayStyle.DEFENSIVE:
+            return self.enemy._choose_defensive_play(valid_plays, last_combo, None)
+        if self.enemy.play_style == PlayStyle.AGGRESSIVE:
+            return self.enemy._choose_aggressive_play(valid_plays, last_combo, None)
+        return self.enemy._choose_combo_focused_play(valid_plays, last_combo, None)
+
+
+class SearchPolicy:
+    """Python search engine with a small per-move budget.
+    A node_budget replaces budget_ms, so the same position always gets the same move."""
+
+    def __init__(self, budget_ms: float = 10, max_depth: int = 4, evaluator=None, node_budget: int = None):
+        from lib.search import SearchEngine
+        self.name = "search"
+        self.budget_ms = None if node_budget else budget_ms
+        self.node_budget = node_budget
+        self.engine = SearchEngine(evaluator=evaluator, max_depth=max_depth)
+
+    def __call__(self, player, opponent, last_combo):
+        move, _ = self.engine.search(player.hand, opponent.hand, player.hp, opponent.hp,
+                                     last_combo, budget_ms=self.budget_ms, node_budget=self.node_budget)
+        return move
+
+
+def get_policy(name: str):
+    """Create a policy by enemy name, or "search" for the search engine"""
+    if name == "search":
+        return SearchPolicy()
+    return EnemyPolicy(name)
+
+
+def available_policies() -> List[str]:
+    return list(REGULAR_ENEMIES) + list(ELITE_ENEMIES) + list(BOSS_ENEMIES) + ["search"]
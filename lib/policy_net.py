@@ -0,0 +1,176 @@
+"""
+Distilled fast policy for regular enemies.
+A tiny NumPy network maps the position features (rank histograms, HPs, table)
+to scores over move categories. It is trained on the decisions of a deeper
+search, so at play time a move costs one forward pass instead of a search.
+"""
+
+import os
+from typing import Optional, Tuple, Dict
+
+import numpy as np
+
+from lib.combo import ComboType
+from lib.constants import PACKAGE_ROOT
+from lib.features import FEATURE_SIZE, encode_position, features_from_rows
+from lib.value_net import AdamOptimizer
+from lib.rng import RngContext
+
+DEFAULT_POLICY_PATH = os.path.join(PACKAGE_ROOT, "models", "fast_policy.npz")
+
+# Categories: combo type x (low lead, high lead), plus pass
+HIGH_LEAD_VALUE = 11  # J and above
+NUM_CATEGORIES = 2 * len(ComboType) + 1
+PASS_CATEGORY = NUM_CATEGORIES - 1
+
+
+def move_category(move) -> int:
+    """Category index of a Combo, or PASS_CATEGORY for None"""
+    if move is None:
+        return PASS_CATEGORY
+    return 2 * (move.type.value - 1) + (1 if move.lead_value >= HIGH_LEAD_VALUE else 0)
+
+
+class FastPolicy:
+    """One-hidden-layer softmax policy over move categories"""
+
+    def __init__(self, hidden_size: int = 32, seed: int = 0):
+        self.hidden_size = hidden_size
+        rng = np.random.default_rng(seed)
+        self.weights = [
+            (rng.standard_normal((FEATURE_SIZE, hidden_size)) * np.sqrt(1.0 / FEATURE_SIZE)).astype(np.float32),
+            (rng.standard_normal((hidden_size, NUM_CATEGORIES)) * np.sqrt(1.0 / hidden_size)).astype(np.float32),
+        ]
+        self.biases = [np.zeros(hidden_size, dtype=np.float32), np.zeros(NUM_CATEGORIES, dtype=np.float32)]
+
+    def forward(self, features: np.ndarray) -> np.ndarray:
+        """Category logits for a (n, FEATURE_SIZE) batch"""
+        hidden = np.maximum(features @ self.weights[0] + self.biases[0], 0.0)
+        return hidden @ self.weights[1] + self.biases[1]
+
+    def train(self, features: np.ndarray, labels: np.ndarray, epochs: int = 20, batch_size: int = 256,
+              learning_rate: float = 3e-3, validation: float = 0.1, seed: int = 0,
+              verbose: bool = True) -> Dict[str, float]:
+        """Fit with Adam on cross-entropy. Returns final loss and validation accuracy."""
+        rng = np.random.default_rng(seed)
+        features = np.asarray(features, dtype=np.float32)
+        labels = np.asarray(labels, dtype=np.int64)
+        order = rng.permutation(len(features))
+        n_val = int(len(features) * validation)
+        val_idx, train_idx = order[:n_val], order[n_val:]
+
+        optimizer = AdamOptimizer(self.weights + self.biases, learning_rate)
+        result = {}
+        for epoch in range(epochs):
+            rng.shuffle(train_idx)
+            total = 0.0
+            for start in range(0, len(train_idx), batch_size):
+                batch = train_idx[start:start + batch_size]
+                loss, grads = self._loss_and_grads(features[batch], labels[batch])
+                total += loss * len(batch)
+                optimizer.step(grads)
+            result["train_loss"] = total / max(1, len(train_idx))
+            if n_val:
+                predictions = self.forward(features[val_idx]).argmax(axis=1)
+                result["val_accuracy"] = float(np.mean(predictions == labels[val_idx]))
+            if verbose:
+                print(f"Epoch {epoch + 1}/{epochs}: " + ", ".join(f"{k}={v:.4f}" for k, v in result.items()))
+        return result
+
+    def _loss_and_grads(self, x, y):
+        hidden = np.maximum(x @ self.weights[0] + self.biases[0], 0.0)
+        logits = hidden @ self.weights[1] + self.biases[1]
+        logits -= logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+        n = len(y)
+        loss = float(-np.mean(np.log(probs[np.arange(n), y] + 1e-9)))
+
+        grad_logits = probs
+        grad_logits[np.arange(n), y] -= 1.0
+        grad_logits /= n
+        grad_hidden = (grad_logits @ self.weights[1].T) * (hidden > 0)
+        grads = [x.T @ grad_hidden, hidden.T @ grad_logits, grad_hidden.sum(axis=0), grad_logits.sum(axis=0)]
+        return loss, grads
+
+    def choose(self, valid_plays, own_hand, opp_hand, own_hp, opp_hp, last_combo):
+        """Pick a play from valid_plays, or None to pass"""
+        by_category = {}
+        for play in valid_plays:
+            by_category.setdefault(move_category(play), []).append(play)
+        if last_combo is not None:
+            by_category[PASS_CATEGORY] = [None]
+        if not by_category:
+            return None
+
+        row = np.array([encode_position(own_hand, opp_hand, own_hp, opp_hp, last_combo)], dtype=np.uint8)
+        scores = self.forward(features_from_rows(row))[0]
+        category = max(by_category, key=lambda c: scores[c])
+        # Within a category shed the lowest cards, preferring longer plays
+        return min(by_category[category], key=lambda p: (0, 0) if p is None else (p.lead_value, -len(p.cards)))
+
+    def save(self, path: str = DEFAULT_POLICY_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez(path, hidden_size=np.array(self.hidden_size),
+                 w0=self.weights[0], w1=self.weights[1], b0=self.biases[0], b1=self.biases[1])
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_POLICY_PATH) -> 'FastPolicy':
+        data = np.load(path)
+        policy = cls(hidden_size=int(data["hidden_size"]))
+        policy.weights = [data["w0"].astype(np.float32), data["w1"].astype(np.float32)]
+        policy.biases = [data["b0"].astype(np.float32), data["b1"].astype(np.float32)]
+        return policy
+
+
+class _RecordingPolicy:
+    """Wraps a policy and remembers the category of every move it makes"""
+
+    def __init__(self, policy, labels: list):
+        self.policy = policy
+        self.labels = labels
+
+    def __call__(self, player, opponent, last_combo):
+        move = self.policy(player, opponent, last_combo)
+        self.labels.append(move_category(move))
+        return move
+
+
+def record_search_decisions(num_fights: int, budget_ms: float = 50, max_depth: int = 6,
+                            seed: Optional[int] = None, progress: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Play search-vs-search fights and return (rows, move categories) for every decision"""
+    from lib.selfplay import HeadlessFight
+    from lib.policies import SearchPolicy
+    context = RngContext(seed)
+    rng = context.stream("ai")
+    search = SearchPolicy(budget_ms=budget_ms, max_depth=max_depth)
+    all_rows, all_labels = [], []
+    for i in range(num_fights):
+        labels = []
+        recorder = _RecordingPolicy(search, labels)
+        hp = rng.randint(3, 8)
+        fight = HeadlessFight((recorder, recorder), hp=(hp, hp), rng=context.spawn(i))
+        fight.play()
+        rows, _ = fight.outcomes()
+        all_rows.append(rows)
+        all_labels.append(np.array(labels, dtype=np.int64))
+        if progress and (i + 1) % 50 == 0:
+            print(f"Recorded {i + 1}/{num_fights} fights")
+    return np.concatenate(all_rows), np.concatenate(all_labels)
+
+
+_fast_policy = None
+_fast_policy_loaded = False
+
+
+def get_fast_policy(path: str = DEFAULT_POLICY_PATH) -> Optional[FastPolicy]:
+    """Shared policy loaded from the default weights, or None if it has not been trained"""
+    global _fast_policy, _fast_policy_loaded
+    if not _fast_policy_loaded:
+        _fast_policy_loaded = True
+        if os.path.exists(path):
+            try:
+                _fast_policy = FastPolicy.load(path)
+            except Exception as e:
+                print(f"Warning: Could not load fast policy {path}: {e}")
+    return _fast_policy
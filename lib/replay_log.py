@@ -0,0 +1,282 @@
+"""
+Compact binary fight logs.
+A log file is a sequence of fights. Each fight has a header with the RNG seed
+and the engine configuration, then fixed-layout events: the deal, turn starts,
+plays, passes, damage, skill/item/equipment uses and the end. Cards take one
+byte each. ReplayWriter appends events to an in-memory buffer and writes it out
+in large blocks; FightReplay re-runs a fight from its seed and events and keeps
+periodic snapshots, so any position is reconstructed from the nearest one.
+"""
+
+import json
+import struct
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from lib.core_types import Card, Suit
+from lib.rng import RngContext, STREAMS
+
+MAGIC = b"PDKLOG01"
+FIGHT_HEADER = struct.Struct("<8sQH")  # magic, seed, config length
+EVENT = struct.Struct("<BB")  # kind, side (0 player, 1 AI, 255 none)
+DAMAGE = struct.Struct("<bB")  # amount, HP after
+
+# Event kinds
+DEAL = 1
+TURN_START = 2
+PLAY = 3
+PASS = 4
+DAMAGE_TAKEN = 5
+SKILL = 6
+ITEM = 7
+EQUIPMENT = 8
+END = 9
+
+NO_SIDE = 255
+BUFFER_SIZE = 1 << 16
+CHECKPOINT_INTERVAL = 32  # Events between replay snapshots
+
+RANKS = list(Card.VALUE_MAP)
+SUITS = list(Suit)
+_RANK_INDEX = {rank: i for i, rank in enumerate(RANKS)}
+_SUIT_INDEX = {suit: i for i, suit in enumerate(SUITS)}
+
+
+def card_code(card) -> int:
+    """One byte for a card face: suit in the high nibble, rank in the low one"""
+    return (_SUIT_INDEX[card.suit] << 4) | _RANK_INDEX[card.rank]
+
+
+def card_from_code(code: int) -> Card:
+    return Card(RANKS[code & 0x0F], SUITS[code >> 4])
+
+
+class ReplayWriter:
+    """Buffered append-only writer of fight events"""
+
+    def __init__(self, path: str, buffer_size: int = BUFFER_SIZE):
+        self.path = path
+        self.buffer_size = buffer_size
+        self._file = open(path, "ab")
+        self._buffer = bytearray()
+
+    def begin_fight(self, seed: int, config: Dict[str, Any]):
+        encoded = json.dumps(config, separators=(",", ":")).encode()
+        self._buffer += FIGHT_HEADER.pack(MAGIC, seed, len(encoded))
+        self._buffer += encoded
+
+    def _event(self, kind: int, side: Optional[int], payload: bytes = b""):
+        self._buffer += EVENT.pack(kind, NO_SIDE if side is None else side)
+        self._buffer += payload
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def deal(self, player_hand, ai_hand, discard_pile):
+        codes = [bytes(card_code(c) for c in cards) for cards in (player_hand, ai_hand, discard_pile)]
+        self._event(DEAL, None, bytes(len(c) for c in codes) + b"".join(codes))
+
+    def turn_start(self, side: int):
+        self._event(TURN_START, side)
+
+    def play(self, side: int, cards):
+        self._event(PLAY, side, bytes([len(cards)]) + bytes(card_code(c) for c in cards))
+
+    def pass_turn(self, side: int):
+        self._event(PASS, side)
+
+    def damage(self, side: int, amount: int, hp: int):
+        self._event(DAMAGE_TAKEN, side, DAMAGE.pack(max(-128, min(127, amount)), max(0, min(255, hp))))
+
+    def use(self, kind: int, side: int, name: str):
+        encoded = name.encode()
+        self._event(kind, side, bytes([len(encoded)]) + encoded)
+
+    def end(self, winner_side: Optional[int]):
+        self._event(END, winner_side)
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+@dataclass
+class FightRecord:
+    """One logged fight: seed, engine configuration and decoded events"""
+    seed: int
+    config: Dict[str, Any]
+    events: List[Tuple[int, Optional[int], Any]] = field(default_factory=list)  # (kind, side, payload)
+
+    @property
+    def winner_side(self) -> Optional[int]:
+        for kind, side, _ in reversed(self.events):
+            if kind == END:
+                return side
+        return None
+
+
+def _decode_event(data, offset) -> Tuple[Tuple[int, Optional[int], Any], int]:
+    kind, side = EVENT.unpack_from(data, offset)
+    offset += EVENT.size
+    side = None if side == NO_SIDE else side
+    if kind == DEAL:
+        lengths = data[offset:offset + 3]
+        offset += 3
+        payload = []
+        for length in lengths:
+            payload.append(bytes(data[offset:offset + length]))
+            offset += length
+    elif kind == PLAY:
+        length = data[offset]
+        payload = bytes(data[offset + 1:offset + 1 + length])
+        offset += 1 + length
+    elif kind == DAMAGE_TAKEN:
+        payload = DAMAGE.unpack_from(data, offset)
+        offset += DAMAGE.size
+    elif kind in (SKILL, ITEM, EQUIPMENT):
+        length = data[offset]
+        payload = bytes(data[offset + 1:offset + 1 + length]).decode()
+        offset += 1 + length
+    else:
+        payload = None
+    return (kind, side, payload), offset
+
+
+def read_fights(path: str) -> Iterator[FightRecord]:
+    """Decode every fight in a log file"""
+    with open(path, "rb") as f:
+        data = f.read()
+    offset = 0
+    record = None
+    while offset < len(data):
+        if data[offset:offset + len(MAGIC)] == MAGIC:
+            if record is not None:
+                yield record
+            _, seed, config_length = FIGHT_HEADER.unpack_from(data, offset)
+            offset += FIGHT_HEADER.size
+            config = json.loads(data[offset:offset + config_length])
+            offset += config_length
+            record = FightRecord(seed, config)
+            continue
+        if record is None:
+            raise ValueError(f"Not a fight log: {path}")
+        event, offset = _decode_event(data, offset)
+        record.events.append(event)
+    if record is not None:
+        yield record
+
+
+def _take_cards(hand, codes):
+    """Cards in hand matching the logged faces (equal faces are interchangeable)"""
+    cards = []
+    for code in codes:
+        for card in hand:
+            if card_code(card) == code and not any(card is c for c in cards):
+                cards.append(card)
+                break
+    return cards
+
+
+class FightReplay:
+    """Re-runs a logged fight on a FightEngine with random access to positions"""
+
+    def __init__(self, record: FightRecord, checkpoint_interval: int = CHECKPOINT_INTERVAL):
+        from lib.fight_engine import FightEngine
+        from lib.enemies import EnemyType
+        self.record = record
+        self.checkpoint_interval = checkpoint_interval
+        config = record.config
+        self.engine = FightEngine(player_skill_cards=config.get("skill_cards"),
+                                  player_items=config.get("items"),
+                                  player_equipment=config.get("equipment"),
+                                  player_starting_hp=config.get("player_hp", 5),
+                                  ai_starting_hp=config.get("ai_hp", 5),
+                                  enemy_type=EnemyType(config.get("enemy_type", EnemyType.REGULAR.value)),
+                                  enemy_name=config.get("enemy_name"),
+                                  rng=RngContext(record.seed))
+        self.position = 0  # Events applied so far
+        self.divergences = 0  # Logged damage that the replay did not reproduce
+        self._checkpoints = {0: self._checkpoint()}
+
+    def _checkpoint(self):
+        # Effects draw from the RNG, so positions are only reproducible with the stream states
+        return self.engine.snapshot(), tuple(self.engine.rng.stream(name).getstate() for name in STREAMS)
+
+    def _restore(self, checkpoint):
+        state, rng_states = checkpoint
+        self.engine.restore(state)
+        for name, rng_state in zip(STREAMS, rng_states):
+            self.engine.rng.stream(name).setstate(rng_state)
+
+    def _player(self, side):
+        return self.engine.player if side == 0 else self.engine.ai
+
+    def apply(self, event):
+        engine = self.engine
+        kind, side, payload = event
+        if kind == DEAL:
+            player_codes, ai_codes, discard_codes = payload
+            engine.player.hand[:] = [card_from_code(c) for c in player_codes]
+            engine.ai.hand[:] = [card_from_code(c) for c in ai_codes]
+            engine.discard_pile[:] = [card_from_code(c) for c in discard_codes]
+        elif kind == TURN_START:
+            if hasattr(engine.ai, 'on_turn_start'):
+                engine.ai.on_turn_start(engine)
+        elif kind == PLAY:
+            player = self._player(side)
+            if engine.play_cards(player, _take_cards(player.hand, payload)):
+                engine.current_player = engine.other_player(player)
+        elif kind == PASS:
+            engine.pass_turn()
+        elif kind == DAMAGE_TAKEN:
+            if self._player(side).hp != payload[1]:
+                self.divergences += 1
+        elif kind == SKILL:
+            if side == 0:
+                card = next((c for c in engine.player_skill_cards if c.name == payload), None)
+                if card:
+                    engine.use_skill_card(card)
+            else:
+                card = next((c for c in getattr(engine.ai, 'skill_cards', []) if c.name == payload), None)
+                if card:
+                    card.use(engine)
+                    engine.ai.skill_cards.remove(card)
+        elif kind == ITEM:
+            item = next((i for i in engine.player_items if i.name == payload), None)
+            if item:
+                engine.use_item(item)
+        elif kind == EQUIPMENT:
+            equipment = next((e for e in engine.player_equipment if e.name == payload), None)
+            if equipment:
+                engine.use_equipment(equipment)
+        engine.check_game_over()
+
+    def seek(self, position: int):
+        """Engine at the position after the first `position` events"""
+        position = max(0, min(position, len(self.record.events)))
+        start = max(p for p in self._checkpoints if p <= position)
+        if position < self.position or start > self.position:
+            self._restore(self._checkpoints[start])
+            self.position = start
+        while self.position < position:
+            self.apply(self.record.events[self.position])
+            self.position += 1
+            if self.position % self.checkpoint_interval == 0 and self.position not in self._checkpoints:
+                self._checkpoints[self.position] = self._checkpoint()
+        return self.engine
+
+    def run(self):
+        """Replay to the end. Returns the engine."""
+        return self.seek(len(self.record.events))
@@ -0,0 +1,48 @@
+"""
+Seeded random streams for fights and runs.
+An RngContext holds one independent random.Random per component (dealing, map
+generation, enemy selection, card effects, AI decisions and run rewards), all
+derived from a single seed, so any fight or run replays exactly from its seed.
+spawn() derives child contexts with non-overlapping streams for pool workers.
+"""
+
+import hashlib
+import random
+from typing import Optional
+
+STREAMS = ("deal", "map", "enemy", "effects", "ai", "rewards")
+
+
+def derive_seed(*parts) -> int:
+    """Stable 63-bit seed from any repr()-able parts (independent of PYTHONHASHSEED)"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little") >> 1
+
+
+class RngContext:
+    """Independent named random streams derived from one seed"""
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        self.seed = seed
+        for name in STREAMS:
+            setattr(self, name, random.Random(derive_seed(seed, name)))
+
+    def stream(self, name: str) -> random.Random:
+        return getattr(self, name)
+
+    def spawn(self, index: int) -> 'RngContext':
+        """Child context for the index-th fight, run or worker job"""
+        return RngContext(derive_seed(self.seed, "spawn", index))
+
+    def __repr__(self):
+        return f"RngContext({self.seed})"
+
+
+def rng_stream(game_state, name: str):
+    """Named stream of the context on a game state, or the global random module without one"""
+    context = getattr(game_state, "rng", None)
+    if isinstance(context, RngContext):
+        return context.stream(name)
+    return random
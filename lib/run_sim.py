@@ -0,0 +1,305 @@
+"""
+Monte Carlo simulation of whole runs without the GUI.
+Drives RunManager over a generated region map the way the main menu does:
+path choice, fights on FightEngine, victory rewards and exchanges are decided
+by pluggable policies. Runs are spread over a process pool and streamed as one
+result dictionary per run.
+"""
+
+import io
+import os
+import time
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Any, Iterator, Callable
+
+from lib.core_types import Rarity
+from lib.enemies import EnemyType
+from lib.exchange import ExchangeNode
+from lib.fight_engine import FightEngine
+from lib.fight_sim import FightConfig, make_player_policy, SEARCH_NODES
+from lib.map_system import MapGenerator, NodeType
+from lib.player import AI_SEARCH_NODES
+from lib.profile import Profile
+from lib.rng import RngContext
+from lib.run_system import RunManager
+from lib.skill_cards import get_random_skill_cards
+
+CHUNK_SIZE = 5  # Runs per worker task
+MAX_NODES = 64  # Guard against maps that never reach the end
+
+FIGHT_NODES = {NodeType.COMBAT: EnemyType.REGULAR, NodeType.ELITE: EnemyType.ELITE, NodeType.BOSS: EnemyType.BOSS}
+RARITY_ORDER = {Rarity.COMMON: 0, Rarity.RARE: 1, Rarity.EPIC: 2}
+
+
+@dataclass
+class RunConfig:
+    """Everything a worker needs to play one simulated run"""
+    region: str = "Tutorial"
+    fight_policy: str = "smallest"
+    path_policy: str = "random"
+    reward_policy: str = "rarity"
+    exchange_policy: str = "never"
+    skill_cards: List[str] = field(default_factory=list)  # Starting inventory
+    items: List[str] = field(default_factory=list)  # Unlocked items, used in every fight
+    equipment: List[str] = field(default_factory=list)
+    equipment_slots: int = 1
+    fight_hp: int = 5
+    give_up_elites: bool = False  # Give up elite fights (1 LP) instead of playing them
+    search_budget_ms: float = 20
+    enemy_search_budget_ms: Optional[float] = None
+    search_nodes: int = SEARCH_NODES  # Node budgets replace the time budgets; 0 searches by time instead
+    enemy_search_nodes: int = AI_SEARCH_NODES
+
+
+# Path policies: (run_state, candidate nodes, rng) -> node
+
+def _path_random(run_state, nodes, rng):
+    return rng.choice(nodes)
+
+
+def _path_first(run_state, nodes, rng):
+    return nodes[0]
+
+
+def _path_safe(run_state, nodes, rng):
+    """Avoid fights when possible, and elites above all"""
+    order = {NodeType.EXCHANGE: 0, NodeType.MYSTERY: 0, NodeType.COMBAT: 1, NodeType.ELITE: 2}
+    best = min(order.get(n.node_type, 1) for n in nodes)
+    return rng.choice([n for n in nodes if order.get(n.node_type, 1) == best])
+
+
+def _path_aggressive(run_state, nodes, rng):
+    """Seek elites while life points allow it, otherwise play safe"""
+    if run_state.life_points <= 4:
+        return _path_safe(run_state, nodes, rng)
+    elites = [n for n in nodes if n.node_type == NodeType.ELITE]
+    fights = [n for n in nodes if n.node_type in FIGHT_NODES]
+    return rng.choice(elites or fights or nodes)
+
+
+PATH_POLICIES: Dict[str, Callable] = {
+    "random": _path_random,
+    "first": _path_first,
+    "safe": _path_safe,
+    "aggressive": _path_aggressive,
+}
+
+
+# Reward policies: (run_state, offered skill cards, rng) -> skill card or None to skip
+
+def _reward_first(run_state, cards, rng):
+    return cards[0] if cards else None
+
+
+def _reward_random(run_state, cards, rng):
+    return rng.choice(cards) if cards else None
+
+
+def _reward_rarity(run_state, cards, rng):
+    if not cards:
+        return None
+    best = max(RARITY_ORDER.get(c.rarity, 0) for c in cards)
+    return rng.choice([c for c in cards if RARITY_ORDER.get(c.rarity, 0) == best])
+
+
+def _reward_skip(run_state, cards, rng):
+    return None
+
+
+REWARD_POLICIES: Dict[str, Callable] = {
+    "first": _reward_first,
+    "random": _reward_random,
+    "rarity": _reward_rarity,
+    "skip": _reward_skip,
+}
+
+
+# Exchange policies: (run_state) -> two skill card names to trade, or None
+
+def _exchange_never(run_state):
+    return None
+
+
+def _exchange_commons(run_state):
+    """Trade the two lowest rarity cards, but never rare or better ones"""
+    cards = sorted(run_state.skill_cards, key=lambda c: RARITY_ORDER.get(c.rarity, 0))
+    if len(cards) < 2 or RARITY_ORDER.get(cards[1].rarity, 0) > 0:
+        return None
+    return [cards[0].name, cards[1].name]
+
+
+def _exchange_when_full(run_state):
+    """Trade two commons only when the inventory has no room left"""
+    if run_state.can_add_skill_card():
+        return None
+    return _exchange_commons(run_state)
+
+
+EXCHANGE_POLICIES: Dict[str, Callable] = {
+    "never": _exchange_never,
+    "commons": _exchange_commons,
+    "when_full": _exchange_when_full,
+}
+
+
+def _play_fight(config: RunConfig, run_manager: RunManager, enemy_type: EnemyType):
+    """One fight with the run inventory, as MainMenu.start_actual_fight sets it up"""
+    run_state = run_manager.run_state
+    run_manager.start_fight()
+    fight_config = FightConfig(policy=config.fight_policy, skill_cards=run_state.get_skill_card_names(),
+                               items=list(run_state.profile.unlocked_items),
+                               equipment=[eq.name for eq in run_state.equipped_equipment],
+                               search_budget_ms=config.search_budget_ms, search_nodes=config.search_nodes)
+    engine = FightEngine(player_skill_cards=fight_config.skill_cards,
+                         player_items=fight_config.items,
+                         player_equipment=fight_config.equipment,
+                         player_starting_hp=config.fight_hp,
+                         ai_starting_hp=config.fight_hp,
+                         enemy_type=enemy_type,
+                         run_manager=run_manager,
+                         rng=run_manager.fight_rng(),
+                         ai_search_budget_ms=config.enemy_search_budget_ms,
+                         ai_search_nodes=config.enemy_search_nodes)
+    winner = engine.play_out(make_player_policy(fight_config))
+    return engine.ai.name, winner == engine.player
+
+
+def simulate_run(config: RunConfig, seed: int, index: int = 0) -> Dict[str, Any]:
+    """Play one run to completion or failure and describe it.
+    With node budgets (the default) the same seed replays the same run."""
+    choose_path = PATH_POLICIES[config.path_policy]
+    choose_reward = REWARD_POLICIES[config.reward_policy]
+    choose_exchange = EXCHANGE_POLICIES[config.exchange_policy]
+
+    profile = Profile("Simulation", equipment_slots=config.equipment_slots,
+                      unlocked_skill_cards=set(config.skill_cards), unlocked_items=set(config.items),
+                      unlocked_equipment=set(config.equipment))
+    start = time.perf_counter()
+    nodes, fights, rewards, exchanges = [], [], [], []
+    outcome = "unfinished"
+    # Effects print to stdout, which would interleave with streamed results
+    with redirect_stdout(io.StringIO()):
+        run_manager = RunManager(profile, config.region, rng=RngContext(seed))
+        rng = run_manager.rng
+        run_state = run_manager.run_state
+        for name in config.equipment:
+            run_state.equip_item(name)
+        for name in config.skill_cards:
+            run_state.add_skill_card(name)
+        run_manager.start_run()
+        region_map = MapGenerator.generate_region_map(config.region, rng=rng.map)
+        region_map.move_to_node(region_map.start_node)
+        life_curve = [run_state.life_points]
+
+        while len(nodes) < MAX_NODES:
+            candidates = region_map.get_available_next_nodes()
+            if not candidates:
+                outcome = "map_exhausted"
+                break
+            node = choose_path(run_state, candidates, rng.ai)
+            region_map.move_to_node(node)
+            nodes.append(node.node_type.value)
+
+            if node.node_type in FIGHT_NODES:
+                if config.give_up_elites and node.node_type == NodeType.ELITE:
+                    # Same bookkeeping as MainMenu.give_up_fight
+                    run_state.life_points = max(0, run_state.life_points - 1)
+                    run_state.current_fight += 1
+                    run_state.fights_lost += 1
+                    fights.append({"node": node.node_type.value, "enemy": None, "result": "gave_up"})
+                else:
+                    enemy, won = _play_fight(config, run_manager, FIGHT_NODES[node.node_type])
+                    run_manager.end_fight(won)
+                    fights.append({"node": node.node_type.value, "enemy": enemy, "result": "win" if won else "loss"})
+                    if won and run_state.can_add_skill_card():
+                        offered = get_random_skill_cards(3, exclude=run_state.get_skill_card_names(),
+                                                         rng=rng.rewards)
+                        card = choose_reward(run_state, offered, rng.ai)
+                        if card is not None and run_state.add_skill_card_instance(card):
+                            rewards.append(card.name)
+                        else:
+                            rewards.append(None)
+            elif node.node_type == NodeType.EXCHANGE:
+                selected = choose_exchange(run_state)
+                if selected:
+                    rare_card = ExchangeNode(rng=rng.rewards).exchange_skill_cards(run_state.get_skill_card_names(), selected)
+                    if rare_card:
+                        for name in selected:
+                            run_state.remove_skill_card(name)
+                        run_state.add_skill_card_instance(rare_card)
+                        exchanges.append({"gave": selected, "got": rare_card.name})
+            life_curve.append(run_state.life_points)
+
+            if run_state.is_run_complete():
+                outcome = "complete"
+                break
+            if run_state.is_run_failed():
+                outcome = "failed"
+                break
+            region_map.complete_current_node()
+
+    return {
+        "index": index,
+        "seed": seed,
+        "result": outcome,
+        "fights_won": run_state.fights_won,
+        "fights_lost": run_state.fights_lost,
+        "life_points": run_state.life_points,
+        "life_curve": life_curve,
+        "nodes": nodes,
+        "fights": fights,
+        "rewards": rewards,
+        "exchanges": exchanges,
+        "final_skill_cards": run_state.get_skill_card_names(),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def _run_chunk(config: RunConfig, jobs) -> List[Dict[str, Any]]:
+    return [simulate_run(config, seed, index) for index, seed in jobs]
+
+
+def simulate_runs(config: RunConfig, num_runs: int, workers: int = None,
+                  seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """Yield per-run results as they finish (in completion order)"""
+    root = RngContext(seed)
+    jobs = [(i, root.spawn(i).seed) for i in range(num_runs)]
+    chunks = [jobs[i:i + CHUNK_SIZE] for i in range(0, len(jobs), CHUNK_SIZE)]
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _run_chunk(config, chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_chunk, config, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
+
+
+def summarize_runs(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Completion rate, mean life points per step and reward/exchange usage"""
+    summary = {"runs": len(results), "outcomes": {}, "rewards": {}, "exchanges": {}, "enemies": {}}
+    if not results:
+        return summary
+    for result in results:
+        summary["outcomes"][result["result"]] = summary["outcomes"].get(result["result"], 0) + 1
+        for name in result["rewards"]:
+            key = name or "skipped"
+            summary["rewards"][key] = summary["rewards"].get(key, 0) + 1
+        for exchange in result["exchanges"]:
+            summary["exchanges"][exchange["got"]] = summary["exchanges"].get(exchange["got"], 0) + 1
+        for fight in result["fights"]:
+            if fight["enemy"]:
+                entry = summary["enemies"].setdefault(fight["enemy"], {"fights": 0, "wins": 0})
+                entry["fights"] += 1
+                entry["wins"] += fight["result"] == "win"
+    summary["completion_rate"] = summary["outcomes"].get("complete", 0) / len(results)
+    summary["avg_fights_won"] = sum(r["fights_won"] for r in results) / len(results)
+
+    # A run that ended keeps its final life points for the later steps of the curve
+    steps = max(len(r["life_curve"]) for r in results)
+    summary["life_curve"] = [sum(r["life_curve"][min(step, len(r["life_curve"]) - 1)] for r in results) / len(results)
+                             for step in range(steps)]
+    return summary
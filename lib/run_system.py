@@ -4,6 +4,7 @@ from lib.profile import Profile
 from lib.skill_cards import get_skill_card, SkillCard
 from lib.items import get_item, Item
 from lib.equipment import get_equipment, Equipment
+from lib.rng import RngContext
 
 
 @dataclass
@@ -21,6 +22,7 @@ class RunState:
     equipped_equipment: List[Equipment] = field(default_factory=list)
     fights_won: int = 0
     fights_lost: int = 0
+    rng: Optional[RngContext] = None  # Run streams, shared with equipment and item effects
     
     def __post_init__(self):
         # Initialize with profile's max life points
@@ -165,8 +167,9 @@ class RunState:
 class RunManager:
     """Manages the current run"""
     
-    def __init__(self, profile: Profile, region: str):
-        self.run_state = RunState(profile, region)
+    def __init__(self, profile: Profile, region: str, rng: RngContext = None):
+        self.rng = rng or RngContext()
+        self.run_state = RunState(profile, region, rng=self.rng)
         self.current_fight = None
     
     def start_run(self):
@@ -185,6 +188,10 @@ class RunManager:
         # Later this will create actual enemy encounters
         return self.run_state.current_fight + 1
     
+    def fight_rng(self) -> RngContext:
+        """Streams for the next fight, derived from the run seed and the fight number"""
+        return self.rng.spawn(self.run_state.current_fight)
+
     def end_fight(self, won: bool):
         """End the current fight"""
         if won:
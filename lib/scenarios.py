@@ -0,0 +1,302 @@
+"""
+Constrained deals and mid-fight positions for targeted AI benchmarks.
+A ScenarioSpec describes a situation declaratively: hand sizes, rank groups
+each hand must hold (bombs, planes, straights, ...), the combo on the table
+and the HP of both sides. generate_scenario() builds it directly: the required
+groups are placed first, on ranks chosen among those the remaining cards can
+still supply, then the hands are filled at random from what is left. No blind
+rejection, so rare situations cost the same as common ones. Scenarios are
+stored as card indexes (lib.deal order) and build_corpus() derives every one
+from a seed, so a benchmark corpus is fixed by (seed, specs, count).
+"""
+
+import json
+import random
+from dataclasses import dataclass, field, asdict
+from typing import List, Optional, Tuple, Dict, Iterator
+
+from lib.combo import ComboType, identify_combo
+from lib.deal import HAND_SIZE, DECK_SIZE, STRAIGHT_RANKS, MIN_STRAIGHT, CARD_RANK, cards_from_indexes
+from lib.rng import derive_seed
+
+MAX_ATTEMPTS = 100  # Fresh placements to try before a spec is declared unsatisfiable
+
+TWO_RANK = 12
+BLACK_JOKER_RANK = 13
+RED_JOKER_RANK = 14
+TOP_RANK = TWO_RANK  # Highest rank with four cards
+TOP_RUN_RANK = STRAIGHT_RANKS - 1  # Runs stop at A
+
+
+def rank_cards(rank: int) -> List[int]:
+    """Card indexes of one rank (0 = "3" .. 12 = "2", 13/14 = jokers)"""
+    if rank == BLACK_JOKER_RANK:
+        return [52]
+    if rank == RED_JOKER_RANK:
+        return [53]
+    return [suit * 13 + rank for suit in range(4)]
+
+
+@dataclass
+class HandPattern:
+    """Rank groups a hand must hold. Each field asks for that many separate groups
+    on distinct ranks; the rest of the hand is random, so it can hold more."""
+    bombs: int = 0
+    joker_bomb: bool = False
+    triples: int = 0
+    pairs: int = 0
+    plane: int = 0  # Consecutive triples (2 or more)
+    pair_straight: int = 0  # Consecutive pairs (3 or more)
+    straight: int = 0  # Consecutive single ranks (5 or more)
+    twos: int = 0  # At least this many 2s
+
+    def groups(self) -> List[Tuple[int, int, int]]:
+        """(cards per rank, run length, highest rank) of each group, longest first"""
+        groups = []
+        if self.plane:
+            groups.append((3, self.plane, TOP_RUN_RANK))
+        if self.pair_straight:
+            groups.append((2, self.pair_straight, TOP_RUN_RANK))
+        if self.straight:
+            groups.append((1, self.straight, TOP_RUN_RANK))
+        groups += [(4, 1, TOP_RANK)] * self.bombs
+        groups += [(3, 1, TOP_RANK)] * self.triples
+        groups += [(2, 1, TOP_RANK)] * self.pairs
+        return groups
+
+    def size(self) -> int:
+        cards = sum(count * length for count, length, _ in self.groups())
+        return cards + 2 * self.joker_bomb
+
+
+# Table combos: type -> (cards per rank, default run length, highest rank,
+#                        kicker size, kickers per run rank)
+TABLE_SHAPES = {
+    ComboType.SINGLE: (1, 1, RED_JOKER_RANK, 0, 0),
+    ComboType.PAIR: (2, 1, TOP_RANK, 0, 0),
+    ComboType.TRIPLE: (3, 1, TOP_RANK, 0, 0),
+    ComboType.BOMB: (4, 1, TOP_RANK, 0, 0),
+    ComboType.STRAIGHT: (1, MIN_STRAIGHT, TOP_RUN_RANK, 0, 0),
+    ComboType.PAIR_STRAIGHT: (2, 3, TOP_RUN_RANK, 0, 0),
+    ComboType.TRIPLE_WITH_SINGLE: (3, 1, TOP_RANK, 1, 1),
+    ComboType.TRIPLE_WITH_PAIR: (3, 1, TOP_RANK, 2, 1),
+    ComboType.FOUR_WITH_TWO: (4, 1, TOP_RANK, 1, 2),
+    ComboType.PLANE: (3, 2, TOP_RUN_RANK, 0, 0),
+    ComboType.PLANE_WITH_SINGLES: (3, 2, TOP_RUN_RANK, 1, 1),
+    ComboType.PLANE_WITH_PAIRS: (3, 2, TOP_RUN_RANK, 2, 1),
+}
+
+
+@dataclass
+class ScenarioSpec:
+    """A situation to generate. The player moves next; a table combo was played by the AI."""
+    name: str
+    player_cards: int = HAND_SIZE
+    ai_cards: int = HAND_SIZE
+    player: HandPattern = field(default_factory=HandPattern)
+    ai: HandPattern = field(default_factory=HandPattern)
+    table: Optional[str] = None  # ComboType name, e.g. "PLANE"
+    table_length: int = 0  # Run length of the table combo (0 for the type's shortest)
+    player_hp: Tuple[int, int] = (5, 5)  # Inclusive range
+    ai_hp: Tuple[int, int] = (5, 5)
+
+
+@dataclass
+class Scenario:
+    """One generated position, as card indexes in lib.deal order"""
+    name: str
+    seed: int
+    player: Tuple[int, ...]
+    ai: Tuple[int, ...]
+    table: Tuple[int, ...] = ()
+    player_hp: int = 5
+    ai_hp: int = 5
+
+    def cards(self):
+        """(player hand, AI hand, table cards, cards out of play) as new Card objects"""
+        used = set(self.player) | set(self.ai) | set(self.table)
+        rest = [i for i in range(DECK_SIZE) if i not in used]
+        return (cards_from_indexes(self.player), cards_from_indexes(self.ai),
+                cards_from_indexes(self.table), cards_from_indexes(rest))
+
+    def position(self):
+        """(own hand, opponent hand, own HP, opponent HP, last combo), as SearchEngine.search takes them"""
+        player, ai, table, _ = self.cards()
+        return player, ai, self.player_hp, self.ai_hp, identify_combo(table) if table else None
+
+    def setup(self, engine):
+        """Put the scenario into an initialized FightEngine, with the player to move"""
+        player, ai, table, rest = self.cards()
+        engine.player.hand = player
+        engine.ai.hand = ai
+        engine.player.sort_hand()
+        engine.ai.sort_hand()
+        engine.player.hp = self.player_hp
+        engine.ai.hp = self.ai_hp
+        engine.discard_pile = rest + table  # Played cards go to the discard pile as they hit the table
+        engine.played_cards = table
+        engine.last_combo = identify_combo(table) if table else None
+        engine.last_player = engine.ai if table else None
+        engine.current_player = engine.player
+        engine.extra_turn_player = None
+        engine.extra_turns = 0
+        return engine
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Scenario':
+        return cls(data["name"], data["seed"], tuple(data["player"]), tuple(data["ai"]),
+                   tuple(data.get("table", ())), data.get("player_hp", 5), data.get("ai_hp", 5))
+
+
+def _place(rng: random.Random, pool: Dict[int, List[int]], claimed: set, count: int, length: int, top: int) -> Optional[List[int]]:
+    """Take a run of `length` ranks with `count` cards each from the pool, on ranks not yet claimed"""
+    starts = [start for start in range(top - length + 2)
+              if all(rank not in claimed and len(pool[rank]) >= count for rank in range(start, start + length))]
+    if not starts:
+        return None
+    start = rng.choice(starts)
+    cards = []
+    for rank in range(start, start + length):
+        taken = rng.sample(pool[rank], count)
+        for card in taken:
+            pool[rank].remove(card)
+        cards += taken
+        claimed.add(rank)
+    return cards
+
+
+def _place_pattern(rng, pool, pattern: HandPattern) -> Optional[List[int]]:
+    claimed = set()
+    cards = []
+    if pattern.joker_bomb:
+        if not (pool[BLACK_JOKER_RANK] and pool[RED_JOKER_RANK]):
+            return None
+        cards += pool[BLACK_JOKER_RANK] + pool[RED_JOKER_RANK]
+        pool[BLACK_JOKER_RANK], pool[RED_JOKER_RANK] = [], []
+    for count, length, top in pattern.groups():
+        group = _place(rng, pool, claimed, count, length, top)
+        if group is None:
+            return None
+        cards += group
+    missing = pattern.twos - sum(1 for card in cards if CARD_RANK[card] == TWO_RANK)
+    if missing > 0:
+        if len(pool[TWO_RANK]) < missing:
+            return None
+        taken = rng.sample(pool[TWO_RANK], missing)
+        for card in taken:
+            pool[TWO_RANK].remove(card)
+        cards += taken
+    return cards
+
+
+def _place_table(rng, pool, spec: ScenarioSpec) -> Optional[List[int]]:
+    combo_type = ComboType[spec.table.upper()]
+    if combo_type == ComboType.JOKER_BOMB:
+        return _place_pattern(rng, pool, HandPattern(joker_bomb=True))
+    count, length, top, kicker_size, kickers = TABLE_SHAPES[combo_type]
+    length = spec.table_length or length
+    claimed = set()
+    cards = _place(rng, pool, claimed, count, length, top)
+    if cards is None:
+        return None
+    # Singles or pairs attached on other ranks
+    for _ in range(length * kickers):
+        kicker = _place(rng, pool, claimed, kicker_size, 1, TOP_RANK)
+        if kicker is None:
+            return None
+        cards += kicker
+    combo = identify_combo(cards_from_indexes(cards))
+    if combo is None or combo.type != combo_type:
+        return None
+    return cards
+
+
+def _fill(rng, pool, cards: List[int], size: int) -> Optional[List[int]]:
+    remaining = [card for rank_cards_left in pool.values() for card in rank_cards_left]
+    missing = size - len(cards)
+    if missing < 0 or missing > len(remaining):
+        return None
+    extra = rng.sample(remaining, missing)
+    for card in extra:
+        pool[int(CARD_RANK[card])].remove(card)
+    return cards + extra
+
+
+def _attempt(rng: random.Random, spec: ScenarioSpec):
+    pool = {rank: rank_cards(rank) for rank in range(RED_JOKER_RANK + 1)}
+    table = _place_table(rng, pool, spec) if spec.table else []
+    if table is None:
+        return None
+    player = _place_pattern(rng, pool, spec.player)
+    if player is None:
+        return None
+    ai = _place_pattern(rng, pool, spec.ai)
+    if ai is None:
+        return None
+    player = _fill(rng, pool, player, spec.player_cards)
+    if player is None:
+        return None
+    ai = _fill(rng, pool, ai, spec.ai_cards)
+    if ai is None:
+        return None
+    return sorted(player), sorted(ai), table
+
+
+def generate_scenario(spec: ScenarioSpec, seed: int) -> Scenario:
+    """Build a position meeting the spec. The same seed gives the same scenario."""
+    if spec.player.size() > spec.player_cards or spec.ai.size() > spec.ai_cards:
+        raise ValueError(f"Scenario {spec.name!r}: the required groups do not fit in the hands")
+    rng = random.Random(seed)
+    for _ in range(MAX_ATTEMPTS):
+        placed = _attempt(rng, spec)
+        if placed is not None:
+            player, ai, table = placed
+            return Scenario(spec.name, seed, tuple(player), tuple(ai), tuple(table),
+                            rng.randint(*spec.player_hp), rng.randint(*spec.ai_hp))
+    raise ValueError(f"Scenario {spec.name!r} could not be satisfied in {MAX_ATTEMPTS} attempts")
+
+
+BENCHMARK_SPECS = [
+    ScenarioSpec("opening"),
+    ScenarioSpec("two_bombs", player=HandPattern(bombs=2)),
+    ScenarioSpec("joker_bomb", player=HandPattern(joker_bomb=True)),
+    ScenarioSpec("long_straight", player=HandPattern(straight=9)),
+    ScenarioSpec("face_plane", player_cards=12, ai_cards=10, table="PLANE", player=HandPattern(triples=2)),
+    ScenarioSpec("face_bomb", player_cards=10, ai_cards=8, table="BOMB", player=HandPattern(bombs=1)),
+    ScenarioSpec("face_straight", player_cards=12, ai_cards=9, table="STRAIGHT", table_length=6,
+                 player=HandPattern(straight=6)),
+    ScenarioSpec("face_triple", player_cards=9, ai_cards=9, table="TRIPLE", player=HandPattern(triples=2)),
+    ScenarioSpec("endgame_3v3", player_cards=3, ai_cards=3, player_hp=(1, 5), ai_hp=(1, 5)),
+    ScenarioSpec("endgame_pairs", player_cards=4, ai_cards=4, player=HandPattern(pairs=2), table="PAIR"),
+    ScenarioSpec("last_life", player_cards=8, ai_cards=8, player_hp=(1, 1), ai_hp=(3, 5), table="SINGLE"),
+]
+
+
+def get_spec(name: str) -> ScenarioSpec:
+    for spec in BENCHMARK_SPECS:
+        if spec.name == name:
+            return spec
+    raise KeyError(f"Unknown scenario: {name}")
+
+
+def build_corpus(specs: List[ScenarioSpec] = None, per_spec: int = 20, seed: int = 0) -> List[Scenario]:
+    """per_spec scenarios of each spec, each seeded by (seed, spec name, index)"""
+    return [generate_scenario(spec, derive_seed(seed, spec.name, i))
+            for spec in specs or BENCHMARK_SPECS for i in range(per_spec)]
+
+
+def save_corpus(path: str, scenarios: List[Scenario]):
+    """One JSON scenario per line"""
+    with open(path, "w") as f:
+        for scenario in scenarios:
+            f.write(json.dumps(scenario.to_dict()) + "\n")
+
+
+def load_corpus(path: str) -> Iterator[Scenario]:
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                yield Scenario.from_dict(json.loads(line))
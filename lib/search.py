@@ -0,0 +1,340 @@
+"""
+Pure-Python alpha-beta search over the fight rules.
+Uses the same hand evaluation as the Rust minimax, and adds iterative
+deepening under a time or node budget, a transposition table and a pluggable
+leaf evaluator. Every search reports SearchStats. A node budget makes the
+result depend only on the position, so simulations replay exactly.
+"""
+
+import time
+from typing import List, Optional, Tuple, Any, FrozenSet
+
+from lib.combo import Combo
+from lib.search_stats import SearchStats
+
+WIN_SCORE = 1000000
+HP_WEIGHT = 300
+DEFAULT_BUDGET_MS = 150
+DEFAULT_MAX_DEPTH = 8
+
+PASS = "PASS"  # Move marker for passing
+
+# Transposition table entry flags
+_EXACT = 0
+_LOWER = 1
+_UPPER = 2
+
+class _SearchTimeout(Exception):
+    pass
+
+
+def rank_counts(hand) -> Tuple[int, ...]:
+    """Count cards per rank value (3 .. Red Joker)"""
+    counts = [0] * 15
+    for card in hand:
+        counts[card.value - 3] += 1
+    return tuple(counts)
+
+
+def combo_key(combo) -> Optional[Tuple[int, int, int]]:
+    """Suit-independent key for the combo on the table"""
+    if combo is None:
+        return None
+    return (combo.type.value, combo.lead_value, len(combo.cards))
+
+
+def move_signature(move) -> Any:
+    """Suit-independent identity of a move, used for TT move ordering and caches"""
+    if move is PASS or move is None:
+        return PASS
+    return (move.type.value, move.lead_value, tuple(sorted(card.value for card in move.cards)))
+
+
+class HeuristicEvaluator:
+    """Hand-tuned leaf evaluation, a port of evaluate_position_with_hand"""
+
+    def __init__(self):
+        self._hand_cache = {}
+
+    def hand_score(self, counts: Tuple[int, ...]) -> float:
+        """Score one hand from its rank counts"""
+        score = self._hand_cache.get(counts)
+        if score is not None:
+            return score
+
+        n = sum(counts)
+        strength = 0
+        controls = 0.0
+        singles = pairs = triples = 0
+        present = []
+        for index, count in enumerate(counts):
+            if count == 0:
+                continue
+            value = index + 3
+            present.append(value)
+            if value >= 13:  # K, A, 2 and jokers
+                strength += (value - 10) * 3 * count
+            if count == 4:
+                strength += 50
+                controls += 2.0
+            if count == 1:
+                singles += 1
+            elif count == 2:
+                pairs += 1
+            elif count == 3:
+                triples += 1
+        controls += counts[12] + counts[11] * 0.7  # 2s and Aces
+
+        shape = -singles * 5 + pairs * 3 + triples * 5
+        consecutive = 0
+        for i in range(1, len(present)):
+            if present[i] == present[i - 1] + 1 and present[i] <= 14:
+                consecutive += 1
+            else:
+                if consecutive >= 4:
+                    shape += consecutive * 2
+                consecutive = 0
+        if consecutive >= 4:
+            shape += consecutive * 2
+
+        # Every rank group leaves in one turn
+        turns = max(len(present), n // 5) if n else 0
+
+        score = strength * 10 - n * 50 + controls * 100 + shape * 20 - turns * 200
+        self._hand_cache[counts] = score
+        return score
+
+    def evaluate(self, own_hand, opp_hand, own_hp, opp_hp, last_combo) -> float:
+        """Score a position from the point of view of the side to move"""
+        return (self.hand_score(rank_counts(own_hand)) - self.hand_score(rank_counts(opp_hand))
+                + HP_WEIGHT * (own_hp - opp_hp))
+
+    def evaluate_batch(self, positions) -> List[float]:
+        """Score many (own_hand, opp_hand, own_hp, opp_hp, last_combo) positions"""
+        return [self.evaluate(*position) for position in positions]
+
+
+class SearchEngine:
+    """Iterative-deepening negamax with alpha-beta and a transposition table"""
+
+    def __init__(self, evaluator=None, max_depth: int = DEFAULT_MAX_DEPTH, tt_size: int = 200000):
+        from lib.player import FightPlayer  # Imported late: lib.player uses this module
+        self.evaluator = evaluator or HeuristicEvaluator()
+        self.max_depth = max_depth
+        self.tt_size = tt_size
+        self._tt = {}
+        self._generator = FightPlayer("search")
+        self._banned = (frozenset(), frozenset())
+        self._deadline = 0.0
+        self._node_limit = float('inf')
+        self._root_best = None
+        self._reset_counters()
+
+    def _reset_counters(self):
+        self._nodes = 0
+        self._max_ply = 0
+        self._expanded = 0
+        self._children = 0
+        self._tt_probes = 0
+        self._tt_hits = 0
+
+    def clear(self):
+        """Drop the transposition table"""
+        self._tt = {}
+
+    def generate_moves(self, hand, last_combo, banned: FrozenSet = frozenset()) -> list:
+        """Legal plays for a hand, plus PASS when there is a combo to answer"""
+        self._generator.hand = hand
+        moves = self._generator.find_valid_plays(last_combo)
+        if banned:
+            moves = [move for move in moves if move.type not in banned]
+        if last_combo is not None:
+            moves.append(PASS)
+        return moves
+
+    def search(self, own_hand, opp_hand, own_hp: int, opp_hp: int, last_combo=None,
+               budget_ms: Optional[float] = DEFAULT_BUDGET_MS, max_depth: Optional[int] = None,
+               banned: Tuple[FrozenSet, FrozenSet] = None,
+               node_budget: Optional[int] = None) -> Tuple[Optional[Combo], SearchStats]:
+        """Find the best move for the side owning own_hand. Returns (combo or None to pass, stats).
+        The search stops at whichever of budget_ms and node_budget runs out first; with
+        budget_ms=None only the node count limits it, which makes the answer reproducible."""
+        start_time = time.perf_counter()
+        self._reset_counters()
+        self._banned = banned or (frozenset(), frozenset())
+        self._deadline = start_time + budget_ms / 1000.0 if budget_ms else float('inf')
+        self._node_limit = node_budget or float('inf')
+        if len(self._tt) > self.tt_size:
+            self._tt = {}
+
+        stats = SearchStats(engine="python")
+        hands = (list(own_hand), list(opp_hand))
+        hps = (own_hp, opp_hp)
+        moves = self.generate_moves(hands[0], last_combo, self._banned[0])
+        stats.root_branching = len(moves)
+
+        best_move = None
+        if not moves:
+            stats.fallback_reason = "no_valid_plays"
+        elif len(moves) == 1:
+            best_move = moves[0]
+            stats.fallback_reason = "single_option"
+        else:
+            moves = self._order_moves(moves, last_combo, None)
+            for depth in range(1, (max_depth or self.max_depth) + 1):
+                try:
+                    value, move = self._search_root(moves, hands, hps, last_combo, depth)
+                except _SearchTimeout:
+                    if best_move is None and self._root_best is not None:
+                        # Out of time in the first iteration: best of the moves scored so far
+                        best_move = self._root_best
+                        stats.fallback_reason = "budget_partial"
+                    break
+                best_move = move
+                stats.completed_depth = depth
+                # Principal move first on the next iteration
+                moves.remove(move)
+                moves.insert(0, move)
+                if abs(value) >= WIN_SCORE - 1000:
+                    break  # Forced result found
+            if best_move is None:
+                best_move = moves[0]
+                stats.fallback_reason = "budget_exhausted"
+
+        stats.nodes = self._nodes
+        stats.max_depth = self._max_ply
+        stats.avg_branching = self._children / self._expanded if self._expanded else 0.0
+        stats.tt_probes = self._tt_probes
+        stats.tt_hits = self._tt_hits
+        stats.wall_time_ms = (time.perf_counter() - start_time) * 1000.0
+        return (None if best_move is PASS else best_move), stats
+
+    def _order_moves(self, moves, last_combo, tt_signature):
+        """TT move first, then cheap plays when following and big plays when leading"""
+        if last_combo is None:
+            moves.sort(key=lambda m: (-len(m.cards), m.lead_value))
+        else:
+            moves.sort(key=lambda m: (1, 0, 0) if m is PASS else (0, len(m.cards) if m.type != last_combo.type else 0, m.lead_value))
+        if tt_signature is not None:
+            for i, move in enumerate(moves):
+                if move_signature(move) == tt_signature:
+                    moves.insert(0, moves.pop(i))
+                    break
+        return moves
+
+    def _apply(self, hands, hps, last_combo, to_move, move):
+        """Return (hands, hps, last_combo, terminal value for the mover or None)"""
+        if move is PASS:
+            new_hps = list(hps)
+            new_hps[to_move] -= 1
+            if new_hps[to_move] <= 0:
+                return hands, tuple(new_hps), None, -WIN_SCORE
+            # The table clears and the other side leads
+            return hands, tuple(new_hps), None, None
+        played = set(map(id, move.cards))
+        remaining = [card for card in hands[to_move] if id(card) not in played]
+        new_hands = (remaining, hands[1]) if to_move == 0 else (hands[0], remaining)
+        if not remaining:
+            return new_hands, hps, move, WIN_SCORE
+        return new_hands, hps, move, None
+
+    def _check_deadline(self):
+        if self._nodes >= self._node_limit or time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+    def _search_root(self, moves, hands, hps, last_combo, depth):
+        alpha, beta = -float('inf'), float('inf')
+        best_value, best_move = -float('inf'), moves[0]
+        self._root_best = None  # Best move scored so far in this iteration
+        for move in moves:
+            self._check_deadline()
+            child_hands, child_hps, child_combo, terminal = self._apply(hands, hps, last_combo, 0, move)
+            if terminal is not None:
+                value = terminal - 1 if terminal > 0 else terminal + 1
+            elif depth == 1:
+                self._nodes += 1
+                value = -self.evaluator.evaluate(child_hands[1], child_hands[0], child_hps[1], child_hps[0], child_combo)
+            else:
+                value = -self._negamax(child_hands, child_hps, child_combo, 1, depth - 1, -beta, -alpha, 1)
+            if value > best_value:
+                best_value, best_move = value, move
+            self._root_best = best_move
+            alpha = max(alpha, value)
+        return best_value, best_move
+
+    def _negamax(self, hands, hps, last_combo, to_move, depth, alpha, beta, ply):
+        self._nodes += 1
+        if ply > self._max_ply:
+            self._max_ply = ply
+        self._check_deadline()
+
+        other = 1 - to_move
+        key = (rank_counts(hands[to_move]), rank_counts(hands[other]), hps[to_move], hps[other],
+               combo_key(last_combo), self._banned[to_move])
+        self._tt_probes += 1
+        entry = self._tt.get(key)
+        tt_signature = None
+        if entry is not None:
+            self._tt_hits += 1
+            entry_depth, entry_value, entry_flag, tt_signature = entry
+            if entry_depth >= depth:
+                if entry_flag == _EXACT:
+                    return entry_value
+                if entry_flag == _LOWER and entry_value >= beta:
+                    return entry_value
+                if entry_flag == _UPPER and entry_value <= alpha:
+                    return entry_value
+
+        moves = self.generate_moves(hands[to_move], last_combo, self._banned[to_move])
+        self._check_deadline()  # Move generation is the expensive part of a node
+        self._expanded += 1
+        self._children += len(moves)
+        moves = self._order_moves(moves, last_combo, tt_signature)
+
+        alpha_orig = alpha
+        best_value, best_move = -float('inf'), None
+        exact = depth == 1
+        if exact:
+            # Frontier: evaluate all non-terminal children in one batch
+            values = [None] * len(moves)
+            leaves, leaf_slots = [], []
+            for i, move in enumerate(moves):
+                child_hands, child_hps, child_combo, terminal = self._apply(hands, hps, last_combo, to_move, move)
+                if terminal is not None:
+                    values[i] = terminal - ply if terminal > 0 else terminal + ply
+                else:
+                    leaves.append((child_hands[other], child_hands[to_move], child_hps[other], child_hps[to_move], child_combo))
+                    leaf_slots.append(i)
+            if leaves:
+                self._nodes += len(leaves)
+                if ply + 1 > self._max_ply:
+                    self._max_ply = ply + 1
+                for slot, score in zip(leaf_slots, self.evaluator.evaluate_batch(leaves)):
+                    values[slot] = -score
+            for move, value in zip(moves, values):
+                if value > best_value:
+                    best_value, best_move = value, move
+        else:
+            for move in moves:
+                child_hands, child_hps, child_combo, terminal = self._apply(hands, hps, last_combo, to_move, move)
+                if terminal is not None:
+                    value = terminal - ply if terminal > 0 else terminal + ply
+                else:
+                    value = -self._negamax(child_hands, child_hps, child_combo, other, depth - 1, -beta, -alpha, ply + 1)
+                if value > best_value:
+                    best_value, best_move = value, move
+                if value > alpha:
+                    alpha = value
+                if alpha >= beta:
+                    break
+
+        if exact:
+            flag = _EXACT  # Every child was evaluated
+        elif best_value <= alpha_orig:
+            flag = _UPPER
+        elif best_value >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self._tt[key] = (depth, best_value, flag, move_signature(best_move))
+        return best_value
@@ -0,0 +1,185 @@
+"""
+Per-decision search instrumentation.
+SearchStats describes one AI decision; SearchRecorder collects them in-process
+so a whole fight or a batch run can be summarised as histograms.
+"""
+
+from dataclasses import dataclass, asdict, fields
+from typing import List, Optional, Dict, Any, Tuple
+from collections import Counter, deque
+from itertools import islice
+import json
+
+
+@dataclass
+class SearchStats:
+    """Statistics for a single search decision"""
+    engine: str = "none"  # "rust", "python", "random", ...
+    wall_time_ms: float = 0.0
+    nodes: int = 0
+    max_depth: int = 0
+    completed_depth: int = 0
+    root_branching: int = 0
+    avg_branching: float = 0.0
+    tt_probes: int = 0
+    tt_hits: int = 0
+    fallback_reason: Optional[str] = None
+
+    @property
+    def tt_hit_rate(self) -> Optional[float]:
+        """Transposition table hit rate, or None if the engine has no table"""
+        if self.tt_probes <= 0:
+            return None
+        return self.tt_hits / self.tt_probes
+
+    def update_from_dict(self, data: Dict[str, Any]):
+        """Copy known fields from an engine result dictionary"""
+        for f in fields(self):
+            if f.name in data and data[f.name] is not None:
+                setattr(self, f.name, data[f.name])
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['tt_hit_rate'] = self.tt_hit_rate
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SearchStats':
+        stats = cls()
+        stats.update_from_dict(data)
+        return stats
+
+
+# Numeric fields that get histograms in reports
+NUMERIC_FIELDS = ["wall_time_ms", "nodes", "max_depth", "completed_depth", "root_branching", "avg_branching", "tt_hit_rate"]
+
+
+def _field_value(stats: SearchStats, name: str) -> Optional[float]:
+    value = getattr(stats, name)
+    return None if value is None else float(value)
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class SearchRecorder:
+    """Low-overhead in-process collector of SearchStats.
+    Keeps the most recent max_records decisions; older ones are dropped and counted."""
+
+    def __init__(self, enabled: bool = True, max_records: int = 100000):
+        self.enabled = enabled
+        self.max_records = max_records
+        self.records = deque(maxlen=max_records)  # (label, SearchStats)
+        self.dropped = 0
+
+    def record(self, stats: SearchStats, label: Optional[str] = None):
+        """Store one decision. Labels are usually the deciding player's name."""
+        if not self.enabled:
+            return
+        if len(self.records) == self.max_records:
+            self.dropped += 1  # The deque evicts the oldest record
+        self.records.append((label, stats))
+
+    def mark(self) -> int:
+        """Return a position that can be passed to stats() to select later records"""
+        return self.dropped + len(self.records)
+
+    def clear(self):
+        self.records.clear()
+        self.dropped = 0
+
+    def merge(self, other: 'SearchRecorder'):
+        """Add the records of another recorder (e.g. one from a worker process)"""
+        for label, stats in other.records:
+            self.record(stats, label)
+        self.dropped += other.dropped
+
+    def stats(self, since: int = 0, label: Optional[str] = None) -> List[SearchStats]:
+        """Get recorded stats, optionally from a mark() onwards and for one label.
+        Records dropped since the mark are missing; summary() reports how many were dropped."""
+        skip = max(0, since - self.dropped)
+        return [s for l, s in islice(self.records, skip, None) if label is None or l == label]
+
+    def histogram(self, field_name: str, bins: int = 10, since: int = 0,
+                  label: Optional[str] = None) -> List[Tuple[float, float, int]]:
+        """Bucket a numeric field into (low, high, count) bins"""
+        values = [v for v in (_field_value(s, field_name) for s in self.stats(since, label)) if v is not None]
+        if not values:
+            return []
+        low, high = min(values), max(values)
+        if high == low:
+            return [(low, high, len(values))]
+        width = (high - low) / bins
+        counts = [0] * bins
+        for value in values:
+            counts[min(bins - 1, int((value - low) / width))] += 1
+        return [(low + i * width, low + (i + 1) * width, counts[i]) for i in range(bins)]
+
+    def summary(self, since: int = 0, label: Optional[str] = None) -> Dict[str, Any]:
+        """Aggregate counts, percentiles, engines and fallback reasons"""
+        selected = self.stats(since, label)
+        result = {
+            "decisions": len(selected),
+            "dropped": self.dropped,
+            "engines": dict(Counter(s.engine for s in selected)),
+            "fallback_reasons": dict(Counter(s.fallback_reason for s in selected if s.fallback_reason)),
+        }
+        for name in NUMERIC_FIELDS:
+            values = sorted(v for v in (_field_value(s, name) for s in selected) if v is not None)
+            if not values:
+                continue
+            result[name] = {
+                "mean": sum(values) / len(values),
+                "p50": _percentile(values, 50),
+                "p95": _percentile(values, 95),
+                "max": values[-1],
+            }
+        return result
+
+    def dump(self, since: int = 0, label: Optional[str] = None, bins: int = 10, width: int = 40) -> str:
+        """Render a text report with one ASCII histogram per numeric field"""
+        summary = self.summary(since, label)
+        lines = [f"Search decisions: {summary['decisions']} (dropped {summary['dropped']})",
+                 f"Engines: {summary['engines']}"]
+        if summary["fallback_reasons"]:
+            lines.append(f"Fallback reasons: {summary['fallback_reasons']}")
+        for name in NUMERIC_FIELDS:
+            if name not in summary:
+                continue
+            agg = summary[name]
+            lines.append(f"\n{name}: mean={agg['mean']:.2f} p50={agg['p50']:.2f} p95={agg['p95']:.2f} max={agg['max']:.2f}")
+            buckets = self.histogram(name, bins, since, label)
+            peak = max(count for _, _, count in buckets) or 1
+            for low, high, count in buckets:
+                bar = "#" * int(round(count / peak * width))
+                lines.append(f"  {low:10.2f} - {high:10.2f} | {bar} {count}")
+        return "\n".join(lines)
+
+    def save(self, path: str):
+        """Save raw records as JSON lines"""
+        with open(path, 'w') as f:
+            for label, stats in self.records:
+                f.write(json.dumps({"label": label, **stats.to_dict()}) + "\n")
+
+    @classmethod
+    def load(cls, path: str) -> 'SearchRecorder':
+        recorder = cls()
+        with open(path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    data = json.loads(line)
+                    recorder.record(SearchStats.from_dict(data), data.get("label"))
+        return recorder
+
+
+# Shared recorder used by the AI players
+_recorder = SearchRecorder()
+
+
+def get_recorder() -> SearchRecorder:
+    """Get the process-wide search recorder"""
+    return _recorder
@@ -0,0 +1,122 @@
+"""
+Headless AI-vs-AI fights for generating training data.
+Runs FightEngine with plain players (no skill cards, items or abilities) between
+enemy play styles and the search engine, and records every decision point
+with the final outcome as compact uint8 rows (see lib.features).
+"""
+
+from typing import List, Optional, Tuple, Callable
+
+import numpy as np
+
+from lib.player import FightPlayer
+from lib.fight_engine import FightEngine, FightAction, PLAY, PASS, MAX_DECISIONS
+from lib.enemies import REGULAR_ENEMIES
+from lib.policies import get_policy, available_policies
+from lib.features import encode_position, ROW_SIZE
+from lib.rng import RngContext
+
+
+class HeadlessFight:
+    """One fight between two policies on a FightEngine with plain players (no skill cards, items or abilities)"""
+
+    def __init__(self, policies: Tuple[Callable, Callable], hp: Tuple[int, int] = (5, 5),
+                 rng: Optional[RngContext] = None, record: bool = True):
+        self.policies = policies
+        self.record = record
+        self.rows: List[Tuple[int, List[int]]] = []  # (mover, row)
+        self.players = [FightPlayer("A"), FightPlayer("B")]
+        self.engine = FightEngine(player=self.players[0], ai=self.players[1], player_starting_hp=hp[0],
+                                  ai_starting_hp=hp[1], rng=rng)
+        self.decisions = 0
+
+    @property
+    def current(self) -> int:
+        return 0 if self.engine.current_player is self.players[0] else 1
+
+    @property
+    def last_combo(self):
+        return self.engine.last_combo
+
+    @property
+    def winner(self) -> Optional[int]:
+        if self.engine.winner is None:
+            return None
+        return 0 if self.engine.winner is self.players[0] else 1
+
+    def play(self) -> Optional[int]:
+        """Play to the end. Returns the winning side (0 or 1), or None if capped."""
+        while self.winner is None and self.decisions < MAX_DECISIONS:
+            self.step()
+        return self.winner
+
+    def step(self):
+        side = self.current
+        mover, opponent = self.players[side], self.players[1 - side]
+        if self.record:
+            self.rows.append((side, encode_position(mover.hand, opponent.hand, mover.hp, opponent.hp, self.last_combo)))
+        combo = self.policies[side](mover, opponent, self.last_combo)
+        self.decisions += 1
+        if combo is None or not self.engine.step(FightAction(PLAY, combo.cards)):
+            self.engine.step(FightAction(PASS))
+
+    def outcomes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Recorded rows and outcomes (+1 mover won, -1 lost, 0 unfinished)"""
+        rows = np.array([row for _, row in self.rows], dtype=np.uint8).reshape(-1, ROW_SIZE)
+        if self.winner is None:
+            results = np.zeros(len(self.rows), dtype=np.int8)
+        else:
+            results = np.array([1 if mover == self.winner else -1 for mover, _ in self.rows], dtype=np.int8)
+        return rows, results
+
+
+def generate(num_fights: int, policy_names: List[str] = None, seed: Optional[int] = None,
+             progress: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """Play num_fights between random pairs of policies and collect (rows, outcomes)"""
+    context = RngContext(seed)
+    rng = context.stream("ai")
+    names = policy_names or available_policies()
+    policies = {name: get_policy(name) for name in names}
+    all_rows, all_outcomes = [], []
+    for i in range(num_fights):
+        pair = (policies[rng.choice(names)], policies[rng.choice(names)])
+        hp = rng.randint(3, 8)
+        fight = HeadlessFight(pair, hp=(hp, hp), rng=context.spawn(i))
+        fight.play()
+        rows, outcomes = fight.outcomes()
+        all_rows.append(rows)
+        all_outcomes.append(outcomes)
+        if progress and (i + 1) % 100 == 0:
+            print(f"Played {i + 1}/{num_fights} fights")
+    if not all_rows:
+        return np.zeros((0, ROW_SIZE), dtype=np.uint8), np.zeros(0, dtype=np.int8)
+    return np.concatenate(all_rows), np.concatenate(all_outcomes)
+
+
+def sample_positions(count: int, seed: Optional[int] = None, rate: float = 0.1,
+                     policy_names: List[str] = None) -> list:
+    """Snapshot (own_hand, opp_hand, own_hp, opp_hp, last_combo) positions from fights"""
+    context = RngContext(seed)
+    rng = context.stream("ai")
+    names = policy_names or list(REGULAR_ENEMIES)
+    policies = [get_policy(name) for name in names]
+    positions = []
+    fights = 0
+    while len(positions) < count:
+        fight = HeadlessFight((rng.choice(policies), rng.choice(policies)), rng=context.spawn(fights), record=False)
+        fights += 1
+        while fight.winner is None and fight.decisions < MAX_DECISIONS and len(positions) < count:
+            if rng.random() < rate:
+                mover, opponent = fight.players[fight.current], fight.players[1 - fight.current]
+                positions.append((list(mover.hand), list(opponent.hand), mover.hp, opponent.hp, fight.last_combo))
+            fight.step()
+    return positions
+
+
+def save_dataset(path: str, rows: np.ndarray, outcomes: np.ndarray):
+    np.savez_compressed(path, rows=rows, outcomes=outcomes)
+
+
+def load_dataset(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    data = np.load(path)
+    return data["rows"], data["outcomes"]
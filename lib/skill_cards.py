@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional, Any
 from lib.core_types import Rarity
-import pygame
+from lib.rng import rng_stream
 
 
 @dataclass
@@ -24,38 +24,8 @@ class SkillCard:
     
     def draw_hover_description(self, surface, font, card_rect, window_width, bg_color, text_color):
         """Draw a floating description box above the card when hovered"""
-        desc_text = self.description
-        box_width = 260
-        # Wrap description text to fit box width
-        wrapped = []
-        words = desc_text.split()
-        line = ""
-        for word in words:
-            test_line = line + (" " if line else "") + word
-            test_surface = font.render(test_line, True, text_color)
-            if test_surface.get_width() > box_width - 20:
-                wrapped.append(line)
-                line = word
-            else:
-                line = test_line
-        if line:
-            wrapped.append(line)
-        # Calculate box height based on number of lines
-        line_height = 18
-        padding = 20
-        box_height = len(wrapped) * line_height + padding
-        box_x = card_rect.centerx - box_width // 2
-        box_y = card_rect.top - box_height - 10
-        # Ensure box stays within screen
-        box_x = max(10, min(box_x, window_width - box_width - 10))
-        box_y = max(10, box_y)
-        desc_rect = pygame.Rect(box_x, box_y, box_width, box_height)
-        pygame.draw.rect(surface, bg_color, desc_rect)
-        pygame.draw.rect(surface, text_color, desc_rect, 2)
-        # Render wrapped description lines
-        for j, wrap_line in enumerate(wrapped):
-            wrap_surface = font.render(wrap_line, True, text_color)
-            surface.blit(wrap_surface, (desc_rect.x + 10, desc_rect.y + 10 + j * line_height))
+        from lib.ui_utils import UIUtils
+        UIUtils.draw_hover_description(surface, font, self.description, card_rect, window_width, bg_color, text_color)
 
 
 # COMMON SKILL CARDS (in order from skill_card_data.py)
@@ -81,9 +51,9 @@ class DiscardGrab(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand')):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         cards_to_take = min(2, len(game_state.discard_pile))
-        taken_cards = random.sample(game_state.discard_pile, cards_to_take)
+        taken_cards = rng.sample(game_state.discard_pile, cards_to_take)
         
         game_state.player.hand.extend(taken_cards)
         for card in taken_cards:
@@ -113,8 +83,8 @@ class CardSteal(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand')):
             return False
         
-        import random
-        stolen_card = random.choice(game_state.ai.hand)
+        rng = rng_stream(game_state, "effects")
+        stolen_card = rng.choice(game_state.ai.hand)
         game_state.player.hand.append(stolen_card)
         game_state.ai.hand.remove(stolen_card)
         
@@ -155,9 +125,9 @@ class Peek(SkillCard):
         if not self.can_use(game_state):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         cards_to_peek = min(3, len(game_state.ai.hand))
-        peeked_cards = random.sample(game_state.ai.hand, cards_to_peek)
+        peeked_cards = rng.sample(game_state.ai.hand, cards_to_peek)
         print(f"Peek reveals: {[str(card) for card in peeked_cards]}")
         return True
 
@@ -201,9 +171,9 @@ class QuickSwap(SkillCard):
         if not self.can_use(game_state):
             return False
         
-        import random
-        player_card = random.choice(game_state.player.hand)
-        ai_card = random.choice(game_state.ai.hand)
+        rng = rng_stream(game_state, "effects")
+        player_card = rng.choice(game_state.player.hand)
+        ai_card = rng.choice(game_state.ai.hand)
         
         game_state.player.hand.remove(player_card)
         game_state.ai.hand.remove(ai_card)
@@ -233,12 +203,12 @@ class Offload(SkillCard):
         if not self.can_use(game_state):
             return False
         
-        import random
-        discarded_card = random.choice(game_state.player.hand)
+        rng = rng_stream(game_state, "effects")
+        discarded_card = rng.choice(game_state.player.hand)
         game_state.player.hand.remove(discarded_card)
         game_state.discard_pile.append(discarded_card)
         
-        drawn_card = random.choice(game_state.discard_pile)
+        drawn_card = rng.choice(game_state.discard_pile)
         game_state.discard_pile.remove(drawn_card)
         game_state.player.hand.append(drawn_card)
         
@@ -260,8 +230,8 @@ class Upgrade(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand') and len(game_state.player.hand) > 0):
             return False
         
-        import random
-        card_to_upgrade = random.choice(game_state.player.hand)
+        rng = rng_stream(game_state, "effects")
+        card_to_upgrade = rng.choice(game_state.player.hand)
         # TODO: Implement rank upgrade logic
         print(f"Upgraded {card_to_upgrade}")
         return True
@@ -282,8 +252,8 @@ class Downgrade(SkillCard):
         if not (hasattr(game_state, 'ai') and hasattr(game_state.ai, 'hand') and len(game_state.ai.hand) > 0):
             return False
         
-        import random
-        card_to_downgrade = random.choice(game_state.ai.hand)
+        rng = rng_stream(game_state, "effects")
+        card_to_downgrade = rng.choice(game_state.ai.hand)
         # TODO: Implement rank downgrade logic
         print(f"Downgraded opponent's {card_to_downgrade}")
         return True
@@ -304,15 +274,15 @@ class Break(SkillCard):
         if not (hasattr(game_state, 'ai') and hasattr(game_state.ai, 'hand') and len(game_state.ai.hand) > 0):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         from lib.core_types import Card, Suit
         
-        old_card = random.choice(game_state.ai.hand)
+        old_card = rng.choice(game_state.ai.hand)
         game_state.ai.hand.remove(old_card)
         
         suits = [Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]
         ranks = ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]
-        new_card = Card(random.choice(ranks), random.choice(suits))
+        new_card = Card(rng.choice(ranks), rng.choice(suits))
         game_state.ai.hand.append(new_card)
         
         print(f"Broke opponent's {old_card} into {new_card}")
@@ -334,8 +304,8 @@ class Drop(SkillCard):
         if not (hasattr(game_state, 'ai') and hasattr(game_state.ai, 'hand') and len(game_state.ai.hand) > 0):
             return False
         
-        import random
-        dropped_card = random.choice(game_state.ai.hand)
+        rng = rng_stream(game_state, "effects")
+        dropped_card = rng.choice(game_state.ai.hand)
         game_state.ai.hand.remove(dropped_card)
         
         if hasattr(game_state, 'discard_pile'):
@@ -378,10 +348,10 @@ class SpadeMaster(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand') and len(game_state.player.hand) >= 2):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         from lib.core_types import Suit
         
-        cards_to_change = random.sample(game_state.player.hand, min(2, len(game_state.player.hand)))
+        cards_to_change = rng.sample(game_state.player.hand, min(2, len(game_state.player.hand)))
         for card in cards_to_change:
             card.suit = Suit.SPADES
         
@@ -404,10 +374,10 @@ class HeartChampion(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand') and len(game_state.player.hand) >= 2):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         from lib.core_types import Suit
         
-        cards_to_change = random.sample(game_state.player.hand, min(2, len(game_state.player.hand)))
+        cards_to_change = rng.sample(game_state.player.hand, min(2, len(game_state.player.hand)))
         for card in cards_to_change:
             card.suit = Suit.HEARTS
         
@@ -430,10 +400,10 @@ class ClubKnight(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand') and len(game_state.player.hand) >= 2):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         from lib.core_types import Suit
         
-        cards_to_change = random.sample(game_state.player.hand, min(2, len(game_state.player.hand)))
+        cards_to_change = rng.sample(game_state.player.hand, min(2, len(game_state.player.hand)))
         for card in cards_to_change:
             card.suit = Suit.CLUBS
         
@@ -456,10 +426,10 @@ class DiamondKing(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand') and len(game_state.player.hand) >= 2):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         from lib.core_types import Suit
         
-        cards_to_change = random.sample(game_state.player.hand, min(2, len(game_state.player.hand)))
+        cards_to_change = rng.sample(game_state.player.hand, min(2, len(game_state.player.hand)))
         for card in cards_to_change:
             card.suit = Suit.DIAMONDS
         
@@ -508,9 +478,9 @@ class DiscardGrab2(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand')):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         cards_to_take = min(4, len(game_state.discard_pile))
-        taken_cards = random.sample(game_state.discard_pile, cards_to_take)
+        taken_cards = rng.sample(game_state.discard_pile, cards_to_take)
         
         game_state.player.hand.extend(taken_cards)
         for card in taken_cards:
@@ -540,8 +510,8 @@ class CardSteal2(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand')):
             return False
         
-        import random
-        stolen_cards = random.sample(game_state.ai.hand, min(2, len(game_state.ai.hand)))
+        rng = rng_stream(game_state, "effects")
+        stolen_cards = rng.sample(game_state.ai.hand, min(2, len(game_state.ai.hand)))
         
         for card in stolen_cards:
             game_state.player.hand.append(card)
@@ -584,9 +554,9 @@ class Peek2(SkillCard):
         if not self.can_use(game_state):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         cards_to_peek = min(6, len(game_state.ai.hand))
-        peeked_cards = random.sample(game_state.ai.hand, cards_to_peek)
+        peeked_cards = rng.sample(game_state.ai.hand, cards_to_peek)
         print(f"Peek 2 reveals: {[str(card) for card in peeked_cards]}")
         return True
 
@@ -630,9 +600,9 @@ class QuickSwap2(SkillCard):
         if not self.can_use(game_state):
             return False
         
-        import random
-        player_cards = random.sample(game_state.player.hand, 2)
-        ai_cards = random.sample(game_state.ai.hand, 2)
+        rng = rng_stream(game_state, "effects")
+        player_cards = rng.sample(game_state.player.hand, 2)
+        ai_cards = rng.sample(game_state.ai.hand, 2)
         
         for card in player_cards:
             game_state.player.hand.remove(card)
@@ -665,13 +635,13 @@ class Offload2(SkillCard):
         if not self.can_use(game_state):
             return False
         
-        import random
-        discarded_cards = random.sample(game_state.player.hand, 2)
+        rng = rng_stream(game_state, "effects")
+        discarded_cards = rng.sample(game_state.player.hand, 2)
         for card in discarded_cards:
             game_state.player.hand.remove(card)
             game_state.discard_pile.append(card)
         
-        drawn_cards = random.sample(game_state.discard_pile, 2)
+        drawn_cards = rng.sample(game_state.discard_pile, 2)
         for card in drawn_cards:
             game_state.discard_pile.remove(card)
             game_state.player.hand.append(card)
@@ -729,8 +699,8 @@ class WildCard(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand') and len(game_state.player.hand) > 0):
             return False
         
-        import random
-        card_to_wild = random.choice(game_state.player.hand)
+        rng = rng_stream(game_state, "effects")
+        card_to_wild = rng.choice(game_state.player.hand)
         # TODO: Implement wild card marking
         print(f"Made {card_to_wild} into a wild card")
         return True
@@ -759,9 +729,9 @@ class DiscardGrab3(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand')):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         cards_to_take = min(4, len(game_state.discard_pile))
-        taken_cards = random.sample(game_state.discard_pile, cards_to_take)
+        taken_cards = rng.sample(game_state.discard_pile, cards_to_take)
         
         game_state.player.hand.extend(taken_cards)
         for card in taken_cards:
@@ -903,13 +873,13 @@ class Offload3(SkillCard):
         if not self.can_use(game_state):
             return False
         
-        import random
+        rng = rng_stream(game_state, "effects")
         hand_size = len(game_state.player.hand)
         
         game_state.discard_pile.extend(game_state.player.hand)
         game_state.player.hand.clear()
         
-        drawn_cards = random.sample(game_state.discard_pile, hand_size)
+        drawn_cards = rng.sample(game_state.discard_pile, hand_size)
         for card in drawn_cards:
             game_state.discard_pile.remove(card)
             game_state.player.hand.append(card)
@@ -967,8 +937,8 @@ class WildCard2(SkillCard):
         if not (hasattr(game_state, 'player') and hasattr(game_state.player, 'hand') and len(game_state.player.hand) >= 2):
             return False
         
-        import random
-        cards_to_wild = random.sample(game_state.player.hand, 2)
+        rng = rng_stream(game_state, "effects")
+        cards_to_wild = rng.sample(game_state.player.hand, 2)
         # TODO: Implement wild card marking
         print(f"Made {len(cards_to_wild)} cards into wild cards")
         return True
@@ -1033,37 +1003,71 @@ def get_all_skill_cards() -> List[SkillCard]:
     return [card_class() for card_class in SKILL_CARDS.values()]
 
 
-def get_random_skill_cards(count: int = 3, exclude: List[str] = None) -> List[SkillCard]:
-    """Get random skill cards for rewards"""
+def get_random_skill_cards(count: int = 3, exclude: List[str] = None, rng=None) -> List[SkillCard]:
+    """Get random skill cards for rewards, drawn from rng (a run's rewards stream) when given"""
     import random
+    rng = rng or random
     exclude = exclude or []
     available_cards = [name for name in SKILL_CARDS.keys() if name not in exclude]
     
     if count > len(available_cards):
         count = len(available_cards)
     
-    selected_names = random.sample(available_cards, count)
+    selected_names = rng.sample(available_cards, count)
     return [get_skill_card(name) for name in selected_names]
 
 
+# Loaded images by card name, and their scaled/tinted variants by (name, size, tint)
+_image_cache = {}
+_variant_cache = {}
+
+PLACEHOLDER_SIZE = (100, 140)
+
+
 def load_skill_card_image(card_name: str):
-    """Load skill card image from file"""
+    """Skill card image, or a grey placeholder if the card has none"""
+    import pygame
+    from lib.asset_manager import get_asset_manager, to_display_format
+    image = _image_cache.get(card_name)
+    if image is not None:
+        return image
+    image = get_asset_manager().image(get_skill_card_image_path(card_name))
+    if image is None:
+        image = pygame.Surface(PLACEHOLDER_SIZE)
+        image.fill((128, 128, 128))
+        image = to_display_format(image)
+    _image_cache[card_name] = image
+    return image
+
+
+def get_skill_card_surface(card_name: str, size, tint=None):
+    """Skill card image scaled to size, with an optional (color, alpha) overlay.
+    Each variant is built once; drawing code only blits the returned surface."""
     import pygame
-    import os
-    try:
-        image_path = f"assets/skill_cards/{card_name.lower().replace(' ', '_')}.png"
-        if os.path.exists(image_path):
-            return pygame.image.load(image_path)
-        else:
-            # Return placeholder image
-            placeholder = pygame.Surface((100, 140))
-            placeholder.fill((128, 128, 128))
-            return placeholder
-    except:
-        # Return placeholder on error
-        placeholder = pygame.Surface((100, 140))
-        placeholder.fill((128, 128, 128))
-        return placeholder
+    from lib.asset_manager import to_display_format
+    key = (card_name, tuple(size), tint)
+    surface = _variant_cache.get(key)
+    if surface is not None:
+        return surface
+    surface = load_skill_card_image(card_name)
+    if surface.get_size() != tuple(size):
+        surface = pygame.transform.scale(surface, size)
+    if tint is not None:
+        color, alpha = tint
+        overlay = pygame.Surface(size)
+        overlay.fill(color)
+        overlay.set_alpha(alpha)
+        surface = surface.copy()
+        surface.blit(overlay, (0, 0))
+    surface = to_display_format(surface)
+    _variant_cache[key] = surface
+    return surface
+
+
+def clear_skill_card_images():
+    """Forget loaded images, e.g. after the display mode changes"""
+    _image_cache.clear()
+    _variant_cache.clear()
 
 
 def get_skill_card_image_path(card_name: str) -> str:
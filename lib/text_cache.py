@@ -0,0 +1,111 @@
+"""
+Shared cache of rendered text surfaces.
+Screens redraw the same labels every frame (HP, section titles, button
+captions), so render_text() keeps recently rendered surfaces keyed by
+(font, text, color) with LRU eviction; a label is only re-rendered when its
+text changes. Fonts come from get_font() so every screen shares the same Font
+objects and therefore the same cache entries. Returned surfaces are shared and
+must not be drawn on. Word-wrapped lines and whole tooltip boxes are cached
+the same way, by text, font and width.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from lib.asset_manager import to_display_format
+
+TEXT_CACHE_SIZE = 1024
+
+
+class TextCache:
+    """LRU cache of font.render results"""
+
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text: str, color, antialias: bool = True) -> pygame.Surface:
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def __len__(self):
+        return len(self._surfaces)
+
+
+_text_cache = TextCache()
+_fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+_wrapped: Dict[tuple, Tuple[str, ...]] = {}
+_text_boxes: Dict[tuple, pygame.Surface] = {}
+
+
+def render_text(font, text: str, color, antialias: bool = True) -> pygame.Surface:
+    """font.render(text, antialias, color) through the shared cache"""
+    return _text_cache.render(font, text, color, antialias)
+
+
+def get_text_cache() -> TextCache:
+    return _text_cache
+
+
+def get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """Shared Font object for a font file (None for the default font) and size"""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = _fonts[key] = pygame.font.Font(name, size)
+    return font
+
+
+def wrap_text(font, text: str, width: int) -> Tuple[str, ...]:
+    """Lines of text word-wrapped to fit width pixels"""
+    key = (font, text, width)
+    lines = _wrapped.get(key)
+    if lines is not None:
+        return lines
+    wrapped = []
+    line = ""
+    for word in text.split():
+        test_line = line + (" " if line else "") + word
+        if font.size(test_line)[0] > width:
+            wrapped.append(line)
+            line = word
+        else:
+            line = test_line
+    if line:
+        wrapped.append(line)
+    lines = _wrapped[key] = tuple(wrapped)
+    return lines
+
+
+def render_text_box(font, text: str, width: int, bg_color, text_color, line_height: int = 18,
+                    padding: int = 10) -> pygame.Surface:
+    """Bordered box of word-wrapped text, width pixels wide, rendered once per text and style"""
+    key = (font, text, width, tuple(bg_color), tuple(text_color), line_height, padding)
+    box = _text_boxes.get(key)
+    if box is not None:
+        return box
+    lines = wrap_text(font, text, width - 2 * padding)
+    box = pygame.Surface((width, len(lines) * line_height + 2 * padding))
+    box.fill(bg_color)
+    pygame.draw.rect(box, text_color, box.get_rect(), 2)
+    for j, line in enumerate(lines):
+        box.blit(render_text(font, line, text_color), (padding, padding + j * line_height))
+    box = _text_boxes[key] = to_display_format(box)
+    return box
@@ -0,0 +1,255 @@
+"""
+Round-robin tournaments between player policies and enemy templates.
+Entrants are "policy:<name>" (any lib.fight_sim player policy, on a plain
+player) or "enemy:<name>" (a full enemy template with its HP, play style,
+abilities, skill cards and items). Policies meet each other on plain players
+and meet enemy templates in the seat the game gives them; two templates never
+meet because enemy abilities act on the player side. Every pairing is played in
+batches over a process pool and stops once its win rate is settled. Ratings
+come from a Bradley-Terry fit on all results, on the Elo scale, with
+confidence intervals from the fit's Fisher information.
+"""
+
+import io
+import math
+import os
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import List, Dict, Tuple, Iterator, Optional
+
+import numpy as np
+
+from lib.enemies import REGULAR_ENEMIES, ELITE_ENEMIES, BOSS_ENEMIES
+from lib.fight_engine import FightEngine
+from lib.fight_sim import FightConfig, simulate_fight, make_player_policy, player_policy_names, SEARCH_NODES
+from lib.player import FightPlayer, AI_SEARCH_NODES
+from lib.rng import RngContext, derive_seed
+
+POLICY = "policy"
+ENEMY = "enemy"
+
+BASE_RATING = 1500
+ELO_SCALE = 400 / math.log(10)  # Elo points per unit of log-strength
+CONFIDENCE_Z = 1.96  # 95% rating intervals
+STOP_Z = 2.58  # Stricter, since a pairing is checked after every batch
+PRIOR_FIGHTS = 1.0  # Virtual drawn fight per pairing, keeps unbeaten entrants finite
+
+TIERS = {"regular": REGULAR_ENEMIES, "elite": ELITE_ENEMIES, "boss": BOSS_ENEMIES}
+
+
+def parse_entrant(entrant: str) -> Tuple[str, str]:
+    """("policy" or "enemy", name) of an entrant string"""
+    kind, _, name = entrant.partition(":")
+    if kind == POLICY and name in player_policy_names():
+        return kind, name
+    if kind == ENEMY and any(name in registry for registry in TIERS.values()):
+        return kind, name
+    raise ValueError(f"Unknown entrant {entrant!r}: use policy:<player policy> or enemy:<enemy name>")
+
+
+def enemy_tier(entrant: str) -> Optional[str]:
+    kind, name = parse_entrant(entrant)
+    if kind != ENEMY:
+        return None
+    return next(tier for tier, registry in TIERS.items() if name in registry)
+
+
+def default_entrants() -> List[str]:
+    policies = ["smallest", "search"] + list(REGULAR_ENEMIES)
+    enemies = [name for registry in TIERS.values() for name in registry]
+    return [f"{POLICY}:{name}" for name in policies] + [f"{ENEMY}:{name}" for name in enemies]
+
+
+@dataclass
+class TournamentConfig:
+    """Roster and stopping rule of a tournament"""
+    entrants: List[str] = field(default_factory=default_entrants)
+    player_hp: int = 5
+    search_budget_ms: float = 20
+    enemy_search_budget_ms: Optional[float] = None
+    search_nodes: int = SEARCH_NODES  # Node budgets replace the time budgets; 0 searches by time instead
+    enemy_search_nodes: int = AI_SEARCH_NODES
+    batch_size: int = 10  # Fights per worker task
+    min_fights: int = 20  # Fights before a pairing may stop
+    max_fights: int = 200
+    margin: float = 0.1  # Also stop once the win rate is known to within this
+
+
+@dataclass
+class PairingRecord:
+    """Results of one pairing, from the first entrant's side"""
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+
+    @property
+    def fights(self) -> int:
+        return self.wins + self.losses + self.draws
+
+    @property
+    def score(self) -> float:
+        return (self.wins + 0.5 * self.draws) / self.fights if self.fights else 0.5
+
+    def add(self, score: float):
+        if score == 1:
+            self.wins += 1
+        elif score == 0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def interval(self, z: float = CONFIDENCE_Z) -> Tuple[float, float]:
+        return wilson_interval(self.score, self.fights, z)
+
+    def settled(self, config: TournamentConfig) -> bool:
+        """Enough fights that the winner, or a near-even result, is clear"""
+        if self.fights >= config.max_fights:
+            return True
+        if self.fights < config.min_fights:
+            return False
+        low, high = self.interval(STOP_Z)
+        return low > 0.5 or high < 0.5 or high - low < 2 * config.margin
+
+
+def wilson_interval(score: float, n: int, z: float = CONFIDENCE_Z) -> Tuple[float, float]:
+    """Wilson score interval of a win rate"""
+    if n == 0:
+        return 0.0, 1.0
+    denominator = 1 + z * z / n
+    center = (score + z * z / (2 * n)) / denominator
+    spread = z * math.sqrt(score * (1 - score) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - spread), min(1.0, center + spread)
+
+
+def pairings(entrants: List[str]) -> List[Tuple[str, str]]:
+    """Every pair of entrants that can meet, policies first"""
+    pairs = []
+    for a, b in combinations(entrants, 2):
+        kind_a, kind_b = parse_entrant(a)[0], parse_entrant(b)[0]
+        if kind_a == ENEMY and kind_b == ENEMY:
+            continue
+        pairs.append((b, a) if kind_a == ENEMY else (a, b))
+    return pairs
+
+
+def play_match(config: TournamentConfig, pairing: Tuple[str, str], seed: int, index: int) -> float:
+    """Score of the pairing's first entrant in one fight: 1 win, 0 loss, 0.5 unfinished"""
+    (_, first), (kind, second) = parse_entrant(pairing[0]), parse_entrant(pairing[1])
+    if kind == ENEMY:
+        fight_config = FightConfig(policy=first, enemy_name=second, player_hp=config.player_hp, use_loadout=False,
+                                   search_budget_ms=config.search_budget_ms,
+                                   enemy_search_budget_ms=config.enemy_search_budget_ms,
+                                   search_nodes=config.search_nodes, enemy_search_nodes=config.enemy_search_nodes)
+        result = simulate_fight(fight_config, seed, index)["result"]
+        return {"win": 1.0, "loss": 0.0}.get(result, 0.5)
+
+    # Two policies on plain players; seats alternate between fights
+    policies = [make_player_policy(FightConfig(policy=name, search_budget_ms=config.search_budget_ms,
+                                               search_nodes=config.search_nodes))
+                for name in (first, second)]
+    swap = index % 2 == 1
+    with redirect_stdout(io.StringIO()):
+        engine = FightEngine(player=FightPlayer("A"), ai=FightPlayer("B"), player_starting_hp=config.player_hp,
+                             ai_starting_hp=config.player_hp, rng=RngContext(seed))
+        winner = engine.play_out(*(reversed(policies) if swap else policies))
+    if winner is None:
+        return 0.5
+    return float((winner is engine.player) != swap)
+
+
+def _run_batch(config: TournamentConfig, pairing: Tuple[str, str], jobs) -> Tuple[Tuple[str, str], List[float]]:
+    return pairing, [play_match(config, pairing, seed, index) for index, seed in jobs]
+
+
+def run_tournament(config: TournamentConfig, workers: int = None,
+                   seed: int = 0) -> Iterator[Tuple[Tuple[str, str], List[float], PairingRecord]]:
+    """Play batches of every unsettled pairing until all are settled.
+    Yields (pairing, batch scores, pairing record so far) as batches finish."""
+    records = {pairing: PairingRecord() for pairing in pairings(config.entrants)}
+    submitted = {pairing: 0 for pairing in records}
+    workers = workers or os.cpu_count() or 1
+
+    def next_batch(pairing):
+        start = submitted[pairing]
+        count = min(config.batch_size, config.max_fights - start)
+        submitted[pairing] += count
+        return [(i, derive_seed(seed, pairing, i)) for i in range(start, start + count)]
+
+    if workers <= 1:
+        pending = [p for p in records]
+        while pending:
+            for pairing in pending:
+                _, scores = _run_batch(config, pairing, next_batch(pairing))
+                for score in scores:
+                    records[pairing].add(score)
+                yield pairing, scores, records[pairing]
+            pending = [p for p in pending if not records[p].settled(config)]
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_run_batch, config, p, next_batch(p)) for p in records}
+        while futures:
+            done = next(as_completed(futures))
+            futures.remove(done)
+            pairing, scores = done.result()
+            record = records[pairing]
+            for score in scores:
+                record.add(score)
+            yield pairing, scores, record
+            # One batch in flight per pairing, so stopping decisions see every result
+            if not record.settled(config):
+                futures.add(pool.submit(_run_batch, config, pairing, next_batch(pairing)))
+
+
+def bradley_terry(records: Dict[Tuple[str, str], PairingRecord], iterations: int = 1000,
+                  tolerance: float = 1e-9) -> Dict[str, Dict[str, float]]:
+    """Elo-scale ratings with confidence intervals from pairwise records.
+    Draws count as half a win for each side."""
+    names = sorted({name for pairing in records for name in pairing})
+    index = {name: i for i, name in enumerate(names)}
+    n = len(names)
+    wins = np.zeros((n, n))  # wins[i, j]: score of i against j
+    for (a, b), record in records.items():
+        i, j = index[a], index[b]
+        half_prior = PRIOR_FIGHTS / 2
+        wins[i, j] += record.wins + 0.5 * record.draws + half_prior
+        wins[j, i] += record.losses + 0.5 * record.draws + half_prior
+    games = wins + wins.T
+
+    # Minorization-maximization updates (Hunter 2004)
+    strength = np.ones(n)
+    total_wins = wins.sum(axis=1)
+    for _ in range(iterations):
+        denominator = (games / (strength[:, None] + strength[None, :])).sum(axis=1)
+        updated = np.where(denominator > 0, total_wins / np.maximum(denominator, 1e-300), strength)
+        updated /= np.exp(np.log(updated).mean())
+        converged = np.max(np.abs(updated - strength)) < tolerance
+        strength = updated
+        if converged:
+            break
+
+    # Covariance of the log-strengths: pseudo-inverse of the Fisher information
+    p = strength[:, None] / (strength[:, None] + strength[None, :])
+    weight = games * p * p.T
+    information = np.diag(weight.sum(axis=1)) - weight
+    errors = np.sqrt(np.maximum(np.diag(np.linalg.pinv(information)), 0))
+
+    ratings = {}
+    for name, theta, error in zip(names, np.log(strength), errors):
+        rating = BASE_RATING + ELO_SCALE * theta
+        spread = CONFIDENCE_Z * ELO_SCALE * error
+        ratings[name] = {"rating": float(rating), "low": float(rating - spread), "high": float(rating + spread),
+                         "fights": int(sum(r.fights for p, r in records.items() if name in p))}
+    return ratings
+
+
+def tier_ratings(ratings: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    """Mean rating of the enemy templates in each tier"""
+    tiers = {}
+    for name, entry in ratings.items():
+        tier = enemy_tier(name)
+        if tier:
+            tiers.setdefault(tier, []).append(entry["rating"])
+    return {tier: sum(tiers[tier]) / len(tiers[tier]) for tier in TIERS if tier in tiers}
@@ -5,6 +5,7 @@ Centralized location for all shared UI drawing functions.
 
 import pygame
 from lib.constants import *
+from lib.text_cache import render_text, render_text_box
 
 
 class UIUtils:
@@ -21,7 +22,7 @@ class UIUtils:
         pygame.draw.rect(screen, TEXT_COLOR, rect, 2)
         
         text_color = TEXT_COLOR if not disabled else (150, 150, 150)
-        text_surface = font.render(text, True, text_color)
+        text_surface = render_text(font, text, text_color)
         text_rect = text_surface.get_rect(center=rect.center)
         screen.blit(text_surface, text_rect)
     
@@ -35,7 +36,7 @@ class UIUtils:
         pygame.draw.rect(screen, color, rect)
         pygame.draw.rect(screen, TEXT_COLOR, rect, 2)
         
-        text_surface = font.render(text, True, TEXT_COLOR)
+        text_surface = render_text(font, text, TEXT_COLOR)
         text_rect = text_surface.get_rect(midleft=(rect.x + 10, rect.centery))
         screen.blit(text_surface, text_rect)
     
@@ -46,10 +47,22 @@ class UIUtils:
         pygame.draw.rect(screen, color, rect)
         pygame.draw.rect(screen, TEXT_COLOR, rect, 2)
         
-        text_surface = font.render(text, True, TEXT_COLOR)
+        text_surface = render_text(font, text, TEXT_COLOR)
         text_rect = text_surface.get_rect(midleft=(rect.x + 10, rect.centery))
         screen.blit(text_surface, text_rect)
     
+    @staticmethod
+    def draw_hover_description(screen, font, text, anchor_rect, window_width, bg_color=BLACK_COLOR,
+                               text_color=TEXT_COLOR, box_width=260):
+        """Draw a description box above anchor_rect, kept on screen; returns its rect"""
+        box = render_text_box(font, text, box_width, bg_color, text_color)
+        box_x = anchor_rect.centerx - box_width // 2
+        box_y = anchor_rect.top - box.get_height() - 10
+        # Ensure box stays within screen
+        box_x = max(10, min(box_x, window_width - box_width - 10))
+        box_y = max(10, box_y)
+        return screen.blit(box, (box_x, box_y))
+    
     @staticmethod
     def center_button(window_width, button_width, y_pos, button_height=40):
         """Calculate centered button rectangle"""
@@ -59,7 +72,7 @@ class UIUtils:
     @staticmethod
     def draw_title(screen, font, text, y_pos, window_width):
         """Draw centered title text"""
-        title_surface = font.render(text, True, TEXT_COLOR)
+        title_surface = render_text(font, text, TEXT_COLOR)
         title_rect = title_surface.get_rect(center=(window_width // 2, y_pos))
         screen.blit(title_surface, title_rect)
         return title_rect
\ No newline at end of file
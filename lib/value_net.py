@@ -0,0 +1,173 @@
+"""
+Small CPU-only NumPy MLP value function for the search's leaf evaluation.
+Trained on self-play outcomes (lib.selfplay); ValueNetEvaluator is a drop-in
+replacement for HeuristicEvaluator in SearchEngine.
+"""
+
+import os
+import time
+from typing import List, Optional, Dict
+
+import numpy as np
+
+from lib.constants import PACKAGE_ROOT
+from lib.features import FEATURE_SIZE, encode_batch, features_from_rows
+
+DEFAULT_WEIGHTS_PATH = os.path.join(PACKAGE_ROOT, "models", "value_net.npz")
+
+VALUE_SCALE = 10000.0  # Network output [-1, 1] mapped into search score units
+MAX_NODES_SLOWDOWN = 3.0  # Allowed drop in search nodes/sec against the heuristic
+
+
+class AdamOptimizer:
+    """Adam updates applied in place to a list of NumPy parameter arrays"""
+
+    def __init__(self, params: List[np.ndarray], learning_rate: float = 1e-3,
+                 beta1: float = 0.9, beta2: float = 0.999, eps: float = 1e-8):
+        self.params = params
+        self.learning_rate = learning_rate
+        self.beta1, self.beta2, self.eps = beta1, beta2, eps
+        self.m = [np.zeros_like(p) for p in params]
+        self.v = [np.zeros_like(p) for p in params]
+        self.t = 0
+
+    def step(self, grads: List[np.ndarray]):
+        self.t += 1
+        for i, (p, g) in enumerate(zip(self.params, grads)):
+            self.m[i] = self.beta1 * self.m[i] + (1 - self.beta1) * g
+            self.v[i] = self.beta2 * self.v[i] + (1 - self.beta2) * g * g
+            m_hat = self.m[i] / (1 - self.beta1 ** self.t)
+            v_hat = self.v[i] / (1 - self.beta2 ** self.t)
+            p -= (self.learning_rate * m_hat / (np.sqrt(v_hat) + self.eps)).astype(np.float32)
+
+    """Fully connected ReLU network with a tanh output, predicting the mover's outcome in [-1, 1]"""
+class ValueNet:
+    """Fully connected tanh network predicting the mover's outcome in [-1, 1]"""
+
+    def __init__(self, hidden_sizes: List[int] = None, seed: int = 0):
+        self.hidden_sizes = list(hidden_sizes or [64, 32])
+        rng = np.random.default_rng(seed)
+        sizes = [FEATURE_SIZE] + self.hidden_sizes + [1]
+        self.weights = [(rng.standard_normal((n_in, n_out)) * np.sqrt(1.0 / n_in)).astype(np.float32)
+                        for n_in, n_out in zip(sizes[:-1], sizes[1:])]
+        self.biases = [np.zeros(n_out, dtype=np.float32) for n_out in sizes[1:]]
+
+    def forward(self, features: np.ndarray) -> np.ndarray:
+        """Predicted values for a (n, FEATURE_SIZE) batch"""
+        x = features
+        for w, b in zip(self.weights[:-1], self.biases[:-1]):
+            x = np.maximum(x @ w + b, 0.0)
+        return np.tanh(x @ self.weights[-1] + self.biases[-1])[:, 0]
+
+    def train(self, features: np.ndarray, targets: np.ndarray, epochs: int = 10, batch_size: int = 256,
+              learning_rate: float = 1e-3, validation: float = 0.1, seed: int = 0,
+              verbose: bool = True) -> Dict[str, float]:
+        """Fit with Adam on mean squared error. Returns final train/validation losses."""
+        rng = np.random.default_rng(seed)
+        features = np.asarray(features, dtype=np.float32)
+        targets = np.asarray(targets, dtype=np.float32)
+        order = rng.permutation(len(features))
+        n_val = int(len(features) * validation)
+        val_idx, train_idx = order[:n_val], order[n_val:]
+
+        optimizer = AdamOptimizer(self.weights + self.biases, learning_rate)
+        result = {}
+        for epoch in range(epochs):
+            rng.shuffle(train_idx)
+            total = 0.0
+            for start in range(0, len(train_idx), batch_size):
+                batch = train_idx[start:start + batch_size]
+                loss, grads = self._loss_and_grads(features[batch], targets[batch])
+                total += loss * len(batch)
+                optimizer.step(grads)
+            result["train_loss"] = total / max(1, len(train_idx))
+            if n_val:
+                result["val_loss"] = float(np.mean((self.forward(features[val_idx]) - targets[val_idx]) ** 2))
+            if verbose:
+                print(f"Epoch {epoch + 1}/{epochs}: " + ", ".join(f"{k}={v:.4f}" for k, v in result.items()))
+        return result
+
+    def _loss_and_grads(self, x, y):
+        activations = [x]
+        for w, b in zip(self.weights[:-1], self.biases[:-1]):
+            activations.append(np.maximum(activations[-1] @ w + b, 0.0))
+        out = np.tanh(activations[-1] @ self.weights[-1] + self.biases[-1])[:, 0]
+        diff = out - y
+        loss = float(np.mean(diff ** 2))
+
+        grad = (2.0 * diff / len(y) * (1.0 - out ** 2))[:, None]
+        weight_grads, bias_grads = [], []
+        for layer in range(len(self.weights) - 1, -1, -1):
+            weight_grads.insert(0, activations[layer].T @ grad)
+            bias_grads.insert(0, grad.sum(axis=0))
+            if layer > 0:
+                grad = (grad @ self.weights[layer].T) * (activations[layer] > 0)
+        return loss, weight_grads + bias_grads
+
+    def save(self, path: str = DEFAULT_WEIGHTS_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        arrays = {f"w{i}": w for i, w in enumerate(self.weights)}
+        arrays.update({f"b{i}": b for i, b in enumerate(self.biases)})
+        np.savez(path, hidden_sizes=np.array(self.hidden_sizes), **arrays)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_WEIGHTS_PATH) -> 'ValueNet':
+        data = np.load(path)
+        net = cls(hidden_sizes=[int(n) for n in data["hidden_sizes"]])
+        net.weights = [data[f"w{i}"].astype(np.float32) for i in range(len(net.weights))]
+        net.biases = [data[f"b{i}"].astype(np.float32) for i in range(len(net.biases))]
+        return net
+
+
+class ValueNetEvaluator:
+    """Leaf evaluator for SearchEngine backed by a ValueNet"""
+
+    def __init__(self, net: ValueNet, scale: float = VALUE_SCALE):
+        self.net = net
+        self.scale = scale
+
+    def evaluate(self, own_hand, opp_hand, own_hp, opp_hp, last_combo) -> float:
+        return self.evaluate_batch([(own_hand, opp_hand, own_hp, opp_hp, last_combo)])[0]
+
+    def evaluate_batch(self, positions) -> List[float]:
+        if not positions:
+            return []
+        values = self.net.forward(features_from_rows(encode_batch(positions)))
+        return (values * self.scale).tolist()
+
+
+def load_value_evaluator(path: str = DEFAULT_WEIGHTS_PATH) -> Optional[ValueNetEvaluator]:
+    """Load trained weights as a leaf evaluator, or None if there are none"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return ValueNetEvaluator(ValueNet.load(path))
+    except Exception as e:
+        print(f"Warning: Could not load value network {path}: {e}")
+        return None
+
+
+def benchmark_nodes_per_sec(evaluator, positions, budget_ms: float = 200) -> Dict[str, float]:
+    """Search nodes/sec with the given evaluator against the heuristic on the same positions"""
+    from lib.search import SearchEngine, HeuristicEvaluator
+
+    def nodes_per_sec(leaf_evaluator):
+        engine = SearchEngine(evaluator=leaf_evaluator)
+        nodes, elapsed = 0, 0.0
+        for own_hand, opp_hand, own_hp, opp_hp, last_combo in positions:
+            engine.clear()
+            start = time.perf_counter()
+            _, stats = engine.search(own_hand, opp_hand, own_hp, opp_hp, last_combo, budget_ms=budget_ms)
+            elapsed += time.perf_counter() - start
+            nodes += stats.nodes
+        return nodes / elapsed if elapsed else 0.0
+
+    baseline = nodes_per_sec(HeuristicEvaluator())
+    learned = nodes_per_sec(evaluator)
+    slowdown = baseline / learned if learned else float('inf')
+    return {
+        "heuristic_nodes_per_sec": baseline,
+        "evaluator_nodes_per_sec": learned,
+        "slowdown": slowdown,
+        "within_budget": slowdown <= MAX_NODES_SLOWDOWN,
+    }
@@ -1,26 +1,35 @@
 import pygame
 import sys
 from lib.constants import *
-from lib.core_types import Card, Suit
+from lib.text_cache import render_text, get_font
+from lib.asset_manager import get_asset_manager
+from lib.frame_profiler import FrameProfiler
+from lib.deal import deal_cards
+from lib.card_faces import get_card_faces
 from lib.ui_utils import UIUtils
 from lib.profile import ProfileManager, Profile
 from lib.run_system import RunManager
 from lib.enhanced_game import EnhancedFightGame
 from lib.player import FightPlayer
-from lib.skill_cards import get_random_skill_cards, get_skill_card, load_skill_card_image
+from lib.skill_cards import get_random_skill_cards, get_skill_card, get_skill_card_surface
 from lib.equipment import get_all_equipment, get_equipment
 from lib.map_system import MapGenerator, MapRenderer, RegionMap, NodeType
 from lib.enemies import EnemyType
 from lib.exchange import ExchangeNode
-import random
 
 
 class MainMenu:
+    # Phases timed by the frame profiler (F3)
+    PROFILED_METHODS = ("handle_click", "handle_keydown", "draw", "draw_main_menu", "draw_profile_select",
+                        "draw_create_profile", "draw_region_select", "draw_equipment_select", "draw_map_view",
+                        "draw_pre_fight", "draw_reward_select", "draw_exchange")
+
     def __init__(self, screen):
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)
-        self.small_font = pygame.font.Font(None, 24)
+        self.font = get_font(None, 36)
+        self.small_font = get_font(None, 24)
+        self.card_faces = get_card_faces(self.small_font)
         self.profile_manager = ProfileManager()
         
         # Menu states
@@ -69,27 +78,26 @@ class MainMenu:
         self.selected_equipment = []
         self.confirm_equipment_button = pygame.Rect(center_x, WINDOW_HEIGHT - 80, BUTTON_WIDTH, BUTTON_HEIGHT)
         
+        # Map art is needed right away, skill card art loads in the background (or from atlases in one read)
+        assets = get_asset_manager()
+        if not assets.preload_atlas("images/map.atlas.json", label="map"):
+            assets.preload(assets.image_paths("images/map"), label="map")
+        if not assets.preload_atlas("images/skill_cards.atlas.json", label="skill card"):
+            assets.preload(assets.image_paths("images/skill_cards"), background=True, label="skill card")
+        
         # Map system
         self.current_map = None
         self.map_renderer = MapRenderer()
         
+        self.profiler = FrameProfiler("menu", self, self.PROFILED_METHODS)
+        
     def draw_button(self, rect, text, hover=False, disabled=False):
         """Draw button using centralized UI utilities"""
         UIUtils.draw_button(self.screen, self.font, rect, text, hover, disabled)
         
     def draw_card(self, card, x, y):
         """Draw a card at the specified position"""
-        pygame.draw.rect(self.screen, CARD_COLOR, (x, y, CARD_WIDTH, CARD_HEIGHT))
-        pygame.draw.rect(self.screen, TEXT_COLOR, (x, y, CARD_WIDTH, CARD_HEIGHT), 2)
-
-        # Draw rank
-        color = RED_COLOR if card.suit in [Suit.HEARTS, Suit.DIAMONDS] else BLACK_COLOR
-        rank_text = self.small_font.render(card.rank, True, color)
-        self.screen.blit(rank_text, (x + 5, y + 5))
-
-        # Draw suit
-        suit_text = self.small_font.render(card.suit.value, True, color)
-        self.screen.blit(suit_text, (x + 5, y + 25))
+        self.screen.blit(self.card_faces.face(card), (x, y))
         
     def draw_hand_preview(self, player, y_pos):
         """Draw player's hand for preview"""
@@ -119,10 +127,8 @@ class MainMenu:
         total_width = num_cards * CARD_WIDTH + (num_cards - 1) * card_spacing
         start_x = margin + (available_width - total_width) // 2
         
-        for i, card in enumerate(player.hand):
-            x = start_x + i * (CARD_WIDTH + card_spacing)
-            y = y_pos
-            self.draw_card(card, x, y)
+        positions = [(start_x + i * (CARD_WIDTH + card_spacing), y_pos) for i in range(num_cards)]
+        self.card_faces.draw_row(self.screen, player.hand, positions)
         
     def draw_input_box(self, rect, text, active=False):
         """Draw an input box"""
@@ -130,7 +136,7 @@ class MainMenu:
         pygame.draw.rect(self.screen, color, rect)
         pygame.draw.rect(self.screen, TEXT_COLOR, rect, 2)
         
-        text_surface = self.font.render(text, True, TEXT_COLOR)
+        text_surface = render_text(self.font, text, TEXT_COLOR)
         text_rect = text_surface.get_rect(midleft=(rect.x + 10, rect.centery))
         self.screen.blit(text_surface, text_rect)
         
@@ -139,12 +145,12 @@ class MainMenu:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("PDK Rogue", True, TEXT_COLOR)
+        title = render_text(self.font, "PDK Rogue", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
         self.screen.blit(title, title_rect)
         
         # Subtitle
-        subtitle = self.small_font.render("A Roguelike Deckbuilder", True, TEXT_COLOR)
+        subtitle = render_text(self.small_font, "A Roguelike Deckbuilder", TEXT_COLOR)
         subtitle_rect = subtitle.get_rect(center=(WINDOW_WIDTH // 2, 140))
         self.screen.blit(subtitle, subtitle_rect)
         
@@ -168,7 +174,7 @@ class MainMenu:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Select Profile", True, TEXT_COLOR)
+        title = render_text(self.font, "Select Profile", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
@@ -205,12 +211,12 @@ class MainMenu:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Create New Profile", True, TEXT_COLOR)
+        title = render_text(self.font, "Create New Profile", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
         self.screen.blit(title, title_rect)
         
         # Instructions
-        instructions = self.small_font.render("Enter profile name:", True, TEXT_COLOR)
+        instructions = render_text(self.small_font, "Enter profile name:", TEXT_COLOR)
         instructions_rect = instructions.get_rect(center=(WINDOW_WIDTH // 2, 250))
         self.screen.blit(instructions, instructions_rect)
         
@@ -230,13 +236,13 @@ class MainMenu:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render(f"Select Region - {self.current_profile.name}", True, TEXT_COLOR)
+        title = render_text(self.font, f"Select Region - {self.current_profile.name}", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Profile stats
         stats_text = f"Runs: {self.current_profile.total_runs_completed} | Fights Won: {self.current_profile.total_fights_won}"
-        stats_surface = self.small_font.render(stats_text, True, TEXT_COLOR)
+        stats_surface = render_text(self.small_font, stats_text, TEXT_COLOR)
         self.screen.blit(stats_surface, (20, 80))
         
         # List available regions
@@ -266,13 +272,13 @@ class MainMenu:
         
         # Title
         fight_num = self.run_manager.run_state.current_fight + 1
-        title = self.font.render(f"Fight {fight_num}/{self.run_manager.run_state.total_fights}", True, TEXT_COLOR)
+        title = render_text(self.font, f"Fight {fight_num}/{self.run_manager.run_state.total_fights}", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 100))
         self.screen.blit(title, title_rect)
         
         # Current status
         lp_text = f"Life Points: {self.run_manager.run_state.life_points}"
-        lp_surface = self.font.render(lp_text, True, TEXT_COLOR)
+        lp_surface = render_text(self.font, lp_text, TEXT_COLOR)
         lp_rect = lp_surface.get_rect(center=(WINDOW_WIDTH // 2, 150))
         self.screen.blit(lp_surface, lp_rect)
         
@@ -288,12 +294,12 @@ class MainMenu:
                 enemy_info = "Enemy: Boss - Powerful with unique mechanics"
             
             if enemy_info:
-                enemy_surface = self.small_font.render(enemy_info, True, TEXT_COLOR)
+                enemy_surface = render_text(self.small_font, enemy_info, TEXT_COLOR)
                 enemy_rect = enemy_surface.get_rect(center=(WINDOW_WIDTH // 2, 175))
                 self.screen.blit(enemy_surface, enemy_rect)
         
         # Show preview hand
-        hand_label = self.small_font.render("Your hand:", True, TEXT_COLOR)
+        hand_label = render_text(self.small_font, "Your hand:", TEXT_COLOR)
         self.screen.blit(hand_label, (50, 200))
         
         if self.preview_player:
@@ -307,7 +313,7 @@ class MainMenu:
         ]
         
         for i, instruction in enumerate(instructions):
-            inst_surface = self.small_font.render(instruction, True, TEXT_COLOR)
+            inst_surface = render_text(self.small_font, instruction, TEXT_COLOR)
             inst_rect = inst_surface.get_rect(center=(WINDOW_WIDTH // 2, 320 + i * 25))
             self.screen.blit(inst_surface, inst_rect)
         
@@ -326,12 +332,12 @@ class MainMenu:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Victory Reward!", True, TEXT_COLOR)
+        title = render_text(self.font, "Victory Reward!", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Instructions
-        instruction = self.small_font.render("Choose a skill card to add to your inventory:", True, TEXT_COLOR)
+        instruction = render_text(self.small_font, "Choose a skill card to add to your inventory:", TEXT_COLOR)
         inst_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, 90))
         self.screen.blit(instruction, inst_rect)
         
@@ -339,18 +345,18 @@ class MainMenu:
         current_count = len(self.run_manager.run_state.skill_cards)
         max_count = self.run_manager.run_state.max_skill_cards
         inventory_text = f"Skill Card Inventory: {current_count}/{max_count}"
-        inv_surface = self.small_font.render(inventory_text, True, TEXT_COLOR)
+        inv_surface = render_text(self.small_font, inventory_text, TEXT_COLOR)
         self.screen.blit(inv_surface, (20, 120))
         
         # Show current inventory if any
         if current_count > 0:
-            inv_label = self.small_font.render("Current Inventory:", True, TEXT_COLOR)
+            inv_label = render_text(self.small_font, "Current Inventory:", TEXT_COLOR)
             self.screen.blit(inv_label, (20, 150))
             
             for i, card in enumerate(self.run_manager.run_state.skill_cards):
                 y_pos = 170 + i * 20
                 card_text = f"• {card.name}"
-                card_surface = self.small_font.render(card_text, True, TEXT_COLOR)
+                card_surface = render_text(self.small_font, card_text, TEXT_COLOR)
                 self.screen.blit(card_surface, (30, y_pos))
         
         # Draw reward cards as images in a horizontal layout
@@ -376,28 +382,10 @@ class MainMenu:
             hover = card_rect.collidepoint(mouse_pos)
             can_select = self.run_manager.run_state.can_add_skill_card()
             
-            # Try to load and display card image
-            card_image = load_skill_card_image(card.name)
-            if card_image:
-                # Scale image to reward card size
-                scaled_image = pygame.transform.scale(card_image, (card_width, card_height))
-                
-                # Apply effects based on state
-                if not can_select:
-                    # Gray out if inventory full
-                    overlay = pygame.Surface((card_width, card_height))
-                    overlay.fill((100, 100, 100))
-                    overlay.set_alpha(150)
-                    scaled_image = scaled_image.copy()
-                    scaled_image.blit(overlay, (0, 0))
-                elif hover:
-                    # Highlight on hover
-                    overlay = pygame.Surface((card_width, card_height))
-                    overlay.fill((255, 255, 255))
-                    overlay.set_alpha(60)
-                    scaled_image = scaled_image.copy()
-                    scaled_image.blit(overlay, (0, 0))
-                
+            # Pre-scaled image, greyed out when the inventory is full and lightened on hover
+            tint = REWARD_CARD_DISABLED_TINT if not can_select else REWARD_CARD_HOVER_TINT if hover else None
+            scaled_image = get_skill_card_surface(card.name, (card_width, card_height), tint)
+            if scaled_image:
                 self.screen.blit(scaled_image, card_rect)
                 # Show description in a hovered box only if mouse is over the card
                 if hover:
@@ -407,7 +395,7 @@ class MainMenu:
                 pygame.draw.rect(self.screen, border_color, card_rect, border_width)
                 
                 # Draw card name below the image
-                name_surface = self.small_font.render(card.name, True, TEXT_COLOR)
+                name_surface = render_text(self.small_font, card.name, TEXT_COLOR)
                 name_rect = name_surface.get_rect(centerx=card_rect.centerx, y=card_rect.bottom + 5)
                 self.screen.blit(name_surface, name_rect)
                 
@@ -416,9 +404,9 @@ class MainMenu:
                 self.draw_button(card_rect, "", hover, not can_select)
                 
                 # Draw card info as text
-                name_surface = self.font.render(card.name, True, TEXT_COLOR)
-                desc_surface = self.small_font.render(card.description, True, TEXT_COLOR)
-                rarity_surface = self.small_font.render(f"[{card.rarity.name}]", True, TEXT_COLOR)
+                name_surface = render_text(self.font, card.name, TEXT_COLOR)
+                desc_surface = render_text(self.small_font, card.description, TEXT_COLOR)
+                rarity_surface = render_text(self.small_font, f"[{card.rarity.name}]", TEXT_COLOR)
                 self.screen.blit(name_surface, (card_rect.x + 10, card_rect.y + 5))
                 self.screen.blit(desc_surface, (card_rect.x + 10, card_rect.y + 30))
                 self.screen.blit(rarity_surface, (card_rect.x + 10, card_rect.y + 50))
@@ -430,7 +418,7 @@ class MainMenu:
         # If inventory is full, show message and option to abandon cards
         if not self.run_manager.run_state.can_add_skill_card():
             full_text = "Inventory Full! Click on a current skill card to abandon it first."
-            full_surface = self.small_font.render(full_text, True, (255, 100, 100))  # Red text
+            full_surface = render_text(self.small_font, full_text, (255, 100, 100))  # Red text
             full_rect = full_surface.get_rect(center=(WINDOW_WIDTH // 2, 250))
             self.screen.blit(full_surface, full_rect)
             
@@ -451,7 +439,7 @@ class MainMenu:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Select Equipment", True, TEXT_COLOR)
+        title = render_text(self.font, "Select Equipment", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
@@ -459,22 +447,22 @@ class MainMenu:
         available_slots = self.current_profile.equipment_slots
         used_slots = sum(eq.slot for eq in self.selected_equipment)
         slots_text = f"Equipment Slots: {used_slots}/{available_slots}"
-        slots_surface = self.font.render(slots_text, True, TEXT_COLOR)
+        slots_surface = render_text(self.font, slots_text, TEXT_COLOR)
         self.screen.blit(slots_surface, (20, 90))
         
         # Instructions
-        instruction = self.small_font.render("Select equipment to bring on your run:", True, TEXT_COLOR)
+        instruction = render_text(self.small_font, "Select equipment to bring on your run:", TEXT_COLOR)
         self.screen.blit(instruction, (20, 120))
         
         # Show selected equipment
         if self.selected_equipment:
-            selected_label = self.small_font.render("Selected:", True, TEXT_COLOR)
+            selected_label = render_text(self.small_font, "Selected:", TEXT_COLOR)
             self.screen.blit(selected_label, (20, 150))
             
             for i, equipment in enumerate(self.selected_equipment):
                 y_pos = 170 + i * 20
                 eq_text = f"• {equipment.name} (Slot: {equipment.slot})"
-                eq_surface = self.small_font.render(eq_text, True, TEXT_COLOR)
+                eq_surface = render_text(self.small_font, eq_text, TEXT_COLOR)
                 self.screen.blit(eq_surface, (30, y_pos))
         
         # Available equipment
@@ -513,9 +501,9 @@ class MainMenu:
             pygame.draw.rect(self.screen, TEXT_COLOR, button_rect, 2)
             
             # Draw equipment info
-            name_surface = self.font.render(equipment.name, True, TEXT_COLOR)
-            desc_surface = self.small_font.render(equipment.description, True, TEXT_COLOR)
-            tier_surface = self.small_font.render(f"[{equipment.tier.name}] Slots: {equipment.slot}", True, TEXT_COLOR)
+            name_surface = render_text(self.font, equipment.name, TEXT_COLOR)
+            desc_surface = render_text(self.small_font, equipment.description, TEXT_COLOR)
+            tier_surface = render_text(self.small_font, f"[{equipment.tier.name}] Slots: {equipment.slot}", TEXT_COLOR)
             
             self.screen.blit(name_surface, (button_rect.x + 10, button_rect.y + 5))
             self.screen.blit(desc_surface, (button_rect.x + 10, button_rect.y + 30))
@@ -535,10 +523,10 @@ class MainMenu:
             return
             
         # Draw map using renderer
-        self.map_renderer.draw_map(self.screen, self.current_map)
+        self.map_renderer.draw_map(self.screen, self.current_map, pygame.mouse.get_pos())
         
         # Draw status info
-        status_font = pygame.font.Font(None, 24)
+        status_font = get_font(None, 24)
         
         # Draw current node info if any
         if self.current_map.current_node:
@@ -547,19 +535,19 @@ class MainMenu:
         else:
             node_info = "Select a starting node"
             
-        info_surface = status_font.render(node_info, True, TEXT_COLOR)
+        info_surface = render_text(status_font, node_info, TEXT_COLOR)
         self.screen.blit(info_surface, (20, WINDOW_HEIGHT - 100))
         
         # Draw run info
         run_info = f"Life Points: {self.run_manager.run_state.life_points}"
-        run_surface = status_font.render(run_info, True, TEXT_COLOR)
+        run_surface = render_text(status_font, run_info, TEXT_COLOR)
         self.screen.blit(run_surface, (20, WINDOW_HEIGHT - 75))
         
         # Draw available nodes info
         available_nodes = self.current_map.get_available_next_nodes()
         if available_nodes:
             avail_text = f"Available nodes: {len(available_nodes)}"
-            avail_surface = status_font.render(avail_text, True, TEXT_COLOR)
+            avail_surface = render_text(status_font, avail_text, TEXT_COLOR)
             self.screen.blit(avail_surface, (20, WINDOW_HEIGHT - 50))
         
         # Back button
@@ -568,31 +556,16 @@ class MainMenu:
         
     def create_preview_deck(self):
         """Create and deal cards for preview"""
-        # Create deck
-        deck = []
-        # Regular cards
-        for suit in [Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]:
-            for rank in ["3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K", "A", "2"]:
-                deck.append(Card(rank, suit))
-        
-        # Add Jokers
-        deck.append(Card("Black Joker", Suit.BLACK_JOKER))
-        deck.append(Card("Red Joker", Suit.RED_JOKER))
-
-        # Shuffle and deal
-        random.shuffle(deck)
-
-        # Discard first 8 cards
-        discard_pile = deck[:8]
-        deck = deck[8:]
+        # Shuffle and deal; the 8 discarded cards are not used
+        deal = deal_cards(self.run_manager.rng.deal)
 
-        # Create preview player and deal 23 cards
+        # Create preview player with the 23 player cards
         self.preview_player = FightPlayer("Player")
-        self.preview_player.hand = deck[:23]
+        self.preview_player.hand = deal.player
         self.preview_player.sort_hand()
         
-        # Store remaining deck for actual fight
-        self.preview_deck = deck
+        # Store the dealt deck for actual fight (the AI hand follows the player's 23 cards)
+        self.preview_deck = deal.player + deal.ai
         
     def start_run(self, region_name):
         """Start a new run in the selected region"""
@@ -607,7 +580,7 @@ class MainMenu:
         
         # Generate map for this run
         map_generator = MapGenerator()
-        self.current_map = map_generator.generate_region_map(region_name)
+        self.current_map = map_generator.generate_region_map(region_name, rng=self.run_manager.rng.map)
         
         # Go to map view
         self.state = "map_view"
@@ -665,7 +638,8 @@ class MainMenu:
             enemy_type=enemy_type,
             run_manager=self.run_manager,
             preview_player=self.preview_player,
-            preview_deck=self.preview_deck
+            preview_deck=self.preview_deck,
+            rng=self.run_manager.fight_rng()
         )
         result = combat_game.run()
         
@@ -695,7 +669,7 @@ class MainMenu:
         """Show reward selection after winning a fight"""
         # Generate 3 random skill cards
         current_cards = self.run_manager.run_state.get_skill_card_names()
-        self.reward_cards = get_random_skill_cards(3, exclude=current_cards)
+        self.reward_cards = get_random_skill_cards(3, exclude=current_cards, rng=self.run_manager.rng.rewards)
         
         # Go to reward selection screen
         self.state = "reward_select"
@@ -799,7 +773,7 @@ class MainMenu:
                             self.state = "pre_fight"
                         elif clicked_node.node_type == NodeType.EXCHANGE:
                             # Enter exchange node
-                            self.exchange_node = ExchangeNode()
+                            self.exchange_node = ExchangeNode(rng=self.run_manager.rng.rewards)
                             self.selected_exchange_items = []
                             self.exchange_type = None  # "cards" or "items"
                             self.state = "exchange"
@@ -885,6 +859,7 @@ class MainMenu:
         """Main menu loop"""
         running = True
         while running:
+            self.profiler.begin_frame()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     pygame.quit()
@@ -893,10 +868,14 @@ class MainMenu:
                     if event.button == 1:  # Left click
                         self.handle_click(event.pos)
                 elif event.type == pygame.KEYDOWN:
-                    self.handle_keydown(event)
+                    if not self.profiler.handle_key(event):
+                        self.handle_keydown(event)
                         
             self.draw()
+            if self.profiler.enabled:
+                self.profiler.draw_overlay(self.screen)
             pygame.display.flip()
+            self.profiler.end_frame()
             self.clock.tick(FPS)
     
     def draw_exchange(self):
@@ -904,13 +883,13 @@ class MainMenu:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Exchange Node", True, TEXT_COLOR)
+        title = render_text(self.font, "Exchange Node", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Description
         desc_text = "Trade 2 cards for 1 rare card, or 2 items for 1 rare item"
-        desc_surface = self.small_font.render(desc_text, True, TEXT_COLOR)
+        desc_surface = render_text(self.small_font, desc_text, TEXT_COLOR)
         desc_rect = desc_surface.get_rect(center=(WINDOW_WIDTH // 2, 80))
         self.screen.blit(desc_surface, desc_rect)
         
@@ -925,7 +904,7 @@ class MainMenu:
         
         if can_exchange_cards:
             # Skill Cards Exchange Section
-            section_title = self.font.render("Exchange Skill Cards (Select 2):", True, TEXT_COLOR)
+            section_title = render_text(self.font, "Exchange Skill Cards (Select 2):", TEXT_COLOR)
             self.screen.blit(section_title, (50, y_pos))
             y_pos += 40
             
@@ -947,7 +926,7 @@ class MainMenu:
                 pygame.draw.rect(self.screen, TEXT_COLOR, card_rect, 2)
                 
                 # Draw card name
-                text = self.small_font.render(card_name, True, TEXT_COLOR)
+                text = render_text(self.small_font, card_name, TEXT_COLOR)
                 text_rect = text.get_rect(midleft=(card_rect.x + 10, card_rect.centery))
                 self.screen.blit(text, text_rect)
                 
@@ -968,7 +947,7 @@ class MainMenu:
         
         if can_exchange_items:
             # Items Exchange Section
-            section_title = self.font.render("Exchange Items (Select 2):", True, TEXT_COLOR)
+            section_title = render_text(self.font, "Exchange Items (Select 2):", TEXT_COLOR)
             self.screen.blit(section_title, (50, y_pos))
             y_pos += 40
             
@@ -990,7 +969,7 @@ class MainMenu:
                 pygame.draw.rect(self.screen, TEXT_COLOR, item_rect, 2)
                 
                 # Draw item name
-                text = self.small_font.render(item_name, True, TEXT_COLOR)
+                text = render_text(self.small_font, item_name, TEXT_COLOR)
                 text_rect = text.get_rect(midleft=(item_rect.x + 10, item_rect.centery))
                 self.screen.blit(text, text_rect)
                 
@@ -1012,7 +991,7 @@ class MainMenu:
         if not can_exchange_cards and not can_exchange_items:
             # No exchange options available
             no_exchange_text = "No exchange options available (need 2+ cards/items and rare options must exist)"
-            no_exchange_surface = self.small_font.render(no_exchange_text, True, TEXT_COLOR)
+            no_exchange_surface = render_text(self.small_font, no_exchange_text, TEXT_COLOR)
             no_exchange_rect = no_exchange_surface.get_rect(center=(WINDOW_WIDTH // 2, 200))
             self.screen.blit(no_exchange_surface, no_exchange_rect)
         
@@ -222,21 +222,56 @@ fn evaluate_move_with_hand(combo: &Combo, last_combo: Option<&Combo>, hand: &[Ca
 }
 use serde::{Serialize, Deserialize};
 
-#[pyfunction]
-fn minimax_search_py(
+// Counters shared by all threads of one search
+#[derive(Default)]
+struct SearchCounters {
+    nodes: AtomicU64,
+    max_ply: AtomicUsize,
+    expanded: AtomicU64,
+    children: AtomicU64,
+}
+
+impl SearchCounters {
+    fn visit(&self, ply: usize) {
+        self.nodes.fetch_add(1, Ordering::Relaxed);
+        self.max_ply.fetch_max(ply, Ordering::Relaxed);
+    }
+
+    fn expand(&self, branching: usize) {
+        self.expanded.fetch_add(1, Ordering::Relaxed);
+        self.children.fetch_add(branching as u64, Ordering::Relaxed);
+    }
+}
+
+#[derive(Serialize)]
+struct SearchStatsOut {
+    nodes: u64,
+    max_depth: usize,
+    root_branching: usize,
+    avg_branching: f64,
+    tt_probes: u64,
+    tt_hits: u64,
+}
+
+fn parse_json<T: serde::de::DeserializeOwned>(text: &PyString) -> PyResult<T> {
+    serde_json::from_str(text.to_str()?).map_err(|e| PyValueError::new_err(e.to_string()))
+}
+
+fn run_search(
     ai_hand_json: &PyString,
     last_combo_json: &PyString,
     player_hand_json: &PyString,
     ai_hp: i32,
     player_hp: i32,
-    depth: usize
-) -> PyResult<String> {
-    let ai_hand: Vec<Card> = serde_json::from_str(ai_hand_json.to_str()?).unwrap();
-    let player_hand: Vec<Card> = serde_json::from_str(player_hand_json.to_str()?).unwrap();
+    depth: usize,
+) -> PyResult<(Option<Combo>, SearchStatsOut)> {
+    let ai_hand: Vec<Card> = parse_json(ai_hand_json)?;
+    let player_hand: Vec<Card> = parse_json(player_hand_json)?;
     let last_combo: Option<Combo> = match serde_json::from_str::<Combo>(last_combo_json.to_str()?) {
         Ok(combo) => Some(combo),
         Err(_) => None,
     };
+    let counters = SearchCounters::default();
     let (best_combo, _score) = minimax_search(
         &ai_hand,
         &player_hand,
@@ -247,7 +282,40 @@ fn minimax_search_py(
         true,
         i32::MIN + 1,
         i32::MAX - 1,
+        0,
+        &counters,
     );
+    let mut root_branching = find_opponent_valid_plays(&ai_hand, last_combo.as_ref()).len();
+    if last_combo.is_some() {
+        root_branching += 1; // PASS
+    }
+    let expanded = counters.expanded.load(Ordering::Relaxed);
+    let stats = SearchStatsOut {
+        nodes: counters.nodes.load(Ordering::Relaxed),
+        max_depth: counters.max_ply.load(Ordering::Relaxed),
+        root_branching,
+        avg_branching: if expanded > 0 {
+            counters.children.load(Ordering::Relaxed) as f64 / expanded as f64
+        } else {
+            0.0
+        },
+        // No transposition table in this engine yet
+        tt_probes: 0,
+        tt_hits: 0,
+    };
+    Ok((best_combo, stats))
+}
+
+#[pyfunction]
+fn minimax_search_py(
+    ai_hand_json: &PyString,
+    last_combo_json: &PyString,
+    player_hand_json: &PyString,
+    ai_hp: i32,
+    player_hp: i32,
+    depth: usize
+) -> PyResult<String> {
+    let (best_combo, _stats) = run_search(ai_hand_json, last_combo_json, player_hand_json, ai_hp, player_hp, depth)?;
     let result = match best_combo {
         Some(combo) => serde_json::to_string(&combo).unwrap(),
         None => "null".to_string(),
@@ -255,6 +323,24 @@ fn minimax_search_py(
     Ok(result)
 }
 
+// Same search, returning {"combo": ..., "stats": {...}} for instrumentation
+#[pyfunction]
+fn minimax_search_stats_py(
+    ai_hand_json: &PyString,
+    last_combo_json: &PyString,
+    player_hand_json: &PyString,
+    ai_hp: i32,
+    player_hp: i32,
+    depth: usize
+) -> PyResult<String> {
+    let (best_combo, stats) = run_search(ai_hand_json, last_combo_json, player_hand_json, ai_hp, player_hp, depth)?;
+    let result = serde_json::json!({
+        "combo": best_combo,
+        "stats": stats,
+    });
+    Ok(result.to_string())
+}
+
 fn minimax_search(
     ai_hand: &[Card],
     player_hand: &[Card],
@@ -265,7 +351,10 @@ fn minimax_search(
     is_maximizing: bool,
     mut alpha: i32,
     mut beta: i32,
+    ply: usize,
+    counters: &SearchCounters,
 ) -> (Option<Combo>, i32) {
+    counters.visit(ply);
     // Terminal or depth limit
     if depth == 0 || ai_hand.is_empty() || player_hand.is_empty() || ai_hp <= 0 || player_hp <= 0 {
         let eval = evaluate_position_with_hand(ai_hand) - evaluate_position_with_hand(player_hand);
@@ -276,6 +365,7 @@ fn minimax_search(
         if last_combo.is_some() {
             valid_plays.push(Combo { cards: vec![], combo_type: "PASS".to_string(), lead_value: 0 });
         }
+        counters.expand(valid_plays.len());
         let results: Vec<(Combo, i32)> = valid_plays.par_iter().map(|play| {
             let mut new_ai = ai_hand.to_vec();
             let mut new_ai_hp = ai_hp;
@@ -306,6 +396,8 @@ fn minimax_search(
                     false,
                     alpha,
                     beta,
+                    ply + 1,
+                    counters,
                 );
                 eval = eval.max(opp_eval);
             }
@@ -325,6 +417,7 @@ fn minimax_search(
         if last_combo.is_some() {
             valid_plays.push(Combo { cards: vec![], combo_type: "PASS".to_string(), lead_value: 0 });
         }
+        counters.expand(valid_plays.len());
         for play in valid_plays {
             let mut new_player = player_hand.to_vec();
             let mut new_player_hp = player_hp;
@@ -354,6 +447,8 @@ fn minimax_search(
                     true,
                     alpha,
                     beta,
+                    ply + 1,
+                    counters,
                 );
                 eval = eval.min(ai_eval);
             }
@@ -370,12 +465,14 @@ fn minimax_search(
     }
 }
 
+use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
 use pyo3::types::PyString;
 use rand::seq::SliceRandom;
 use rayon::prelude::*;
 
 use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, AtomicUsize, Ordering};
 
 #[derive(Clone, Debug, PartialEq, Eq, Hash, Serialize, serde::Deserialize)]
 pub struct Card {
@@ -604,5 +701,6 @@ pub fn find_opponent_valid_plays(hand: &[Card], last_combo: Option<&Combo>) -> V
 #[pymodule]
 fn mcts_rust(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(minimax_search_py, m)?)?;
+    m.add_function(wrap_pyfunction!(minimax_search_stats_py, m)?)?;
     Ok(())
 }
@@ -0,0 +1,42 @@
+"""
+Group-by queries over a columnar fight store written by simulate_fights.py --store.
+
+    python query_fights.py fights_store --by enemy loadout
+    python query_fights.py fights_store --by loadout --enemy "Combo Bane" "Shadow Lord"
+"""
+
+import argparse
+import time
+
+from lib.analytics import group_by, CATEGORICAL
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query simulated fight results")
+    parser.add_argument("store", help="Store directory")
+    parser.add_argument("--by", nargs="+", default=["enemy"], choices=list(CATEGORICAL))
+    parser.add_argument("--enemy", nargs="*", help="Only these enemies")
+    parser.add_argument("--loadout", nargs="*", help="Only these loadouts")
+    args = parser.parse_args()
+
+    where = {}
+    if args.enemy:
+        where["enemy"] = args.enemy
+    if args.loadout:
+        where["loadout"] = args.loadout
+
+    start = time.perf_counter()
+    rows = group_by(args.store, args.by, where)
+    elapsed = time.perf_counter() - start
+
+    header = [key for key in args.by] + ["fights", "win rate", "HP lost", "turns"]
+    print("\t".join(header))
+    for row in rows:
+        print("\t".join([str(row[key]) or "-" for key in args.by] +
+                        [str(row["fights"]), f"{row['win_rate']:.1%}", f"{row['avg_hp_lost']:.2f}",
+                         f"{row['avg_turns']:.1f}"]))
+    print(f"{sum(row['fights'] for row in rows)} fights in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Round-robin tournament between player policies and enemy templates, with
+Bradley-Terry ratings on the Elo scale. Streams one JSON line per batch.
+
+    python run_tournament.py --workers 4 --output batches.jsonl
+    python run_tournament.py --entrants policy:smallest policy:search "enemy:Goblin Scout" "enemy:Shadow Lord"
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from lib.fight_sim import SEARCH_NODES
+from lib.player import AI_SEARCH_NODES
+from lib.tournament import TournamentConfig, default_entrants, parse_entrant, run_tournament, bradley_terry, tier_ratings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rate policies and enemy templates against each other")
+    parser.add_argument("--entrants", nargs="+", default=default_entrants(),
+                        help="policy:<player policy> or enemy:<enemy name> (default: all enemies and a few policies)")
+    parser.add_argument("--player-hp", type=int, default=5)
+    parser.add_argument("--min-fights", type=int, default=20, help="Fights before a pairing may stop")
+    parser.add_argument("--max-fights", type=int, default=200, help="Fights per pairing at most")
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--margin", type=float, default=0.1, help="Stop once a win rate is known to within this")
+    parser.add_argument("--search-budget-ms", type=float, default=20, help="Budget of the search policy")
+    parser.add_argument("--enemy-budget-ms", type=float, default=None, help="Budget of searching enemies")
+    parser.add_argument("--search-nodes", type=int, default=SEARCH_NODES,
+                        help="Node budget of the search policy, reproducible (0: use --search-budget-ms)")
+    parser.add_argument("--enemy-nodes", type=int, default=AI_SEARCH_NODES,
+                        help="Node budget of searching enemies, reproducible (0: use --enemy-budget-ms)")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON lines here instead of stdout")
+    args = parser.parse_args()
+
+    for entrant in args.entrants:
+        try:
+            parse_entrant(entrant)
+        except ValueError as e:
+            parser.error(str(e))
+
+    config = TournamentConfig(entrants=args.entrants, player_hp=args.player_hp, search_budget_ms=args.search_budget_ms,
+                              enemy_search_budget_ms=args.enemy_budget_ms, search_nodes=args.search_nodes,
+                              enemy_search_nodes=args.enemy_nodes, batch_size=args.batch_size,
+                              min_fights=args.min_fights, max_fights=args.max_fights, margin=args.margin)
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    records = {}
+    start = time.perf_counter()
+    try:
+        for pairing, scores, record in run_tournament(config, args.workers, args.seed):
+            records[pairing] = record
+            out.write(json.dumps({"pairing": list(pairing), "scores": scores, "fights": record.fights,
+                                  "score": record.score, "settled": record.settled(config)}) + "\n")
+            out.flush()
+    finally:
+        if args.output:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    fights = sum(record.fights for record in records.values())
+    print(f"{fights} fights over {len(records)} pairings in {elapsed:.1f}s", file=sys.stderr)
+    ratings = bradley_terry(records)
+    for name, entry in sorted(ratings.items(), key=lambda item: -item[1]["rating"]):
+        print(f"  {entry['rating']:7.0f}  [{entry['low']:.0f}, {entry['high']:.0f}]  {name} ({entry['fights']} fights)",
+              file=sys.stderr)
+    tiers = tier_ratings(ratings)
+    if tiers:
+        print("Tiers: " + ", ".join(f"{tier} {rating:.0f}" for tier, rating in tiers.items()), file=sys.stderr)
+        ordered = [tiers[tier] for tier in ("regular", "elite", "boss") if tier in tiers]
+        if ordered != sorted(ordered):
+            print("Warning: tier ratings are not in regular < elite < boss order", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Run many fights without the GUI and stream one JSON line per fight.
+
+    python simulate_fights.py --fights 1000 --enemy "Orc Warrior" --policy search \
+        --skill-cards "Time Warp" --equipment "Sturdy Boots" --workers 8 --output fights.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from lib.analytics import ShardWriter
+from lib.fight_sim import FightConfig, simulate_fights, summarize, player_policy_names, SEARCH_NODES
+from lib.player import AI_SEARCH_NODES
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch fight simulator")
+    parser.add_argument("--fights", type=int, default=100)
+    parser.add_argument("--policy", default="smallest", choices=player_policy_names(), help="Player policy")
+    parser.add_argument("--enemy", help="Enemy name (default: random enemy of --enemy-type)")
+    parser.add_argument("--enemy-type", default="regular", choices=["regular", "elite", "boss"])
+    parser.add_argument("--skill-cards", nargs="*", default=[])
+    parser.add_argument("--items", nargs="*", default=[])
+    parser.add_argument("--equipment", nargs="*", default=[])
+    parser.add_argument("--player-hp", type=int, default=5)
+    parser.add_argument("--no-loadout-use", action="store_true", help="Never use skill cards or items")
+    parser.add_argument("--search-nodes", type=int, default=SEARCH_NODES,
+                        help="Node budget of the search player policy, reproducible (0: use --search-budget-ms)")
+    parser.add_argument("--enemy-nodes", type=int, default=AI_SEARCH_NODES,
+                        help="Node budget of searching enemies, reproducible (0: use --enemy-budget-ms)")
+    parser.add_argument("--search-budget-ms", type=float, default=20,
+                        help="Wall-clock budget of the search player policy with --search-nodes 0")
+    parser.add_argument("--enemy-budget-ms", type=float, default=None,
+                        help="Wall-clock budget of searching enemies with --enemy-nodes 0")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON lines here instead of stdout")
+    parser.add_argument("--log-dir", help="Also write binary replay logs of every fight here")
+    parser.add_argument("--store", help="Also append results to this columnar store (see query_fights.py)")
+    args = parser.parse_args()
+
+    config = FightConfig(policy=args.policy, enemy_name=args.enemy, enemy_type=args.enemy_type,
+                         skill_cards=args.skill_cards, items=args.items, equipment=args.equipment,
+                         player_hp=args.player_hp, use_loadout=not args.no_loadout_use,
+                         search_nodes=args.search_nodes, enemy_search_nodes=args.enemy_nodes,
+                         search_budget_ms=args.search_budget_ms, enemy_search_budget_ms=args.enemy_budget_ms,
+                         log_dir=args.log_dir)
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    store = ShardWriter(args.store) if args.store else None
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in simulate_fights(config, args.fights, args.workers, args.seed):
+            results.append(result)
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            if store:
+                store.append(result)
+    finally:
+        if args.output:
+            out.close()
+        if store:
+            store.close()
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(results)
+    print(f"{summary['fights']} fights in {elapsed:.1f}s ({summary['fights'] / elapsed:.1f} fights/sec)", file=sys.stderr)
+    if results:
+        print(f"Win rate {summary['win_rate']:.1%}, avg player HP {summary['avg_player_hp']:.2f}, "
+              f"avg enemy HP {summary['avg_enemy_hp']:.2f}", file=sys.stderr)
+        for name, entry in sorted(summary["enemies"].items()):
+            print(f"  {name}: {entry['wins']}/{entry['fights']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
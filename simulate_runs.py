@@ -0,0 +1,79 @@
+"""
+Play many whole runs without the GUI and stream one JSON line per run.
+
+    python simulate_runs.py --runs 2000 --path-policy safe --reward-policy rarity \
+        --exchange-policy when_full --equipment "Sturdy Boots" --workers 8 --output runs.jsonl
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from lib.fight_sim import player_policy_names, SEARCH_NODES
+from lib.player import AI_SEARCH_NODES
+from lib.run_sim import (RunConfig, simulate_runs, summarize_runs,
+                         PATH_POLICIES, REWARD_POLICIES, EXCHANGE_POLICIES)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte Carlo run simulator")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--region", default="Tutorial")
+    parser.add_argument("--fight-policy", default="smallest", choices=player_policy_names())
+    parser.add_argument("--path-policy", default="random", choices=list(PATH_POLICIES))
+    parser.add_argument("--reward-policy", default="rarity", choices=list(REWARD_POLICIES))
+    parser.add_argument("--exchange-policy", default="never", choices=list(EXCHANGE_POLICIES))
+    parser.add_argument("--skill-cards", nargs="*", default=[], help="Starting skill card inventory")
+    parser.add_argument("--items", nargs="*", default=[])
+    parser.add_argument("--equipment", nargs="*", default=[])
+    parser.add_argument("--equipment-slots", type=int, default=1)
+    parser.add_argument("--fight-hp", type=int, default=5)
+    parser.add_argument("--give-up-elites", action="store_true", help="Pay 1 LP instead of fighting elites")
+    parser.add_argument("--search-budget-ms", type=float, default=20, help="Budget of the search fight policy")
+    parser.add_argument("--enemy-budget-ms", type=float, default=None, help="Budget of searching enemies")
+    parser.add_argument("--search-nodes", type=int, default=SEARCH_NODES,
+                        help="Node budget of the search policy, reproducible (0: use --search-budget-ms)")
+    parser.add_argument("--enemy-nodes", type=int, default=AI_SEARCH_NODES,
+                        help="Node budget of searching enemies, reproducible (0: use --enemy-budget-ms)")
+    parser.add_argument("--workers", type=int, default=None, help="Processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write JSON lines here instead of stdout")
+    args = parser.parse_args()
+
+    config = RunConfig(region=args.region, fight_policy=args.fight_policy, path_policy=args.path_policy,
+                       reward_policy=args.reward_policy, exchange_policy=args.exchange_policy,
+                       skill_cards=args.skill_cards, items=args.items, equipment=args.equipment,
+                       equipment_slots=args.equipment_slots, fight_hp=args.fight_hp,
+                       give_up_elites=args.give_up_elites, search_budget_ms=args.search_budget_ms,
+                       enemy_search_budget_ms=args.enemy_budget_ms, search_nodes=args.search_nodes,
+                       enemy_search_nodes=args.enemy_nodes)
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    results = []
+    start = time.perf_counter()
+    try:
+        for result in simulate_runs(config, args.runs, args.workers, args.seed):
+            results.append(result)
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if args.output:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    summary = summarize_runs(results)
+    print(f"{summary['runs']} runs in {elapsed:.1f}s ({summary['runs'] / elapsed:.1f} runs/sec)", file=sys.stderr)
+    if results:
+        print(f"Completion rate {summary['completion_rate']:.1%}, avg fights won {summary['avg_fights_won']:.2f}",
+              file=sys.stderr)
+        print("Outcomes: " + ", ".join(f"{k}={v}" for k, v in sorted(summary["outcomes"].items())), file=sys.stderr)
+        print("Mean LP by node: " + " ".join(f"{lp:.1f}" for lp in summary["life_curve"]), file=sys.stderr)
+        for name, count in sorted(summary["rewards"].items(), key=lambda kv: -kv[1]):
+            print(f"  reward {name}: {count}", file=sys.stderr)
+        for name, count in sorted(summary["exchanges"].items(), key=lambda kv: -kv[1]):
+            print(f"  exchanged for {name}: {count}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import pygame
 import sys
 from lib.constants import *
+from lib.text_cache import render_text, get_font
 from lib.enhanced_game import EnhancedFightGame
 from lib.skill_cards import get_all_skill_cards, SKILL_CARDS
 from lib.items import get_all_items, ITEMS
@@ -12,8 +13,8 @@ class TestFightConfig:
     def __init__(self, screen):
         self.screen = screen
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        self.font = get_font(None, 24)
+        self.small_font = get_font(None, 18)
         
         # Configuration state
         self.selected_skill_cards = []
@@ -51,7 +52,7 @@ class TestFightConfig:
         pygame.draw.rect(self.screen, color, rect)
         pygame.draw.rect(self.screen, TEXT_COLOR, rect, 2)
         
-        text_surface = self.font.render(text, True, TEXT_COLOR if not disabled else (150, 150, 150))
+        text_surface = render_text(self.font, text, TEXT_COLOR if not disabled else (150, 150, 150))
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
         
@@ -64,7 +65,7 @@ class TestFightConfig:
         pygame.draw.rect(self.screen, color, rect)
         pygame.draw.rect(self.screen, TEXT_COLOR, rect, 2)
         
-        text_surface = self.small_font.render(text, True, TEXT_COLOR)
+        text_surface = render_text(self.small_font, text, TEXT_COLOR)
         text_rect = text_surface.get_rect(midleft=(rect.x + 10, rect.centery))
         self.screen.blit(text_surface, text_rect)
         
@@ -73,7 +74,7 @@ class TestFightConfig:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Test Fight Configuration", True, TEXT_COLOR)
+        title = render_text(self.font, "Test Fight Configuration", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
@@ -91,7 +92,7 @@ class TestFightConfig:
         ]
         
         for item in summary_items:
-            text = self.font.render(item, True, TEXT_COLOR)
+            text = render_text(self.font, item, TEXT_COLOR)
             self.screen.blit(text, (50, y_pos))
             y_pos += 30
         
@@ -143,12 +144,12 @@ class TestFightConfig:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Select Skill Cards (Max 5)", True, TEXT_COLOR)
+        title = render_text(self.font, "Select Skill Cards (Max 5)", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 30))
         self.screen.blit(title, title_rect)
         
         # Selected count
-        count_text = self.font.render(f"Selected: {len(self.selected_skill_cards)}/5", True, TEXT_COLOR)
+        count_text = render_text(self.font, f"Selected: {len(self.selected_skill_cards)}/5", TEXT_COLOR)
         self.screen.blit(count_text, (50, 60))
         
         # List skill cards
@@ -175,12 +176,12 @@ class TestFightConfig:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Select Items (Max 5)", True, TEXT_COLOR)
+        title = render_text(self.font, "Select Items (Max 5)", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 30))
         self.screen.blit(title, title_rect)
         
         # Selected count
-        count_text = self.font.render(f"Selected: {len(self.selected_items)}/5", True, TEXT_COLOR)
+        count_text = render_text(self.font, f"Selected: {len(self.selected_items)}/5", TEXT_COLOR)
         self.screen.blit(count_text, (50, 60))
         
         # List items
@@ -207,12 +208,12 @@ class TestFightConfig:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Select Equipment", True, TEXT_COLOR)
+        title = render_text(self.font, "Select Equipment", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 30))
         self.screen.blit(title, title_rect)
         
         # Selected count
-        count_text = self.font.render(f"Selected: {len(self.selected_equipment)}", True, TEXT_COLOR)
+        count_text = render_text(self.font, f"Selected: {len(self.selected_equipment)}", TEXT_COLOR)
         self.screen.blit(count_text, (50, 60))
         
         # List equipment
@@ -239,7 +240,7 @@ class TestFightConfig:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Configure Stats", True, TEXT_COLOR)
+        title = render_text(self.font, "Configure Stats", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 30))
         self.screen.blit(title, title_rect)
         
@@ -247,7 +248,7 @@ class TestFightConfig:
         y_pos = 100
         
         # Player HP
-        player_hp_text = self.font.render(f"Player Starting HP: {self.player_starting_hp}", True, TEXT_COLOR)
+        player_hp_text = render_text(self.font, f"Player Starting HP: {self.player_starting_hp}", TEXT_COLOR)
         self.screen.blit(player_hp_text, (50, y_pos))
         
         # HP adjustment buttons
@@ -265,7 +266,7 @@ class TestFightConfig:
         y_pos += 50
         
         # AI HP
-        ai_hp_text = self.font.render(f"AI Starting HP: {self.ai_starting_hp}", True, TEXT_COLOR)
+        ai_hp_text = render_text(self.font, f"AI Starting HP: {self.ai_starting_hp}", TEXT_COLOR)
         self.screen.blit(ai_hp_text, (50, y_pos))
         
         # AI HP buttons
@@ -528,7 +529,7 @@ class TestFightConfig:
         self.screen.fill(BG_COLOR)
         
         # Title
-        title = self.font.render("Select Enemy Type", True, TEXT_COLOR)
+        title = render_text(self.font, "Select Enemy Type", TEXT_COLOR)
         title_rect = title.get_rect(center=(WINDOW_WIDTH // 2, 30))
         self.screen.blit(title, title_rect)
         
@@ -536,7 +537,7 @@ class TestFightConfig:
         current_text = f"Current: {self.enemy_type.value.title()}"
         if self.enemy_name:
             current_text += f" - {self.enemy_name}"
-        current_surface = self.font.render(current_text, True, TEXT_COLOR)
+        current_surface = render_text(self.font, current_text, TEXT_COLOR)
         self.screen.blit(current_surface, (50, 80))
         
         # Enemy type buttons
@@ -0,0 +1,69 @@
+"""
+Distill the search into the fast policy used by regular enemies.
+Records search-vs-search decisions, trains the category policy and writes
+models/fast_policy.npz, which regular enemies pick up automatically.
+
+    python train_fast_policy.py --fights 300 --budget-ms 50
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from lib.features import features_from_rows
+from lib.policy_net import FastPolicy, record_search_decisions, DEFAULT_POLICY_PATH
+from lib.selfplay import HeadlessFight
+from lib.policies import EnemyPolicy, SearchPolicy
+from lib.rng import RngContext
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the distilled fast policy for regular enemies")
+    parser.add_argument("--fights", type=int, default=300, help="Search-vs-search fights to record")
+    parser.add_argument("--budget-ms", type=float, default=50, help="Search budget per recorded decision")
+    parser.add_argument("--data", help="Existing .npz with rows/labels to train on")
+    parser.add_argument("--save-data", help="Write the recorded decisions to this .npz path")
+    parser.add_argument("--epochs", type=int, default=30)
+    parser.add_argument("--hidden", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_POLICY_PATH)
+    parser.add_argument("--eval-fights", type=int, default=50, help="Policy-vs-search fights to report (0 to skip)")
+    args = parser.parse_args()
+
+    if args.data:
+        data = np.load(args.data)
+        rows, labels = data["rows"], data["labels"]
+    else:
+        start = time.perf_counter()
+        rows, labels = record_search_decisions(args.fights, budget_ms=args.budget_ms, seed=args.seed, progress=True)
+        print(f"Recorded {len(rows)} decisions in {time.perf_counter() - start:.1f}s")
+        if args.save_data:
+            np.savez_compressed(args.save_data, rows=rows, labels=labels)
+
+    policy = FastPolicy(args.hidden, seed=args.seed)
+    policy.train(features_from_rows(rows), labels, epochs=args.epochs, seed=args.seed)
+    policy.save(args.output)
+    print(f"Saved policy to {args.output}")
+
+    if args.eval_fights:
+        # The distilled policy plays the Goblin Scout's seat against the search
+        student = EnemyPolicy("Goblin Scout")
+        student.enemy.policy = policy
+        teacher = SearchPolicy(budget_ms=args.budget_ms)
+        eval_rng = RngContext(args.seed + 1)
+        wins, decisions, elapsed = 0, 0, 0.0
+        for i in range(args.eval_fights):
+            fight = HeadlessFight((student, teacher) if i % 2 == 0 else (teacher, student),
+                                  rng=eval_rng.spawn(i), record=False)
+            start = time.perf_counter()
+            winner = fight.play()
+            elapsed += time.perf_counter() - start
+            decisions += fight.decisions
+            wins += winner == i % 2
+        print(f"Policy won {wins}/{args.eval_fights} fights against the search "
+              f"({elapsed / max(1, decisions) * 1000:.2f} ms per decision, both sides)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Generate self-play data and train the NumPy value network used as the search's
+leaf evaluator. Weights are written to models/value_net.npz by default.
+
+    python train_value_net.py --fights 2000 --epochs 20
+"""
+
+import argparse
+import time
+
+from lib.selfplay import generate, save_dataset, load_dataset, sample_positions
+from lib.features import features_from_rows
+from lib.value_net import ValueNet, ValueNetEvaluator, DEFAULT_WEIGHTS_PATH, MAX_NODES_SLOWDOWN, benchmark_nodes_per_sec
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the search value network from self-play")
+    parser.add_argument("--fights", type=int, default=1000, help="Self-play fights to generate")
+    parser.add_argument("--data", help="Existing .npz dataset to train on instead of generating one")
+    parser.add_argument("--save-data", help="Write the generated dataset to this .npz path")
+    parser.add_argument("--epochs", type=int, default=20)
+    parser.add_argument("--hidden", type=int, nargs="+", default=[64, 32], help="Hidden layer sizes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=DEFAULT_WEIGHTS_PATH)
+    parser.add_argument("--bench-positions", type=int, default=20, help="Positions for the nodes/sec check (0 to skip)")
+    args = parser.parse_args()
+
+    if args.data:
+        rows, outcomes = load_dataset(args.data)
+    else:
+        start = time.perf_counter()
+        rows, outcomes = generate(args.fights, seed=args.seed, progress=True)
+        print(f"Generated {len(rows)} positions from {args.fights} fights in {time.perf_counter() - start:.1f}s")
+        if args.save_data:
+            save_dataset(args.save_data, rows, outcomes)
+
+    net = ValueNet(args.hidden, seed=args.seed)
+    net.train(features_from_rows(rows), outcomes, epochs=args.epochs, seed=args.seed)
+    net.save(args.output)
+    print(f"Saved weights to {args.output}")
+
+    if args.bench_positions:
+        positions = sample_positions(args.bench_positions, seed=args.seed)
+        result = benchmark_nodes_per_sec(ValueNetEvaluator(net), positions)
+        status = "OK" if result["within_budget"] else "TOO SLOW"
+        print(f"Nodes/sec: heuristic {result['heuristic_nodes_per_sec']:.0f}, "
+              f"value net {result['evaluator_nodes_per_sec']:.0f}, "
+              f"slowdown {result['slowdown']:.2f}x (limit {MAX_NODES_SLOWDOWN:.1f}x) {status}")
+
+
+if __name__ == "__main__":
+    main()